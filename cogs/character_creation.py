@@ -6,6 +6,7 @@ from dataclasses import dataclass, field
 import logging
 from pathlib import Path
 import random
+import sys
 from typing import Dict, Mapping, Optional, Sequence
 
 import discord
@@ -97,7 +98,7 @@ class CreationState:
         key = class_key.lower()
         if key not in AVAILABLE_CLASSES:
             raise CreationStateError("Unknown class selection")
-        self.class_key = key
+        self.class_key = sys.intern(key)
         self.class_skill_choices = tuple()
         self.equipment_choices = {}
 
@@ -3,21 +3,30 @@
 from __future__ import annotations
 
 import asyncio
+import contextvars
 import copy
 import logging
 import random
 import re
 import secrets
-from collections import Counter, deque
+import sys
+from bisect import bisect_right
+from collections import Counter, OrderedDict, deque
 from dataclasses import dataclass, field, replace
+from enum import IntEnum, IntFlag
+from functools import lru_cache, partial
 from datetime import datetime, timezone
 from io import BytesIO
+from operator import attrgetter, itemgetter
 from pathlib import Path
+from types import MappingProxyType
 from typing import (
-    Awaitable,
     Callable,
+    Deque,
     Dict,
+    FrozenSet,
     Iterable,
+    Iterator,
     List,
     Literal,
     Mapping,
@@ -26,6 +35,7 @@ from typing import (
     Sequence,
     Set,
     Tuple,
+    TypeVar,
 )
 
 import discord
@@ -34,12 +44,13 @@ from discord.ext import commands
 
 from dnd.combat import (
     Attack,
+    AttackRollResult,
     DamagePacket,
     SavingThrowResult,
     ability_modifier,
     apply_damage,
     attack_roll,
-    resolve_attack,
+    resolve_advantage_state,
     resolve_multiattack,
     saving_throw,
 )
@@ -61,9 +72,9 @@ from dnd.dungeon.state import DungeonMetadataStore, StoredDungeon
 from dnd.dungeon.rewards import (
     RewardShare,
     allocate_loot,
-    eligible_order,
+    eligible_order_cached,
     format_item_label,
-    split_gold,
+    split_gold_cached,
     trap_reward_value,
 )
 from dnd.sessions import SessionKey, SessionManager
@@ -71,6 +82,8 @@ from dnd.sessions import SessionKey, SessionManager
 
 log = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
 
 DEFAULT_PLAYER_HP = 20
 DEFAULT_PLAYER_ARMOR_CLASS = 13
@@ -78,10 +91,14 @@ DEFAULT_PLAYER_ATTACK_BONUS = 5
 DEFAULT_PLAYER_DAMAGE = "1d8+3"
 PROFICIENCY_BONUS = 2
 MONSTER_THINKING_DELAY_RANGE = (5, 10)
+# Upper bound on cached party character lookups kept by the dungeon cog.
+PARTY_CHARACTER_CACHE_SIZE = 256
+# Window in which rapid interaction refreshes collapse into a single message edit.
+REFRESH_DEBOUNCE_SECONDS = 0.05
 MONSTER_ACTION_PAUSE_RANGE = (3, 5)
-SPELLCASTING_ABILITIES: Dict[str, str] = {
+SPELLCASTING_ABILITIES: Mapping[str, str] = MappingProxyType({
     "wizard": "INT",
-}
+})
 
 TrapStatus = Literal["hidden", "discovered", "disarmed", "sprung"]
 
@@ -90,6 +107,17 @@ def _format_difficulty_label(value: str) -> str:
     return " ".join(part.capitalize() for part in value.split("_"))
 
 
+@lru_cache(maxsize=1)
+def _tavern_cog_class() -> Optional[type]:
+    """Resolve the Tavern cog class once; it is imported lazily to avoid an import cycle."""
+
+    try:
+        from cogs.tavern import Tavern
+    except ImportError:  # pragma: no cover - defensive
+        return None
+    return Tavern
+
+
 DEFAULT_PERCEPTION_DC = 15
 PERCEPTION_DC_INCREASE_CHANCE = 0.25
 HIDDEN_EXIT_BASE_CHANCE = 0.25
@@ -110,33 +138,151 @@ DIFFICULTY_CHOICES = [
 DEFAULT_DIFFICULTY = "standard"
 
 
-@dataclass(frozen=True)
+_DAMAGE_ROLL_PATTERN = re.compile(r"(?i)(?P<count>\d+)d(?P<sides>\d+)(?P<modifier>[+-]\d+)?")
+
+
+@lru_cache(maxsize=512)
+def _parse_damage(expression: str) -> Optional[tuple[int, int, int]]:
+    """Return ``(count, sides, modifier)`` for a stripped dice expression, or ``None``.
+
+    Callers strip the expression first so padded spellings share one cache entry.
+    """
+
+    match = _DAMAGE_ROLL_PATTERN.fullmatch(expression)
+    if not match:
+        return None
+    return (
+        max(1, int(match.group("count"))),
+        max(1, int(match.group("sides"))),
+        int(match.group("modifier") or 0),
+    )
+
+
+@lru_cache(maxsize=128)
+def _proficiency_keys(
+    proficiencies: Tuple[str, ...], class_proficiencies: Tuple[str, ...]
+) -> FrozenSet[str]:
+    """Lowercase a character's own and class weapon proficiencies into one set."""
+
+    return frozenset(
+        value.lower() for group in (proficiencies, class_proficiencies) for value in group
+    )
+
+
+_PLAIN_RESOURCE_VALUES = (int, float, str, bool, type(None))
+
+
+def _clone_resources(value: _T) -> _T:
+    """Copy a resource payload built from plain dicts, lists and scalars.
+
+    Resource pools are small nested counters, so walking them directly is far
+    cheaper than ``copy.deepcopy``; anything unexpected still goes through it.
+    """
+
+    if isinstance(value, _PLAIN_RESOURCE_VALUES):
+        return value
+    if type(value) is dict:
+        return {key: _clone_resources(item) for key, item in value.items()}  # type: ignore[return-value]
+    if type(value) is list:
+        return [_clone_resources(item) for item in value]  # type: ignore[return-value]
+    return copy.deepcopy(value)
+
+
+def _damage_type_key(value: object) -> Optional[str]:
+    """Return ``value`` as an interned lowercase damage type, or ``None`` if blank.
+
+    Damage types and trait sets share interned strings, so trait lookups in
+    :func:`dnd.combat.apply_damage` match by identity before comparing text.
+    """
+
+    if not value:
+        return None
+    cleaned = str(value).strip().lower()
+    return sys.intern(cleaned) if cleaned else None
+
+
+def _grant_reward(character: Character, *, items: Tuple[str, ...], gold: int) -> Character:
+    return replace(
+        character,
+        inventory=character.inventory + items,
+        gold_coins=character.gold_coins + gold,
+    )
+
+
+def _roll_dice(count: int, sides: int, rng: Optional[random.Random] = None) -> int:
+    """Return the total of ``count`` rolls of a ``sides``-sided die.
+
+    Power-of-two dice (d2, d4, d8...) are drawn from a single packed
+    ``getrandbits`` call; other dice reject out-of-range draws per die, which is
+    what :func:`random.randint` does underneath without its call overhead. This
+    also outpaces ``random.choices(range(1, sides + 1), k=count)``, whose
+    per-element indexing costs roughly three times as much for typical dice.
+    A whole roll takes a few hundred nanoseconds, less than the call overhead of
+    dispatching into a compiled (numba/numpy) kernel.
+    """
+
+    getrandbits = (rng or random).getrandbits
+    total = count
+    if not sides & (sides - 1):
+        width = sides.bit_length() - 1
+        mask = sides - 1
+        packed = getrandbits(width * count) if width else 0
+        while packed:
+            total += packed & mask
+            packed >>= width
+        return total
+    bits = sides.bit_length()
+    for _ in range(count):
+        roll = getrandbits(bits)
+        while roll >= sides:
+            roll = getrandbits(bits)
+        total += roll
+    return total
+
+
+@dataclass(frozen=True, slots=True)
 class ArmorDefinition:
     base_ac: int
     dex_cap: Optional[int] = None
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WeaponDefinition:
     damage_die: str
-    categories: Sequence[str]
+    categories: Tuple[str, ...]
     finesse: bool = False
     ranged: bool = False
     name: Optional[str] = None
     quantity: int = 1
+    damage_count: int = field(init=False)
+    damage_sides: int = field(init=False)
+    average_die: float = field(init=False)
+    category_keys: FrozenSet[str] = field(init=False)
+
+    def __post_init__(self) -> None:
+        # The weapon table is static, so parse the damage die once at import.
+        count, sides, _ = _parse_damage(self.damage_die) or (1, 4, 0)
+        object.__setattr__(self, "damage_count", count)
+        object.__setattr__(self, "damage_sides", sides)
+        object.__setattr__(self, "average_die", count * (sides + 1) / 2)
+        object.__setattr__(
+            self, "category_keys", frozenset(tag.lower() for tag in self.categories)
+        )
 
 
-ARMOR_DEFINITIONS: Dict[str, ArmorDefinition] = {
+# Equipment tables are shared by every combatant build and exposed read-only;
+# callers should reference the definitions rather than copy them.
+ARMOR_DEFINITIONS: Mapping[str, ArmorDefinition] = MappingProxyType({
     "chain_mail": ArmorDefinition(base_ac=16, dex_cap=0),
     "leather_armor": ArmorDefinition(base_ac=11, dex_cap=None),
     "scale_mail": ArmorDefinition(base_ac=14, dex_cap=2),
-}
+})
 
-SHIELD_BONUSES: Dict[str, int] = {
+SHIELD_BONUSES: Mapping[str, int] = MappingProxyType({
     "shield": 2,
-}
+})
 
-WEAPON_DEFINITIONS: Dict[str, WeaponDefinition] = {
+WEAPON_DEFINITIONS: Mapping[str, WeaponDefinition] = MappingProxyType({
     "dagger": WeaponDefinition(
         damage_die="1d4",
         categories=("simple weapons", "daggers"),
@@ -189,45 +335,81 @@ WEAPON_DEFINITIONS: Dict[str, WeaponDefinition] = {
         name="Shortsword",
         quantity=2,
     ),
-}
+})
 MAX_COMBAT_LOG_ENTRIES = 12
-_DAMAGE_ROLL_PATTERN = re.compile(r"(?i)(?P<count>\d+)d(?P<sides>\d+)(?P<modifier>[+-]\d+)?")
+_SLUG_STRIP = re.compile(r"[^a-z0-9\-\s]")
+_SLUG_SPACES = re.compile(r"\s+")
+_SLUG_DASHES = re.compile(r"-+")
+# Session key of the interaction being handled by the current task.
+_INTERACTION_SESSION_KEY: contextvars.ContextVar[
+    Optional[tuple[discord.Interaction, SessionKey]]
+] = contextvars.ContextVar("dungeon_interaction_session_key", default=None)
+
 
 # Basic spell data used when character sheets do not provide richer metadata.
-DEFAULT_SPELL_OPTIONS: Dict[str, List[Dict[str, object]]] = {
-    "wizard": [
-        {
+# The tables are read-only so characters can share them without deep copies.
+DEFAULT_SPELL_OPTIONS: Mapping[str, Tuple[Mapping[str, object], ...]] = MappingProxyType({
+    "wizard": (
+        MappingProxyType({
             "name": "Fire Bolt",
             "level": 0,
             "type": "attack",
             "damage": "1d10",
             "damage_type": "fire",
-            "critical_extra_dice": [],
+            "critical_extra_dice": (),
             "description": "A mote of flame streaks toward a creature you can see within range.",
-        },
-        {
+        }),
+        MappingProxyType({
             "name": "Magic Missile",
             "level": 1,
             "type": "auto",
             "damage": "3d4+3",
             "damage_type": "force",
-            "consumes": {"type": "spell_slot", "level": 1, "amount": 1},
+            "consumes": MappingProxyType({"type": "spell_slot", "level": 1, "amount": 1}),
             "description": "Three glowing darts strike creatures of your choice that you can see within range.",
-        },
-    ],
-}
-
-DEFAULT_SPELL_SLOTS: Dict[str, Dict[int, int]] = {
-    "wizard": {1: 2},
-}
+        }),
+    ),
+})
+
+DEFAULT_SPELL_SLOTS: Mapping[str, Mapping[int, int]] = MappingProxyType({
+    "wizard": MappingProxyType({1: 2}),
+})
+
+_CRITICAL_HIT_SUFFIX = " Critical hit!"
+
+_INITIATIVE_KEY = attrgetter("initiative_total", "initiative_roll")
+
+# Faces of a d20, drawn from in one batch when a combat's initiative is rolled.
+_D20_FACES: Tuple[int, ...] = tuple(range(1, 21))
+
+_MONSTER_ACTION_PRIORITY: Mapping[str, int] = MappingProxyType({
+    "melee": 0,
+    "attack": 0,
+    "ranged": 1,
+    "spell": 2,
+    "save": 3,
+    "auto": 4,
+})
+
+# Death save tallies gained for each non-natural-20 roll: (successes, failures, outcome).
+_DEATH_SAVE_STEPS: Mapping[int, Tuple[int, int, str]] = MappingProxyType({
+    roll: (
+        (0, 2, "Critical failure—two death save failures recorded.")
+        if roll == 1
+        else (1, 0, "Success!") if roll >= 10 else (0, 1, "Failure.")
+    )
+    for roll in range(1, 20)
+})
 
+# Spell slot pools are keyed by the stringified level; summaries walk them in level order.
+_SPELL_SLOT_LEVELS: Tuple[str, ...] = tuple(str(level) for level in range(1, 10))
 
 
 def _default_data_path() -> Path:
     return Path(__file__).resolve().parent.parent / "data"
 
 
-@dataclass
+@dataclass(slots=True)
 class DungeonSession:
     """State container for an active dungeon crawl."""
 
@@ -251,7 +433,8 @@ class DungeonSession:
     stealthed: bool = False
     trap_states: Dict[int, Dict[str, TrapStatus]] = field(default_factory=dict)
     trap_catalog: Dict[int, Dict[str, Trap]] = field(default_factory=dict)
-    discovered_traps: Dict[int, Set[str]] = field(default_factory=dict)
+    discovered_traps: Dict[int, FrozenSet[str]] = field(default_factory=dict)
+    disarmable_queue: Dict[int, Deque[str]] = field(default_factory=dict)
     discovered_loot: Dict[int, Set[str]] = field(default_factory=dict)
     discovered_exits: Dict[int, Set[str]] = field(default_factory=dict)
     exit_visibility: Dict[int, Dict[str, bool]] = field(default_factory=dict)
@@ -266,14 +449,43 @@ class DungeonSession:
     treasure_items_claimed: int = 0
     treasure_gold_claimed: int = 0
     party_fall_announced: bool = False
+    party_version: int = 0
+    # Dedicated generator for reproducing a crawl's combat rolls; None uses the
+    # module-level ``random`` like the rest of the bot.
+    rng: Optional[random.Random] = field(default=None, repr=False, compare=False)
+    _party_snapshot: tuple[int, ...] = field(default=(), init=False, repr=False, compare=False)
+    _party_dirty: bool = field(default=True, init=False, repr=False, compare=False)
+    _final_room_index: int = field(default=0, init=False, repr=False, compare=False)
 
     @property
     def room(self) -> Room:
         return self.dungeon.rooms[self.current_room]
 
+    def add_party_member(self, user_id: int) -> bool:
+        if user_id in self.party_ids:
+            return False
+        self.party_ids.add(user_id)
+        self._party_dirty = True
+        return True
+
+    def remove_party_member(self, user_id: int) -> bool:
+        if user_id not in self.party_ids:
+            return False
+        self.party_ids.discard(user_id)
+        self._party_dirty = True
+        return True
+
+    def party_snapshot(self) -> tuple[int, ...]:
+        """Return the sorted party members, re-sorting only after changes."""
+
+        if self._party_dirty or len(self._party_snapshot) != len(self.party_ids):
+            self._party_snapshot = tuple(sorted(self.party_ids))
+            self._party_dirty = False
+        return self._party_snapshot
+
     @property
     def at_final_room(self) -> bool:
-        return self.current_room >= len(self.dungeon.rooms) - 1
+        return self.current_room >= self._final_room_index
 
     def travel_description(self) -> Optional[str]:
         return self.last_travel_description
@@ -281,10 +493,12 @@ class DungeonSession:
     def __post_init__(self) -> None:
         if not self.breadcrumbs:
             self.breadcrumbs.append(self.current_room)
+        # Generated dungeons never gain or lose rooms, so the last index is fixed.
+        self._final_room_index = len(self.dungeon.rooms) - 1
         self.room_damage_log.setdefault(self.current_room, {"monsters": 0, "traps": 0})
 
 
-@dataclass
+@dataclass(slots=True)
 class SessionEmbedPayload:
     """Container for embeds and files representing a dungeon session update."""
 
@@ -292,7 +506,285 @@ class SessionEmbedPayload:
     files: List[discord.File] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
+class DisarmOutcome:
+    """What the locked mutation in :meth:`DungeonCog.handle_disarm` decided."""
+
+    added_member: bool = False
+    no_trap_available: bool = False
+    room_id: Optional[int] = None
+    trap: Optional[Trap] = None
+    disarm: Optional[SavingThrowResult] = None
+    dc: int = 15
+    ability: str = "DEX"
+    trigger_reason: Optional[str] = None
+    party_snapshot: tuple[int, ...] = ()
+    loot_cursor: int = 0
+
+
+@dataclass(slots=True)
+class EngageOutcome:
+    """What the locked mutation in :meth:`DungeonCog.handle_engage` decided."""
+
+    added_member: bool = False
+    combat_in_progress: bool = False
+    no_targets: bool = False
+    should_start_combat: bool = False
+    party_snapshot: tuple[int, ...] = ()
+
+
+@dataclass(slots=True)
+class CombatActionOutcome:
+    """What the locked mutation in :meth:`DungeonCog.handle_combat_action` decided."""
+
+    added_member: bool = False
+    error: Optional[str] = None
+    summary: Optional[str] = None
+    trigger_monster_turns: bool = False
+    pending_fallen: List["CombatantState"] = field(default_factory=list)
+
+
+@dataclass(slots=True)
+class TrapSaveRoll:
+    """One party member's saving throw against a sprung trap."""
+
+    user_id: int
+    name: str
+    total: int
+    success: bool
+    character: Optional[Character] = None
+
+
+@dataclass(slots=True)
+class TrapTrigger:
+    """Dice rolled for a sprung trap, ready to be applied to the session."""
+
+    trap: Trap
+    ability: str
+    dc: int
+    damage_amount: int
+    saves: List[TrapSaveRoll] = field(default_factory=list)
+
+
+# A monster attack ready to swing: the attack with unrolled damage, its damage
+# dice and any extra dice added on a critical hit.
+_AttackProfile = Tuple[Attack, str, Tuple[str, ...]]
+
+
+class ActionKind(IntEnum):
+    """How a monster's turn is resolved."""
+
+    ATTACK = 0
+    SAVE = 1
+    AUTO = 2
+    MULTIATTACK = 3
+
+
+@dataclass(frozen=True, slots=True)
+class MonsterActionPlan:
+    """What a monster does on its turn, compiled once from its metadata.
+
+    ``attacks`` holds the profiles to swing for multiattacks and attacks, and
+    ``save`` the parsed saving-throw effect for save actions.
+    """
+
+    kind: ActionKind
+    name: str
+    action: Optional[Mapping[str, object]] = None
+    attacks: Tuple[_AttackProfile, ...] = ()
+    save: Optional["SaveActionProfile"] = None
+
+
+@dataclass(frozen=True, slots=True)
+class SaveActionProfile:
+    """A monster's saving-throw action with its static fields already coerced."""
+
+    name: str
+    dc: int
+    ability: str
+    damage: str
+    damage_type: Optional[str]
+    half_on_success: bool
+    success_conditions: Tuple[str, ...]
+    fail_conditions: Tuple[str, ...]
+
+
+@dataclass(frozen=True, slots=True)
+class TargetDefenses:
+    """What a monster action resolves against: the target's AC and damage traits."""
+
+    armor_class: int
+    resistances: FrozenSet[str]
+    vulnerabilities: FrozenSet[str]
+    immunities: FrozenSet[str]
+
+
+@dataclass(frozen=True, slots=True)
+class CombatOptions:
+    """Weapon, spell and feature choices normalised from combatant metadata."""
+
+    weapons: Tuple[Mapping[str, object], ...] = ()
+    spells: Tuple[Mapping[str, object], ...] = ()
+    features: Tuple[Mapping[str, object], ...] = ()
+
+    @classmethod
+    def from_metadata(cls, raw: object) -> "CombatOptions":
+        """Validate raw metadata once so readers can trust every entry is a mapping."""
+
+        if not isinstance(raw, Mapping):
+            return cls()
+
+        def entries(key: str) -> Tuple[Mapping[str, object], ...]:
+            value = raw.get(key)
+            if not isinstance(value, list):
+                return ()
+            return tuple(entry for entry in value if isinstance(entry, Mapping))
+
+        return cls(
+            weapons=entries("weapons"),
+            spells=entries("spells"),
+            features=entries("features"),
+        )
+
+
+@dataclass(frozen=True, slots=True)
+class AttackOption:
+    """A weapon attack with its metadata already coerced for attack resolution."""
+
+    name: str
+    attack_bonus: int
+    damage: str
+    critical_extra_dice: Optional[Tuple[str, ...]] = None
+
+    @classmethod
+    def from_entry(cls, entry: object, default: "AttackOption") -> "AttackOption":
+        """Build an option from a weapon entry, filling gaps from ``default``."""
+
+        if not isinstance(entry, Mapping):
+            return default
+        extra_dice = entry.get("critical_extra_dice")
+        return cls(
+            name=str(entry.get("name", default.name)),
+            attack_bonus=int(entry.get("attack_bonus", default.attack_bonus)),
+            damage=str(entry.get("damage", default.damage)),
+            critical_extra_dice=(
+                tuple(str(value) for value in extra_dice)
+                if isinstance(extra_dice, Sequence)
+                else None
+            ),
+        )
+
+
+class Condition(IntFlag):
+    """The standard conditions, stored as bits so membership is a single mask test."""
+
+    BLINDED = 1 << 0
+    CHARMED = 1 << 1
+    DEAFENED = 1 << 2
+    EXHAUSTION = 1 << 3
+    FRIGHTENED = 1 << 4
+    GRAPPLED = 1 << 5
+    INCAPACITATED = 1 << 6
+    INVISIBLE = 1 << 7
+    PARALYZED = 1 << 8
+    PETRIFIED = 1 << 9
+    POISONED = 1 << 10
+    PRONE = 1 << 11
+    RESTRAINED = 1 << 12
+    STUNNED = 1 << 13
+    UNCONSCIOUS = 1 << 14
+    DEAD = 1 << 15
+
+
+_CONDITIONS_BY_NAME: Mapping[str, Condition] = MappingProxyType(
+    {flag.name.lower(): flag for flag in Condition}
+)
+
+# Display labels for the standard conditions, built once so iteration hands out
+# the same string objects instead of re-titling each flag name.
+_CONDITION_LABELS: Tuple[Tuple[Condition, str], ...] = tuple(
+    (flag, sys.intern(flag.name.title())) for flag in Condition
+)
+
+
+class ConditionSet:
+    """Set-like collection of conditions backed by a :class:`Condition` bitmask.
+
+    Standard conditions live in ``mask``; anything else a feature or monster
+    action grants (``"Raging"``, ``"Dodging"``...) is kept by name in ``extra``.
+    """
+
+    __slots__ = ("mask", "extra", "version")
+
+    def __init__(self, values: Iterable[object] = ()) -> None:
+        self.mask = 0
+        self.extra: Set[str] = set()
+        # Bumped whenever membership changes so readers can reuse derived views.
+        self.version = 0
+        for value in values:
+            self.add(value)
+
+    @staticmethod
+    def _resolve(value: object) -> Tuple[int, str]:
+        if isinstance(value, Condition):
+            return int(value), ""
+        name = str(value).strip()
+        flag = _CONDITIONS_BY_NAME.get(name.lower())
+        return (int(flag), "") if flag is not None else (0, name)
+
+    def add(self, value: object) -> None:
+        flag, name = self._resolve(value)
+        if flag:
+            if flag & ~self.mask:
+                self.mask |= flag
+                self.version += 1
+        elif name and name not in self.extra:
+            # Custom names recur across combatants and log lines; share one copy.
+            self.extra.add(sys.intern(name))
+            self.version += 1
+
+    def discard(self, value: object) -> None:
+        flag, name = self._resolve(value)
+        if flag:
+            if self.mask & flag:
+                self.mask &= ~flag
+                self.version += 1
+        elif name in self.extra:
+            self.extra.discard(name)
+            self.version += 1
+
+    def __contains__(self, value: object) -> bool:
+        flag, name = self._resolve(value)
+        if flag:
+            return bool(self.mask & flag)
+        return name in self.extra
+
+    def __iter__(self) -> Iterator[str]:
+        mask = self.mask
+        if mask:
+            for flag, label in _CONDITION_LABELS:
+                if mask & flag:
+                    yield label
+        yield from self.extra
+
+    def __len__(self) -> int:
+        return self.mask.bit_count() + len(self.extra)
+
+    def __bool__(self) -> bool:
+        return bool(self.mask or self.extra)
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, ConditionSet):
+            return NotImplemented
+        return self.mask == other.mask and self.extra == other.extra
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        return f"ConditionSet({sorted(self)!r})"
+
+
+@dataclass(slots=True)
 class CombatantState:
     """Mutable state tracked for each combatant during combat."""
 
@@ -305,13 +797,83 @@ class CombatantState:
     is_player: bool
     user_id: Optional[int] = None
     metadata: Dict[str, object] = field(default_factory=dict)
-    conditions: Set[str] = field(default_factory=set)
+    conditions: ConditionSet = field(default_factory=ConditionSet)
     concentration: Optional[str] = None
     death_save_successes: int = 0
     death_save_failures: int = 0
     resources: Dict[str, object] = field(default_factory=dict)
     stable: bool = False
     selected_target: Optional[str] = None
+    _combat_options: Optional[CombatOptions] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _combat_options_source: object = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _select_options: Dict[str, Tuple[CombatOptions, List[discord.SelectOption]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _derived: Dict[str, Tuple[Tuple[object, ...], object]] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    _condition_names: Tuple[object, int, List[str]] = field(
+        default=(None, -1, []), init=False, repr=False, compare=False
+    )
+
+    def combat_options(self) -> CombatOptions:
+        """Return the normalised ``combat_options`` metadata, rebuilt only when replaced."""
+
+        raw = self.metadata.get("combat_options")
+        cached = self._combat_options
+        if cached is None or raw is not self._combat_options_source:
+            cached = CombatOptions.from_metadata(raw)
+            self._combat_options = cached
+            self._combat_options_source = raw
+        return cached
+
+    def select_options(
+        self,
+        kind: str,
+        build: Callable[[CombatOptions], List[discord.SelectOption]],
+    ) -> List[discord.SelectOption]:
+        """Return ``kind`` select options, rebuilding them only when the loadout changes."""
+
+        options = self.combat_options()
+        cached = self._select_options.get(kind)
+        if cached is None or cached[0] is not options:
+            cached = (options, build(options))
+            self._select_options[kind] = cached
+        return list(cached[1])
+
+    def condition_names(self) -> List[str]:
+        """Return the sorted condition names, re-sorting only after the conditions change."""
+
+        conditions = self.conditions
+        source, version, names = self._condition_names
+        if source is not conditions or version != conditions.version:
+            names = sorted(conditions)
+            self._condition_names = (conditions, conditions.version, names)
+        return names
+
+    def derived(
+        self, kind: str, sources: Tuple[object, ...], build: Callable[[], _T]
+    ) -> _T:
+        """Return the ``kind`` value built from ``sources``, rebuilt only when one is replaced.
+
+        Sources are compared by identity, so callers pass the raw metadata objects
+        (or other cached values) the result was derived from.
+        """
+
+        cached = self._derived.get(kind)
+        if cached is not None:
+            previous = cached[0]
+            if len(previous) == len(sources) and all(
+                old is new for old, new in zip(previous, sources)
+            ):
+                return cached[1]  # type: ignore[return-value]
+        value = build()
+        self._derived[kind] = (sources, value)
+        return value
 
     @property
     def defeated(self) -> bool:
@@ -328,7 +890,7 @@ class CombatantState:
         return self.current_hp <= 0 and self.death_save_failures >= 3
 
 
-@dataclass
+@dataclass(slots=True)
 class CombatState:
     """Encapsulates the turn order and ongoing combat flow."""
 
@@ -339,37 +901,190 @@ class CombatState:
     round_number: int = 1
     log: List[str] = field(default_factory=list)
     current_action: Optional[Dict[str, str]] = None
+    _surviving_players: Optional[List[CombatantState]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _contenders: Optional[List[CombatantState]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _positions: Dict[int, int] = field(
+        default_factory=dict, init=False, repr=False, compare=False
+    )
+    # The ``order`` list the caches above were derived from; reassigning
+    # ``order`` invalidates all of them.
+    _cached_order: Optional[List[CombatantState]] = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def _order_caches(self) -> List[CombatantState]:
+        order = self.order
+        if self._cached_order is not order:
+            self._cached_order = order
+            self._surviving_players = None
+            self._contenders = None
+            self._positions = {}
+        return order
 
     def current_combatant(self) -> Optional[CombatantState]:
-        if not self.order:
+        """Return the combatant whose turn it is.
+
+        This is a direct index into ``order`` rather than a cached pointer, so it
+        stays correct when ``turn_index`` or ``order`` are reassigned directly.
+        """
+
+        order = self.order
+        if not order:
             return None
-        return self.order[self.turn_index]
+        return order[self.turn_index]
 
     def advance_turn(self) -> Optional[CombatantState]:
-        if not self.order:
+        order = self._order_caches()
+        if not order:
             return None
-        for _ in range(len(self.order)):
-            self.turn_index = (self.turn_index + 1) % len(self.order)
-            if self.turn_index == 0:
-                self.round_number += 1
-            combatant = self.order[self.turn_index]
+        positions = self._positions
+        if not positions:
+            positions.update((id(combatant), index) for index, combatant in enumerate(order))
+        # The contender pool keeps turn order and drops the dead, so resume the
+        # walk just past the current slot instead of rescanning from the top.
+        pool = self._contender_pool()
+        start = bisect_right(
+            pool, self.turn_index, key=lambda combatant: positions[id(combatant)]
+        )
+        for index in range(start, len(pool)):
+            combatant = pool[index]
+            if not combatant.defeated:
+                self.turn_index = positions[id(combatant)]
+                return combatant
+        # Wrapping past the end of the order starts a new round.
+        self.round_number += 1
+        for index in range(start):
+            combatant = pool[index]
             if not combatant.defeated:
+                self.turn_index = positions[id(combatant)]
                 return combatant
         return None
 
-    def living_combatants(self, *, players: Optional[bool] = None) -> List[CombatantState]:
+    def surviving_players(self) -> List[CombatantState]:
+        """Players not yet confirmed dead, cached between fallen scans."""
+
+        order = self._order_caches()
+        if self._surviving_players is None:
+            self._surviving_players = [
+                combatant for combatant in order if combatant.is_player
+            ]
+        return self._surviving_players
+
+    def _contender_pool(self) -> List[CombatantState]:
+        order = self._order_caches()
+        pool = self._contenders
+        if pool is None:
+            pool = self._contenders = [
+                combatant for combatant in order if not combatant.is_dead
+            ]
+        return pool
+
+    def contenders(self, *, players: Optional[bool] = None) -> Tuple[CombatantState, ...]:
+        """Combatants that are not dead, including downed players who may recover.
+
+        Death is permanent, so the dead are pruned from the cached pool as soon
+        as a scan notices them and are never visited again.
+        """
+
+        pool = self._contender_pool()
         results: List[CombatantState] = []
-        for combatant in self.order:
-            if combatant.defeated:
+        pruned = False
+        for combatant in pool:
+            if combatant.is_dead:
+                pruned = True
                 continue
             if players is None or combatant.is_player is players:
                 results.append(combatant)
-        return results
+        if pruned:
+            self._contenders = [combatant for combatant in pool if not combatant.is_dead]
+        return tuple(results)
+
+    def living_combatants(
+        self, *, players: Optional[bool] = None
+    ) -> Tuple[CombatantState, ...]:
+        return tuple(
+            combatant
+            for combatant in self.contenders(players=players)
+            if not combatant.defeated
+        )
+
+    def iter_living(self, *, players: bool) -> Iterator[CombatantState]:
+        """Lazily yield one side's standing combatants in turn order."""
+
+        for combatant in self._contender_pool():
+            if combatant.is_player is players and not combatant.defeated:
+                yield combatant
+
+    def any_living(self, *, players: bool) -> bool:
+        """Whether one side still has a combatant standing, stopping at the first found."""
+
+        return next(self.iter_living(players=players), None) is not None
+
+    def mark_defeated(self, combatant: CombatantState) -> None:
+        """Drop a combatant that has died from the cached pool of contenders."""
+
+        self._order_caches()
+        pool = self._contenders
+        if pool is not None and combatant.is_dead and combatant in pool:
+            pool.remove(combatant)
+
+
+# Overwrites applied to party channels. Only ever passed to ``channel.edit``,
+# which serialises them; ``channel.overwrites`` hands back fresh copies.
+_PARTY_MEMBER_OVERWRITE = discord.PermissionOverwrite(
+    view_channel=True, send_messages=True, read_message_history=True
+)
+_DEFAULT_ROLE_DENY_OVERWRITE = discord.PermissionOverwrite(view_channel=False)
+
+
+# Placeholder choices shown when a select has nothing to offer. They are built once
+# and copied into a fresh list per view, since a Select keeps the list it is given.
+_NO_COMBAT_TARGET_OPTIONS: Tuple[discord.SelectOption, ...] = (
+    discord.SelectOption(
+        label="No combat in progress",
+        value="target:none",
+        description="There is no active encounter.",
+    ),
+)
+_NO_TARGET_OPTIONS: Tuple[discord.SelectOption, ...] = (
+    discord.SelectOption(
+        label="No targets available",
+        value="target:none",
+        description="All enemies have been defeated.",
+    ),
+)
+_EMPTY_WEAPON_OPTIONS: Tuple[discord.SelectOption, ...] = (
+    discord.SelectOption(
+        label="No weapons available",
+        value="weapon:0",
+        description="No weapon attacks are configured.",
+    ),
+)
+_EMPTY_SPELL_OPTIONS: Tuple[discord.SelectOption, ...] = (
+    discord.SelectOption(
+        label="No spells prepared",
+        value="spell:0",
+        description="You have no prepared spells.",
+    ),
+)
+_EMPTY_FEATURE_OPTIONS: Tuple[discord.SelectOption, ...] = (
+    discord.SelectOption(
+        label="No features available",
+        value="feature:0",
+        description="No combat features are ready.",
+    ),
+)
 
 
 class DungeonNavigationView(discord.ui.View):
     """Button controls for navigating dungeon sessions."""
 
+    __slots__ = ("cog", "_session")
+
     def __init__(
         self,
         cog: "DungeonCog",
@@ -401,28 +1116,24 @@ class DungeonNavigationView(discord.ui.View):
             style=discord.ButtonStyle.secondary,
             custom_id="dungeon:search",
             disabled=disable_search,
-            handler=self._handle_search,
         )
         self._add_action_button(
             label="Perception",
             style=discord.ButtonStyle.secondary,
             custom_id="dungeon:perception",
             disabled=False,
-            handler=self._handle_perception,
         )
         self._add_action_button(
             label=trap_label,
             style=trap_style,
             custom_id="dungeon:disarm",
             disabled=disable_disarm or not trap_detected,
-            handler=self._handle_disarm,
         )
         self._add_action_button(
             label="Ambush" if session.stealthed else "Engage",
             style=discord.ButtonStyle.success,
             custom_id="dungeon:engage",
             disabled=disable_engage,
-            handler=self._handle_engage,
         )
 
     def _add_status_indicator(self, session: DungeonSession) -> None:
@@ -437,17 +1148,20 @@ class DungeonNavigationView(discord.ui.View):
         self.add_item(button)
 
     def _add_exit_controls(self, session: DungeonSession) -> None:
-        discovered = session.discovered_exits.get(session.room.id, set())
-        for exit_option in session.room.exits:
+        room = session.room
+        discovered = session.discovered_exits.get(room.id, set())
+        for exit_option in room.exits:
             if exit_option.key not in discovered:
                 continue
             custom_id = f"dungeon:exit:{session.channel_id}:{exit_option.key}"
-            button = discord.ui.Button(
+            button = self._RoutedButton(
+                self.cog,
+                "handle_exit",
+                exit_option.key,
                 label=exit_option.label,
                 style=discord.ButtonStyle.primary,
                 custom_id=custom_id,
             )
-            button.callback = self._make_exit_callback(exit_option.key)
             self.add_item(button)
 
     def _add_action_button(
@@ -457,41 +1171,47 @@ class DungeonNavigationView(discord.ui.View):
         style: discord.ButtonStyle,
         custom_id: str,
         disabled: bool,
-        handler: Callable[[discord.Interaction], Awaitable[None]],
     ) -> None:
-        button = discord.ui.Button(
+        button = self._RoutedButton(
+            self.cog,
+            self._ACTION_HANDLERS[custom_id],
             label=label,
             style=style,
             custom_id=custom_id,
             disabled=disabled,
         )
-        button.callback = handler
         self.add_item(button)
 
-    def _make_exit_callback(
-        self, exit_key: str
-    ) -> Callable[[discord.Interaction], Awaitable[None]]:
-        async def _callback(interaction: discord.Interaction) -> None:
-            await self.cog.handle_exit(interaction, exit_key)
-
-        return _callback
+    # Cog handler invoked for each fixed navigation ``custom_id``.
+    _ACTION_HANDLERS: Mapping[str, str] = MappingProxyType({
+        "dungeon:search": "handle_search",
+        "dungeon:perception": "handle_perception",
+        "dungeon:disarm": "handle_disarm",
+        "dungeon:engage": "handle_engage",
+    })
 
-    async def _handle_search(self, interaction: discord.Interaction) -> None:
-        await self.cog.handle_search(interaction)
+    class _RoutedButton(discord.ui.Button):
+        """Button that forwards clicks to a named cog handler without a per-render closure."""
 
-    async def _handle_disarm(self, interaction: discord.Interaction) -> None:
-        await self.cog.handle_disarm(interaction)
+        __slots__ = ("_cog", "_handler", "_args")
 
-    async def _handle_engage(self, interaction: discord.Interaction) -> None:
-        await self.cog.handle_engage(interaction)
+        def __init__(
+            self, cog: "DungeonCog", handler: str, *args: str, **kwargs: object
+        ) -> None:
+            super().__init__(**kwargs)
+            self._cog = cog
+            self._handler = handler
+            self._args = args
 
-    async def _handle_perception(self, interaction: discord.Interaction) -> None:
-        await self.cog.handle_perception(interaction)
+        async def callback(self, interaction: discord.Interaction) -> None:  # noqa: D401
+            await getattr(self._cog, self._handler)(interaction, *self._args)
 
 
 class CombatActionView(discord.ui.View):
     """Interaction controls shown while combat is active."""
 
+    __slots__ = ("cog", "_combat_active")
+
     def __init__(self, cog: "DungeonCog", session: DungeonSession) -> None:
         super().__init__(timeout=None)
         self.cog = cog
@@ -505,7 +1225,7 @@ class CombatActionView(discord.ui.View):
             self._disable_children()
 
     async def interaction_check(self, interaction: discord.Interaction) -> bool:  # noqa: D401
-        key = self.cog._session_key(interaction.guild_id, interaction.channel_id)
+        key = self.cog._interaction_session_key(interaction)
         session = await self.cog.sessions.get(key)
         if session is None:
             await interaction.response.send_message("No active combat encounter here.", ephemeral=True)
@@ -565,26 +1285,10 @@ class CombatActionView(discord.ui.View):
         current: Optional[CombatantState],
     ) -> Tuple[List[discord.SelectOption], bool]:
         if combat is None:
-            return ([
-                discord.SelectOption(
-                    label="No combat in progress",
-                    value="target:none",
-                    description="There is no active encounter.",
-                )
-            ], True)
-        enemies = [
-            combatant
-            for combatant in combat.order
-            if not combatant.is_player and not combatant.defeated
-        ]
+            return list(_NO_COMBAT_TARGET_OPTIONS), True
+        enemies = combat.living_combatants(players=False)
         if not enemies:
-            return ([
-                discord.SelectOption(
-                    label="No targets available",
-                    value="target:none",
-                    description="All enemies have been defeated.",
-                )
-            ], True)
+            return list(_NO_TARGET_OPTIONS), True
         disabled = (
             current is None
             or not current.is_player
@@ -625,6 +1329,8 @@ class CombatActionView(discord.ui.View):
         self.add_item(select)
 
     class _ActionSelect(discord.ui.Select):
+        __slots__ = ("_cog", "_action")
+
         def __init__(
             self,
             cog: "DungeonCog",
@@ -652,23 +1358,14 @@ class CombatActionView(discord.ui.View):
 
     def _weapon_options(self, combatant: Optional[CombatantState]) -> List[discord.SelectOption]:
         if combatant is None:
-            return [
-                discord.SelectOption(
-                    label="No weapons available",
-                    value="weapon:0",
-                    description="No weapon attacks are configured.",
-                )
-            ]
-        combat_options = combatant.metadata.get("combat_options", {})
-        weapons = combat_options.get("weapons") if isinstance(combat_options, Mapping) else None
-        if not isinstance(weapons, list) or not weapons:
-            return [
-                discord.SelectOption(
-                    label="No weapons available",
-                    value="weapon:0",
-                    description="No weapon attacks are configured.",
-                )
-            ]
+            return list(_EMPTY_WEAPON_OPTIONS)
+        return combatant.select_options("weapon", self._build_weapon_options)
+
+    @staticmethod
+    def _build_weapon_options(combat_options: CombatOptions) -> List[discord.SelectOption]:
+        weapons = combat_options.weapons
+        if not weapons:
+            return list(_EMPTY_WEAPON_OPTIONS)
         options: List[discord.SelectOption] = []
         for index, weapon in enumerate(weapons):
             name = str(weapon.get("name", f"Weapon {index + 1}"))
@@ -693,23 +1390,15 @@ class CombatActionView(discord.ui.View):
         self, combatant: Optional[CombatantState]
     ) -> Tuple[List[discord.SelectOption], bool]:
         if combatant is None:
-            return ([
-                discord.SelectOption(
-                    label="No spells prepared",
-                    value="spell:0",
-                    description="You have no prepared spells.",
-                )
-            ], True)
-        combat_options = combatant.metadata.get("combat_options", {})
-        spells = combat_options.get("spells") if isinstance(combat_options, Mapping) else None
-        if not isinstance(spells, list) or not spells:
-            return ([
-                discord.SelectOption(
-                    label="No spells prepared",
-                    value="spell:0",
-                    description="You have no prepared spells.",
-                )
-            ], True)
+            return list(_EMPTY_SPELL_OPTIONS), True
+        options = combatant.select_options("spell", self._build_spell_options)
+        return options, not combatant.combat_options().spells
+
+    @staticmethod
+    def _build_spell_options(combat_options: CombatOptions) -> List[discord.SelectOption]:
+        spells = combat_options.spells
+        if not spells:
+            return list(_EMPTY_SPELL_OPTIONS)
         options: List[discord.SelectOption] = []
         for index, spell in enumerate(spells):
             name = str(spell.get("name", f"Spell {index + 1}"))
@@ -738,33 +1427,25 @@ class CombatActionView(discord.ui.View):
                     description=description or "Spell action",
                 )
             )
-        return options, False
+        return options
 
     def _feature_options(
         self, combatant: Optional[CombatantState]
     ) -> Tuple[List[discord.SelectOption], bool]:
         if combatant is None:
-            return ([
-                discord.SelectOption(
-                    label="No features available",
-                    value="feature:0",
-                    description="No combat features are ready.",
-                )
-            ], True)
-        combat_options = combatant.metadata.get("combat_options", {})
-        features = combat_options.get("features") if isinstance(combat_options, Mapping) else None
-        if not isinstance(features, list) or not features:
-            return ([
-                discord.SelectOption(
-                    label="No features available",
-                    value="feature:0",
-                    description="No combat features are ready.",
-                )
-            ], True)
+            return list(_EMPTY_FEATURE_OPTIONS), True
+        options = combatant.select_options("feature", self._build_feature_options)
+        return options, not combatant.combat_options().features
+
+    @staticmethod
+    def _build_feature_options(combat_options: CombatOptions) -> List[discord.SelectOption]:
+        features = combat_options.features
+        if not features:
+            return list(_EMPTY_FEATURE_OPTIONS)
         options: List[discord.SelectOption] = []
         for index, feature in enumerate(features):
             name = str(feature.get("name", f"Feature {index + 1}"))
-            effects = feature.get("effects") if isinstance(feature, Mapping) else None
+            effects = feature.get("effects")
             effect_desc = "Feature action"
             if isinstance(effects, Mapping):
                 effect_type = str(effects.get("type", "")).title()
@@ -780,11 +1461,11 @@ class CombatActionView(discord.ui.View):
                     description=str(effect_desc)[:100],
                 )
             )
-        return options, False
+        return options
 
     def _add_weapon_select(self, combatant: Optional[CombatantState]) -> None:
         options = self._weapon_options(combatant)
-        disabled = combatant is None or not combatant.metadata.get("combat_options", {}).get("weapons")
+        disabled = combatant is None or not combatant.combat_options().weapons
         select = self._ActionSelect(
             self.cog,
             action="weapon",
@@ -820,43 +1501,66 @@ class CombatActionView(discord.ui.View):
         self.add_item(select)
 
     def _add_death_save_button(self, *, disabled: bool) -> None:
-        button = discord.ui.Button(
-            label="Roll Death Save",
-            style=discord.ButtonStyle.danger,
-            custom_id="dungeon:combat:death_save",
-            disabled=disabled,
+        self.add_item(
+            self._ActionButton(
+                self.cog,
+                action="death_save",
+                label="Roll Death Save",
+                style=discord.ButtonStyle.danger,
+                disabled=disabled,
+            )
         )
-        button.callback = self._make_action_callback("death_save")
-        self.add_item(button)
 
     def _add_common_buttons(self, *, disabled: bool) -> None:
-        defend_button = discord.ui.Button(
-            label="Defend",
-            style=discord.ButtonStyle.secondary,
-            custom_id="dungeon:combat:defend",
-            disabled=disabled,
+        self.add_item(
+            self._ActionButton(
+                self.cog,
+                action="defend",
+                label="Defend",
+                style=discord.ButtonStyle.secondary,
+                disabled=disabled,
+            )
         )
-        defend_button.callback = self._make_action_callback("defend")
-        end_button = discord.ui.Button(
-            label="End Turn",
-            style=discord.ButtonStyle.primary,
-            custom_id="dungeon:combat:end",
-            disabled=disabled,
+        self.add_item(
+            self._ActionButton(
+                self.cog,
+                action="end",
+                label="End Turn",
+                style=discord.ButtonStyle.primary,
+                disabled=disabled,
+            )
         )
-        end_button.callback = self._make_action_callback("end")
-        self.add_item(defend_button)
-        self.add_item(end_button)
 
-    def _make_action_callback(self, action: str) -> Callable[[discord.Interaction], Awaitable[None]]:
-        async def _callback(interaction: discord.Interaction) -> None:
-            await self.cog.handle_combat_action(interaction, action)
+    class _ActionButton(discord.ui.Button):
+        __slots__ = ("_cog", "_action")
+
+        def __init__(
+            self,
+            cog: "DungeonCog",
+            *,
+            action: str,
+            label: str,
+            style: discord.ButtonStyle,
+            disabled: bool,
+        ) -> None:
+            super().__init__(
+                label=label,
+                style=style,
+                custom_id=f"dungeon:combat:{action}",
+                disabled=disabled,
+            )
+            self._cog = cog
+            self._action = action
 
-        return _callback
+        async def callback(self, interaction: discord.Interaction) -> None:  # noqa: D401
+            await self._cog.handle_combat_action(interaction, self._action)
 
 
 class DungeonDeleteConfirmation(discord.ui.View):
     """Confirmation dialog for deleting stored dungeons."""
 
+    __slots__ = ("cog", "requester_id", "guild_id", "dungeon")
+
     def __init__(
         self,
         cog: "DungeonCog",
@@ -903,6 +1607,8 @@ class DungeonDeleteConfirmation(discord.ui.View):
 
 
 class ReturnToTavernView(discord.ui.View):
+    __slots__ = ("cog", "session")
+
     def __init__(self, cog: "DungeonCog", session: DungeonSession) -> None:
         super().__init__(timeout=None)
         self.cog = cog
@@ -924,8 +1630,7 @@ class ReturnToTavernView(discord.ui.View):
             nonlocal hero_removed
             if user_id is None:
                 return
-            if user_id in session.party_ids:
-                session.party_ids.discard(user_id)
+            if session.remove_party_member(user_id):
                 hero_removed = True
 
         session_key = self.cog._session_key(guild_id, self.session.channel_id)
@@ -933,8 +1638,7 @@ class ReturnToTavernView(discord.ui.View):
         session_exists = updated_session is not None
         if updated_session is None:
             updated_session = self.session
-            if user_id is not None and user_id in updated_session.party_ids:
-                updated_session.party_ids.discard(user_id)
+            if user_id is not None and updated_session.remove_party_member(user_id):
                 hero_removed = True
 
         await self.cog._refresh_session_view(updated_session)
@@ -964,7 +1668,9 @@ class ReturnToTavernView(discord.ui.View):
 class DungeonCog(commands.Cog):
     """Slash commands to generate and explore procedural dungeons."""
 
-    dungeon_group = app_commands.Group(name="dungeon", description="Procedural dungeon exploration")
+    dungeon_group = app_commands.Group(
+        name="dungeon", description="Procedural dungeon exploration", guild_only=True
+    )
 
     def __init__(self, bot: commands.Bot) -> None:
         self.bot = bot
@@ -977,6 +1683,12 @@ class DungeonCog(commands.Cog):
         metadata_path = self.data_path / "sessions" / "metadata.json"
         self.metadata_store = DungeonMetadataStore(metadata_path)
         self.characters = CharacterRepository(Path("data") / "characters.json")
+        self._party_character_cache: OrderedDict[
+            tuple[int, tuple[int, ...]], tuple[int, int, Dict[int, Character]]
+        ] = OrderedDict()
+        self._pending_refresh: Dict[SessionKey, asyncio.Task] = {}
+        # Party and overwrite state each party channel was last synced to.
+        self._party_access_signatures: Dict[int, tuple] = {}
         self._load_content(silent=True)
 
     def cog_unload(self) -> None:  # noqa: D401 - discord.py hook
@@ -987,6 +1699,14 @@ class DungeonCog(commands.Cog):
             )
         except (app_commands.CommandTreeException, KeyError):
             pass
+        # The resolved class belongs to the module as it was loaded; drop it so
+        # a reload of the extensions resolves the Tavern class afresh.
+        _tavern_cog_class.cache_clear()
+        pending = getattr(self, "_pending_refresh", None)
+        if pending:
+            for task in pending.values():
+                task.cancel()
+            pending.clear()
 
     # ------------------------------------------------------------------
     def _load_content(self, *, silent: bool = False) -> None:
@@ -1008,15 +1728,21 @@ class DungeonCog(commands.Cog):
     def _identify_newly_fallen(
         self, session: DungeonSession, combat: CombatState
     ) -> list[CombatantState]:
+        survivors = combat.surviving_players()
         newly_fallen: list[CombatantState] = []
-        for combatant in combat.order:
-            if not combatant.is_player or not combatant.is_dead:
+        still_standing: list[CombatantState] = []
+        for combatant in survivors:
+            if not combatant.is_dead:
+                still_standing.append(combatant)
                 continue
+            combat.mark_defeated(combatant)
             key = self._fallen_identifier(combatant)
             if key in session.fallen_players:
                 continue
             session.fallen_players.add(key)
             newly_fallen.append(combatant)
+        if len(still_standing) != len(survivors):
+            survivors[:] = still_standing
         return newly_fallen
 
     def _build_player_death_embed(
@@ -1057,6 +1783,7 @@ class DungeonCog(commands.Cog):
         if guild_id is not None and user_id is not None:
             try:
                 await self.characters.clear(guild_id, user_id)
+                self._forget_cached_character(guild_id, user_id)
                 await self._update_tavern_access(guild_id)
             except Exception as exc:  # pragma: no cover - defensive logging
                 log.warning(
@@ -1095,6 +1822,16 @@ class DungeonCog(commands.Cog):
     def _session_key(self, guild_id: Optional[int], channel_id: Optional[int]) -> SessionKey:
         return SessionManager.make_key(guild_id, channel_id)
 
+    def _interaction_session_key(self, interaction: discord.Interaction) -> SessionKey:
+        """Return the session key for ``interaction``, built once per handling task."""
+
+        bound = _INTERACTION_SESSION_KEY.get()
+        if bound is not None and bound[0] is interaction:
+            return bound[1]
+        key = self._session_key(interaction.guild_id, interaction.channel_id)
+        _INTERACTION_SESSION_KEY.set((interaction, key))
+        return key
+
     async def _send_player_to_manage_channel(
         self, session: DungeonSession, combatant: CombatantState
     ) -> None:
@@ -1157,6 +1894,7 @@ class DungeonCog(commands.Cog):
         else:
             removed.party_fall_announced = True
         removed.party_ids.update(session.party_ids)
+        self._forget_party_channel_access(removed)
 
         get_guild = getattr(self.bot, "get_guild", None)
         if removed.guild_id is not None and callable(get_guild):
@@ -1205,9 +1943,9 @@ class DungeonCog(commands.Cog):
         await self._update_tavern_access(removed.guild_id)
 
     def _normalise_party_channel_name(self, dungeon_name: str) -> str:
-        slug = re.sub(r"[^a-z0-9\-\s]", "", dungeon_name.lower())
-        slug = re.sub(r"\s+", "-", slug)
-        slug = re.sub(r"-+", "-", slug).strip("-")
+        slug = _SLUG_STRIP.sub("", dungeon_name.lower())
+        slug = _SLUG_SPACES.sub("-", slug)
+        slug = _SLUG_DASHES.sub("-", slug).strip("-")
         if not slug:
             slug = "delve"
         base = f"delve-{slug}"
@@ -1260,23 +1998,25 @@ class DungeonCog(commands.Cog):
 
         base_name = self._normalise_party_channel_name(dungeon_name)
         try:
-            active_keys = await self.sessions.keys()
+            active_channels = await self.sessions.channels_for_guild(guild.id)
         except Exception:  # pragma: no cover - defensive
-            active_keys = ()
-        active_channels = {
-            channel_id for guild_id, channel_id in active_keys if guild_id == guild.id
-        }
+            active_channels = frozenset()
 
         prefix = base_name
+        suffixed_prefix = f"{prefix}-"
+        # ``guild.text_channels`` re-sorts the channel cache on every access, so walk it
+        # once: look for a reusable channel and collect the names taken for new ones.
+        existing_names: Set[str] = set()
         for channel in guild.text_channels:
+            name = channel.name
+            existing_names.add(name)
             if channel.id in active_channels:
                 continue
-            if channel.name == prefix or channel.name.startswith(f"{prefix}-"):
+            if name == prefix or name.startswith(suffixed_prefix):
                 if isinstance(channel, discord.TextChannel):
                     return channel
 
         topic = f"Dungeon party channel for {dungeon_name}"[:1024]
-        existing_names = {channel.name for channel in guild.text_channels}
         category = await self._preferred_delve_category(guild)
         for _ in range(20):
             suffix = secrets.token_hex(2)
@@ -1313,16 +2053,29 @@ class DungeonCog(commands.Cog):
         if not isinstance(channel, discord.TextChannel):
             return
 
+        # Compute the full overwrite mapping locally and apply it in one edit
+        # rather than one set_permissions round trip per role and member.
+        current = channel.overwrites
+        party_ids = frozenset(session.party_ids)
+        signatures = self._party_access_signatures
+        if signatures.get(channel.id) == self._party_access_signature(party_ids, current):
+            return
+        # Copying the current overwrites and dropping stale member entries is a
+        # single pass; party grants are layered on top afterwards.
+        overwrites = {
+            target: overwrite
+            for target, overwrite in current.items()
+            if not self._revocable_member_overwrite(target, party_ids)
+        }
         default_role = guild.default_role
-        overwrites = channel.overwrites_for(default_role)
-        if overwrites.view_channel is not False:
-            try:
-                await channel.set_permissions(default_role, view_channel=False)
-            except (discord.HTTPException, discord.Forbidden):
-                log.debug("Failed to restrict default role access in %s", channel)
-
-        allowed_ids = set(session.party_ids)
-        for member_id in allowed_ids:
+        default_overwrite = overwrites.get(default_role)
+        if default_overwrite is None or default_overwrite.view_channel is not False:
+            overwrites[default_role] = _DEFAULT_ROLE_DENY_OVERWRITE
+
+        # A member that could not be resolved has no grant yet, so the
+        # signature is only recorded once every party member was applied.
+        resolved_all = True
+        for member_id in party_ids:
             member = guild.get_member(member_id)
             if member is None:
                 try:
@@ -1331,8 +2084,9 @@ class DungeonCog(commands.Cog):
                     log.debug(
                         "Failed to fetch party member %s for guild %s", member_id, guild.id
                     )
+                    resolved_all = False
                     continue
-            overwrite = channel.overwrites.get(member)
+            overwrite = overwrites.get(member)
             if (
                 overwrite is not None
                 and overwrite.view_channel is True
@@ -1340,28 +2094,46 @@ class DungeonCog(commands.Cog):
                 and overwrite.read_message_history is True
             ):
                 continue
-            permission = discord.PermissionOverwrite()
-            permission.view_channel = True
-            permission.send_messages = True
-            permission.read_message_history = True
-            try:
-                await channel.set_permissions(member, overwrite=permission)
-            except (discord.HTTPException, discord.Forbidden):
-                log.debug("Failed to grant party access to %s in %s", member, channel)
+            overwrites[member] = _PARTY_MEMBER_OVERWRITE
 
-        for target, _ in list(channel.overwrites.items()):
-            if not isinstance(target, discord.Member):
-                continue
-            if target.id in allowed_ids:
-                continue
-            if target.guild_permissions.manage_channels:
-                continue
+        if overwrites != current:
             try:
-                await channel.set_permissions(target, overwrite=None)
+                await channel.edit(overwrites=overwrites, reason="Dungeon party access sync")
             except (discord.HTTPException, discord.Forbidden):
-                log.debug("Failed to revoke party access from %s in %s", target, channel)
+                log.debug("Failed to sync party access in %s", channel)
+                return
+        if resolved_all:
+            signatures[channel.id] = self._party_access_signature(party_ids, overwrites)
+        else:
+            signatures.pop(channel.id, None)
+
+    @staticmethod
+    def _revocable_member_overwrite(target: object, keep_ids: FrozenSet[int]) -> bool:
+        return (
+            isinstance(target, discord.Member)
+            and target.id not in keep_ids
+            and not target.guild_permissions.manage_channels
+        )
+
+    @staticmethod
+    def _party_access_signature(
+        party_ids: FrozenSet[int],
+        overwrites: Mapping[object, discord.PermissionOverwrite],
+    ) -> tuple:
+        entries = []
+        for target, overwrite in overwrites.items():
+            allow, deny = overwrite.pair()
+            entries.append((target.id, allow.value, deny.value))
+        entries.sort()
+        return (party_ids, tuple(entries))
+
+    def _forget_party_channel_access(self, session: DungeonSession) -> None:
+        signatures = getattr(self, "_party_access_signatures", None)
+        if signatures is not None:
+            signatures.pop(session.channel_id, None)
 
     async def _clear_party_channel_access(self, session: DungeonSession) -> None:
+        self._forget_party_channel_access(session)
         if session.guild_id is None:
             return
         guild = self.bot.get_guild(session.guild_id)
@@ -1371,27 +2143,28 @@ class DungeonCog(commands.Cog):
         if not isinstance(channel, discord.TextChannel):
             return
 
+        current = channel.overwrites
+        overwrites = {
+            target: overwrite
+            for target, overwrite in current.items()
+            if not self._revocable_member_overwrite(target, frozenset())
+        }
         default_role = guild.default_role
-        overwrites = channel.overwrites_for(default_role)
-        if overwrites.view_channel is not False:
-            try:
-                await channel.set_permissions(default_role, view_channel=False)
-            except (discord.HTTPException, discord.Forbidden):
-                log.debug("Failed to restrict default role access in %s", channel)
+        default_overwrite = overwrites.get(default_role)
+        if default_overwrite is None or default_overwrite.view_channel is not False:
+            overwrites[default_role] = _DEFAULT_ROLE_DENY_OVERWRITE
 
-        for target in list(channel.overwrites):
-            if not isinstance(target, discord.Member):
-                continue
-            if target.guild_permissions.manage_channels:
-                continue
-            try:
-                await channel.set_permissions(target, overwrite=None)
-            except (discord.HTTPException, discord.Forbidden):
-                log.debug("Failed to clear party access for %s in %s", target, channel)
+        if overwrites == current:
+            return
+        try:
+            await channel.edit(overwrites=overwrites, reason="Dungeon party access cleared")
+        except (discord.HTTPException, discord.Forbidden):
+            log.debug("Failed to clear party access in %s", channel)
 
     async def _run_delayed_party_cleanup(self, session: DungeonSession) -> None:
         await asyncio.sleep(60)
 
+        self._forget_party_channel_access(session)
         if session.guild_id is None:
             return
 
@@ -1436,28 +2209,57 @@ class DungeonCog(commands.Cog):
     async def _handle_party_membership_change(
         self, guild_id: int, session: DungeonSession
     ) -> None:
+        session.party_version += 1
         await self._update_tavern_access(guild_id)
         await self._sync_party_channel_access(session)
 
     async def _load_party_characters(
         self, guild_id: int, party_ids: Iterable[int]
     ) -> Dict[int, Character]:
-        characters: Dict[int, Character] = {}
-        for user_id in party_ids:
-            try:
-                character = await self.characters.get(guild_id, user_id)
-            except Exception as exc:
-                log.warning(
-                    "Failed to load character for user %s in guild %s: %s",
-                    user_id,
-                    guild_id,
-                    exc,
-                )
-                continue
-            if character is not None:
-                characters[user_id] = character
+        try:
+            return await self.characters.get_many(guild_id, party_ids)
+        except Exception as exc:
+            log.warning(
+                "Failed to load party characters in guild %s: %s",
+                guild_id,
+                exc,
+            )
+            return {}
+
+    async def _load_party_characters_cached(
+        self, guild_id: int, party_snapshot: tuple[int, ...], version: int
+    ) -> Dict[int, Character]:
+        """Return party characters, reusing the lookup while nothing has changed.
+
+        An entry is reused only while both the party ``version`` and the
+        repository's write generation hold, so saves made elsewhere (shop
+        purchases, recreated characters) are picked up on the next lookup.
+        """
+
+        cache = self._party_character_cache
+        cache_key = (guild_id, party_snapshot)
+        generation = self.characters.generation
+        cached = cache.get(cache_key)
+        if cached is not None and cached[0] == version and cached[1] == generation:
+            cache.move_to_end(cache_key)
+            return cached[2]
+        characters = await self._load_party_characters(guild_id, party_snapshot)
+        cache[cache_key] = (version, self.characters.generation, characters)
+        cache.move_to_end(cache_key)
+        while len(cache) > PARTY_CHARACTER_CACHE_SIZE:
+            cache.popitem(last=False)
         return characters
 
+    def _forget_cached_character(self, guild_id: int, user_id: int) -> None:
+        cache = self._party_character_cache
+        stale = [
+            cache_key
+            for cache_key in cache
+            if cache_key[0] == guild_id and user_id in cache_key[1]
+        ]
+        for cache_key in stale:
+            del cache[cache_key]
+
     async def _apply_reward_shares(
         self,
         guild_id: int,
@@ -1468,32 +2270,41 @@ class DungeonCog(commands.Cog):
         gold_lines: list[str] = []
         delivered_items = 0
         delivered_gold = 0
+        pending: Dict[int, tuple[RewardShare, list[str]]] = {}
         for share in shares:
-            character = characters.get(share.user_id)
-            if character is None:
+            if share.user_id not in characters:
+                continue
+            new_items = [format_item_label(item) for item in share.items]
+            if not new_items and not share.gold:
                 continue
-            new_inventory = list(character.inventory)
-            new_items: list[str] = []
-            for item in share.items:
-                label = format_item_label(item)
-                new_inventory.append(label)
-                new_items.append(label)
-            updated_character = replace(
-                character,
-                inventory=tuple(new_inventory),
-                gold_coins=character.gold_coins + share.gold,
+            pending[share.user_id] = (share, new_items)
+        if not pending:
+            return item_lines, gold_lines, (delivered_items, delivered_gold)
+
+        # Rewards are added to the characters as stored right now, not to the
+        # snapshot in ``characters``, so saves made since it was read survive.
+        try:
+            updated = await self.characters.update_many(
+                guild_id,
+                {
+                    user_id: partial(_grant_reward, items=tuple(new_items), gold=share.gold)
+                    for user_id, (share, new_items) in pending.items()
+                },
             )
-            try:
-                await self.characters.save(updated_character)
-            except Exception as exc:
-                log.warning(
-                    "Failed to persist rewards for user %s in guild %s: %s",
-                    share.user_id,
-                    guild_id,
-                    exc,
-                )
+        except Exception as exc:
+            log.warning(
+                "Failed to persist rewards for users %s in guild %s: %s",
+                ", ".join(str(user_id) for user_id in pending),
+                guild_id,
+                exc,
+            )
+            return item_lines, gold_lines, (delivered_items, delivered_gold)
+        for user_id, (share, new_items) in pending.items():
+            updated_character = updated.get(user_id)
+            if updated_character is None:
+                characters.pop(user_id, None)
                 continue
-            characters[share.user_id] = updated_character
+            characters[user_id] = updated_character
             if new_items:
                 item_lines.append(
                     f"• <@{share.user_id}> gains {', '.join(new_items)}"
@@ -1513,11 +2324,10 @@ class DungeonCog(commands.Cog):
         cog = get_cog("Tavern")
         if cog is None:
             return None
-        try:
-            from cogs.tavern import Tavern
-        except ImportError:  # pragma: no cover - defensive
+        tavern_cls = _tavern_cog_class()
+        if tavern_cls is None:
             return None
-        return cog if isinstance(cog, Tavern) else None
+        return cog if isinstance(cog, tavern_cls) else None
 
     async def _update_tavern_access(self, guild_id: Optional[int]) -> None:
         if guild_id is None:
@@ -1564,7 +2374,9 @@ class DungeonCog(commands.Cog):
 
         characters: Dict[int, Character] = {}
         if session.guild_id is not None:
-            characters = await self._load_party_characters(session.guild_id, party_snapshot)
+            characters = await self._load_party_characters_cached(
+                session.guild_id, tuple(party_snapshot), session.party_version
+            )
 
         rolls: list[tuple[int, int, int, int]] = []
         for user_id in party_snapshot:
@@ -1595,8 +2407,9 @@ class DungeonCog(commands.Cog):
         _, best_roll, best_mod, best_total = max(rolls, key=lambda entry: entry[3])
 
         passive_entries: list[tuple[str, int]] = []
-        monster_labels = self._unique_monster_labels(session.room.encounter.monsters)
-        for monster, label in zip(session.room.encounter.monsters, monster_labels):
+        monsters = session.room.encounter.monsters
+        monster_labels = self._unique_monster_labels(monsters)
+        for monster, label in zip(monsters, monster_labels):
             ability_scores = monster.ability_scores or {}
             wisdom_value: Optional[int] = None
             for ability_key, score in ability_scores.items():
@@ -1641,10 +2454,9 @@ class DungeonCog(commands.Cog):
             guild = self.bot.get_guild(session.guild_id)
         else:
             guild = None
-        for user_id in sorted(session.party_ids):
-            name = self._display_name_for_user(
-                user_id, interaction=interaction, guild=guild
-            )
+        party = session.party_snapshot()
+        names = self._display_names_for_users(party, guild=guild)
+        for user_id, name in zip(party, names):
             record = session.party_health.get(user_id)
             max_hp_value = DEFAULT_PLAYER_HP
             current_hp_value = DEFAULT_PLAYER_HP
@@ -1662,6 +2474,17 @@ class DungeonCog(commands.Cog):
             entries.append(f"• {name} [{current_hp_value}/{max_hp_value}]")
         return "\n".join(entries)
 
+    def _display_names_for_users(
+        self, user_ids: Sequence[int], *, guild: Optional[discord.Guild]
+    ) -> List[str]:
+        """Resolve display names for ``user_ids`` with the lookups bound once."""
+
+        get_member = guild.get_member if guild is not None else None
+        get_user = self.bot.get_user
+        return [
+            self._resolve_display_name(user_id, get_member, get_user) for user_id in user_ids
+        ]
+
     def _display_name_for_user(
         self,
         user_id: int,
@@ -1669,21 +2492,28 @@ class DungeonCog(commands.Cog):
         interaction: Optional[discord.Interaction] = None,
         guild: Optional[discord.Guild] = None,
     ) -> str:
-        name: Optional[str] = None
         lookup_guild = guild
         if lookup_guild is None and interaction is not None:
             lookup_guild = interaction.guild
-        if lookup_guild is not None:
-            member = lookup_guild.get_member(user_id)
+        get_member = lookup_guild.get_member if lookup_guild is not None else None
+        return self._resolve_display_name(user_id, get_member, self.bot.get_user)
+
+    @staticmethod
+    def _resolve_display_name(
+        user_id: int,
+        get_member: Optional[Callable[[int], Optional[discord.Member]]],
+        get_user: Callable[[int], Optional[discord.User]],
+    ) -> str:
+        """Prefer the guild member's name, then the cached user's, then a mention."""
+
+        if get_member is not None:
+            member = get_member(user_id)
             if member is not None:
-                name = member.display_name
-        if name is None:
-            user = self.bot.get_user(user_id)
-            if user is not None:
-                name = user.display_name
-        if name is None:
-            name = f"<@{user_id}>"
-        return name
+                return member.display_name
+        user = get_user(user_id)
+        if user is not None:
+            return user.display_name
+        return f"<@{user_id}>"
 
     def _ensure_room_trap_state(self, session: DungeonSession, room: Room) -> None:
         self._ensure_room_discovery_state(session, room)
@@ -1695,7 +2525,7 @@ class DungeonCog(commands.Cog):
             states.setdefault(trap.key, "hidden")
 
     def _ensure_room_discovery_state(self, session: DungeonSession, room: Room) -> None:
-        session.discovered_traps.setdefault(room.id, set())
+        session.discovered_traps.setdefault(room.id, frozenset())
         session.discovered_loot.setdefault(room.id, set())
         discovered_exits = session.discovered_exits.setdefault(room.id, set())
         visibility_map = session.exit_visibility.setdefault(room.id, {})
@@ -1753,21 +2583,60 @@ class DungeonCog(commands.Cog):
     def _set_trap_status(
         self, session: DungeonSession, room_id: int, trap_key: str, status: TrapStatus
     ) -> None:
-        states = session.trap_states.setdefault(room_id, {})
+        self._update_trap_status(
+            session.trap_states.setdefault(room_id, {}),
+            session.discovered_traps,
+            room_id,
+            session.disarmable_queue.setdefault(room_id, deque()),
+            trap_key,
+            status,
+        )
+
+    @staticmethod
+    def _update_trap_status(
+        states: Dict[str, TrapStatus],
+        discovered: MutableMapping[int, FrozenSet[str]],
+        room_id: int,
+        queue: Deque[str],
+        trap_key: str,
+        status: TrapStatus,
+    ) -> None:
+        """Record ``status`` against one room's already-resolved trap maps.
+
+        Discovery sets are immutable snapshots that are only swapped out when
+        their membership actually changes, so callers can compare them by
+        identity to tell whether anything new has been revealed.
+        """
+
         states[trap_key] = status
-        discovered = session.discovered_traps.setdefault(room_id, set())
+        known = discovered.get(room_id, frozenset())
         if status in {"discovered", "disarmed", "sprung"}:
-            discovered.add(trap_key)
-        elif status == "hidden":
-            discovered.discard(trap_key)
+            if trap_key not in known:
+                discovered[room_id] = known | {trap_key}
+        elif status == "hidden" and trap_key in known:
+            discovered[room_id] = known - {trap_key}
+        # Revealed, still-armed traps queue up in discovery order for disarming.
+        if status == "discovered":
+            if trap_key not in queue:
+                queue.append(trap_key)
+        elif trap_key in queue:
+            queue.remove(trap_key)
+
+    def _active_traps(self, session: DungeonSession, room: Room) -> Iterator[Trap]:
+        """Yield the room's traps that have not been disarmed or sprung yet."""
+
+        states = session.trap_states.get(room.id, {})
+        for trap in room.encounter.traps:
+            if states.get(trap.key, "hidden") not in ("disarmed", "sprung"):
+                yield trap
 
     def _room_has_discovered_traps(
         self, session: DungeonSession, room: Optional[Room] = None
     ) -> bool:
         target = room or session.room
         self._ensure_room_trap_state(session, target)
-        discovered = session.discovered_traps.get(target.id, set())
-        for trap in target.encounter.traps:
+        discovered = session.discovered_traps.get(target.id, frozenset())
+        for trap in self._active_traps(session, target):
             if trap.key in discovered:
                 return True
         return False
@@ -1792,22 +2661,37 @@ class DungeonCog(commands.Cog):
         trap: Trap,
         party_snapshot: tuple[int, ...],
     ) -> list[str]:
-        saving_throw_data = trap.saving_throw or {}
-        ability_value = saving_throw_data.get("ability", "DEX")
-        ability = str(ability_value).upper()
-        dc_raw = saving_throw_data.get("dc", 15)
-        try:
-            dc = int(dc_raw)
-        except (TypeError, ValueError):
-            dc = 15
-
-        ordered_party = party_snapshot or tuple(sorted(session.party_ids))
+        ordered_party = party_snapshot or session.party_snapshot()
         characters: Dict[int, Character] = {}
         if session.guild_id is not None and ordered_party:
-            characters = await self._load_party_characters(
-                session.guild_id, ordered_party
+            characters = await self._load_party_characters_cached(
+                session.guild_id, ordered_party, session.party_version
             )
 
+        trigger = self._compute_trap_trigger(
+            trap, ordered_party, characters, interaction=interaction
+        )
+        # Every party member's health changes land under a single lock acquisition.
+        async with self.sessions.lock:
+            lines, pending_deaths = self._apply_trap_trigger_batch(session, trigger)
+
+        for fallen in pending_deaths:
+            await self._announce_player_death(session, fallen)
+        return lines
+
+    def _compute_trap_trigger(
+        self,
+        trap: Trap,
+        party_snapshot: tuple[int, ...],
+        characters: Mapping[int, Character],
+        *,
+        interaction: Optional[discord.Interaction] = None,
+    ) -> TrapTrigger:
+        """Roll the trap's damage and each party member's save without touching the session."""
+
+        ability = trap.save_ability or "DEX"
+        dc = trap.save_dc if trap.save_dc is not None else 15
+
         damage_expression, damage_type = self._parse_trap_damage(trap)
         damage_amount = 0
         if damage_expression and damage_expression != "0":
@@ -1821,34 +2705,54 @@ class DungeonCog(commands.Cog):
                 )
             )
 
-        session.traps_triggered += 1
-        lines: list[str] = [f"The {trap.name} is sprung!"]
-        if trap.damage:
-            description = trap.damage
-            lines.append(f"It unleashes {description}.")
-        if not ordered_party:
-            return lines
-
-        lines.append(f"DC {dc} {ability} saving throws:")
-        pending_deaths: list[CombatantState] = []
-        for user_id in ordered_party:
+        trigger = TrapTrigger(trap=trap, ability=ability, dc=dc, damage_amount=damage_amount)
+        for user_id in party_snapshot:
             bonus = 0
             character = characters.get(user_id)
             if character is not None:
                 score = character.ability_scores.values.get(ability, 10)
                 bonus = ability_modifier(score)
             result = saving_throw(bonus, dc)
-            outcome = "success" if result.success else "failure"
-            name = self._display_name_for_user(
-                user_id, interaction=interaction
+            trigger.saves.append(
+                TrapSaveRoll(
+                    user_id=user_id,
+                    name=self._display_name_for_user(user_id, interaction=interaction),
+                    total=result.total,
+                    success=result.success,
+                    character=character,
+                )
             )
-            stored_health = session.party_health.get(user_id)
+        return trigger
 
-            def _coerce_int(value: object, default: int) -> int:
-                try:
-                    return int(value)
-                except (TypeError, ValueError):
-                    return default
+    def _apply_trap_trigger_batch(
+        self, session: DungeonSession, trigger: TrapTrigger
+    ) -> tuple[list[str], list[CombatantState]]:
+        """Apply a rolled trap to the session and return summary lines and new deaths."""
+
+        trap = trigger.trap
+        damage_amount = trigger.damage_amount
+        session.traps_triggered += 1
+        lines: list[str] = [f"The {trap.name} is sprung!"]
+        if trap.damage:
+            description = trap.damage
+            lines.append(f"It unleashes {description}.")
+        if not trigger.saves:
+            return lines, []
+
+        def _coerce_int(value: object, default: int) -> int:
+            try:
+                return int(value)
+            except (TypeError, ValueError):
+                return default
+
+        lines.append(f"DC {trigger.dc} {trigger.ability} saving throws:")
+        pending_deaths: list[CombatantState] = []
+        for save in trigger.saves:
+            user_id = save.user_id
+            character = save.character
+            name = save.name
+            outcome = "success" if save.success else "failure"
+            stored_health = session.party_health.get(user_id)
 
             max_hp_value = DEFAULT_PLAYER_HP
             current_hp_value = DEFAULT_PLAYER_HP
@@ -1881,7 +2785,7 @@ class DungeonCog(commands.Cog):
             post_hp = current_hp_value
             actual_damage = 0
             if damage_amount:
-                damage_taken = damage_amount if not result.success else damage_amount // 2
+                damage_taken = damage_amount if not save.success else damage_amount // 2
                 damage_taken = max(0, damage_taken)
                 if damage_taken:
                     post_hp = max(0, current_hp_value - damage_taken)
@@ -1903,7 +2807,7 @@ class DungeonCog(commands.Cog):
                                 is_player=True,
                                 user_id=user_id,
                             )
-                            death_state.conditions.add("Dead")
+                            death_state.conditions.add(Condition.DEAD)
                             death_state.death_save_failures = 3
                             key = self._fallen_identifier(death_state)
                             if key not in session.fallen_players:
@@ -1911,7 +2815,7 @@ class DungeonCog(commands.Cog):
                                 pending_deaths.append(death_state)
                 else:
                     post_hp = current_hp_value
-            line = f"• {name}: {result.total} ({outcome})"
+            line = f"• {name}: {save.total} ({outcome})"
             if damage_amount:
                 if damage_taken:
                     line += f" — {damage_taken} damage"
@@ -1925,10 +2829,7 @@ class DungeonCog(commands.Cog):
             else:
                 line += f" — {post_hp}/{max_hp_value} HP"
             lines.append(line)
-
-        for fallen in pending_deaths:
-            await self._announce_player_death(session, fallen)
-        return lines
+        return lines, pending_deaths
 
     def _roll_damage(
         self,
@@ -1936,35 +2837,28 @@ class DungeonCog(commands.Cog):
         *,
         critical: bool = False,
         extra_dice: Optional[Sequence[str]] = None,
+        rng: Optional[random.Random] = None,
     ) -> int:
-        match = _DAMAGE_ROLL_PATTERN.fullmatch(expression.strip())
-        if match:
-            count = max(1, int(match.group("count")))
-            sides = max(1, int(match.group("sides")))
-            modifier = int(match.group("modifier") or 0)
-            rolls = [
-                random.randint(1, sides)
-                for _ in range(count * (2 if critical else 1))
-            ]
-            total = sum(rolls) + modifier
+        multiplier = 2 if critical else 1
+        parsed = _parse_damage(expression.strip())
+        if parsed:
+            count, sides, modifier = parsed
+            total = _roll_dice(count * multiplier, sides, rng) + modifier
         else:
-            total = random.randint(1, 8)
+            total = _roll_dice(1, 8, rng)
         if extra_dice:
             for dice_expression in extra_dice:
-                text = str(dice_expression)
-                extra_match = _DAMAGE_ROLL_PATTERN.fullmatch(text.strip())
-                if not extra_match:
+                extra_parsed = _parse_damage(str(dice_expression).strip())
+                if not extra_parsed:
                     continue
-                extra_count = max(1, int(extra_match.group("count")))
-                extra_sides = max(1, int(extra_match.group("sides")))
-                extra_modifier = int(extra_match.group("modifier") or 0)
-                extra_rolls = [
-                    random.randint(1, extra_sides)
-                    for _ in range(extra_count * (2 if critical else 1))
-                ]
-                total += sum(extra_rolls) + extra_modifier
+                extra_count, extra_sides, extra_modifier = extra_parsed
+                total += _roll_dice(extra_count * multiplier, extra_sides, rng) + extra_modifier
         return max(0, total)
 
+    @staticmethod
+    def _session_rng(session: Optional[DungeonSession]) -> Optional[random.Random]:
+        return session.rng if session is not None else None
+
     def _trim_combat_log(self, state: CombatState) -> None:
         excess = len(state.log) - MAX_COMBAT_LOG_ENTRIES
         if excess > 0:
@@ -2014,14 +2908,21 @@ class DungeonCog(commands.Cog):
         metadata = combatant.metadata
         metadata["current_hp"] = combatant.current_hp
         metadata["max_hp"] = combatant.max_hp
-        metadata["conditions"] = sorted(combatant.conditions)
+        metadata["conditions"] = combatant.condition_names()
         metadata["concentration"] = combatant.concentration
         metadata["resources"] = combatant.resources
-        metadata["death_saves"] = {
-            "successes": combatant.death_save_successes,
-            "failures": combatant.death_save_failures,
-            "stable": combatant.stable,
-        }
+        death_saves = metadata.get("death_saves")
+        if not (
+            isinstance(death_saves, dict)
+            and death_saves.get("successes") == combatant.death_save_successes
+            and death_saves.get("failures") == combatant.death_save_failures
+            and death_saves.get("stable") == combatant.stable
+        ):
+            metadata["death_saves"] = {
+                "successes": combatant.death_save_successes,
+                "failures": combatant.death_save_failures,
+                "stable": combatant.stable,
+            }
         metadata["is_dead"] = combatant.is_dead
         if session is not None:
             self._update_party_health_tracking(session, combatant)
@@ -2040,27 +2941,27 @@ class DungeonCog(commands.Cog):
         previous = combatant.current_hp
         combatant.current_hp = max(0, combatant.current_hp - amount)
         if combatant.current_hp <= 0:
-            combatant.conditions.add("Unconscious")
+            combatant.conditions.add(Condition.UNCONSCIOUS)
             combatant.concentration = None
             if combatant.is_player and previous > 0:
                 combatant.death_save_successes = 0
                 combatant.death_save_failures = 0
                 combatant.stable = False
         else:
-            combatant.conditions.discard("Unconscious")
+            combatant.conditions.discard(Condition.UNCONSCIOUS)
         dealt = previous - combatant.current_hp
         if combatant.is_player and previous <= 0 and dealt > 0:
             combatant.stable = False
             failures = 2 if critical else 1
             combatant.death_save_failures = min(3, combatant.death_save_failures + failures)
         if combatant.is_player and combatant.death_save_failures >= 3:
-            combatant.conditions.add("Dead")
-            combatant.conditions.discard("Unconscious")
+            combatant.conditions.add(Condition.DEAD)
+            combatant.conditions.discard(Condition.UNCONSCIOUS)
         if combatant.is_player and combatant.current_hp > 0:
             combatant.death_save_successes = 0
             combatant.death_save_failures = 0
             combatant.stable = False
-            combatant.conditions.discard("Dead")
+            combatant.conditions.discard(Condition.DEAD)
         self._sync_combatant_state(combatant, session)
         if session is not None and combatant.is_player:
             self._record_room_damage(session, dealt, source=source)
@@ -2077,8 +2978,7 @@ class DungeonCog(commands.Cog):
         previous = combatant.current_hp
         combatant.current_hp = min(combatant.max_hp, combatant.current_hp + amount)
         if combatant.current_hp > 0:
-            combatant.conditions.discard("Unconscious")
-            combatant.conditions.discard("Dead")
+            combatant.conditions.discard(Condition.UNCONSCIOUS | Condition.DEAD)
             combatant.death_save_successes = 0
             combatant.death_save_failures = 0
             combatant.stable = False
@@ -2100,23 +3000,18 @@ class DungeonCog(commands.Cog):
             player.death_save_successes = 0
             player.death_save_failures = 0
             player.stable = False
-            player.conditions.discard("Unconscious")
-            player.conditions.discard("Dead")
+            player.conditions.discard(Condition.UNCONSCIOUS | Condition.DEAD)
             message.append(f"{player.name} surges back to life with 1 HP!")
-        elif roll == 1:
-            player.death_save_failures = min(3, player.death_save_failures + 2)
-            player.stable = False
-            message.append("Critical failure—two death save failures recorded.")
-        elif roll >= 10:
-            player.death_save_successes = min(3, player.death_save_successes + 1)
-            message.append("Success!")
         else:
-            player.death_save_failures = min(3, player.death_save_failures + 1)
-            player.stable = False
-            message.append("Failure.")
+            successes, failures, outcome = _DEATH_SAVE_STEPS[roll]
+            player.death_save_successes = min(3, player.death_save_successes + successes)
+            player.death_save_failures = min(3, player.death_save_failures + failures)
+            if failures:
+                player.stable = False
+            message.append(outcome)
         if player.death_save_failures >= 3:
-            player.conditions.add("Dead")
-            player.conditions.discard("Unconscious")
+            player.conditions.add(Condition.DEAD)
+            player.conditions.discard(Condition.UNCONSCIOUS)
             message.append(f"{player.name} succumbs to their wounds.")
         elif roll != 20 and player.death_save_successes >= 3:
             player.stable = True
@@ -2205,23 +3100,23 @@ class DungeonCog(commands.Cog):
         *,
         update: bool = True,
     ) -> Optional[CombatantState]:
-        enemies = [
-            combatant
-            for combatant in state.order
-            if not combatant.is_player and not combatant.defeated
-        ]
-        if not enemies:
+        selected = player.selected_target
+        first: Optional[CombatantState] = None
+        chosen: Optional[CombatantState] = None
+        for enemy in state.iter_living(players=False):
+            if first is None:
+                first = enemy
+                if not selected:
+                    break
+            if enemy.identifier == selected:
+                chosen = enemy
+                break
+        if first is None:
             if update:
                 player.selected_target = None
             return None
-        chosen: Optional[CombatantState] = None
-        if player.selected_target:
-            for enemy in enemies:
-                if enemy.identifier == player.selected_target:
-                    chosen = enemy
-                    break
         if chosen is None and update:
-            chosen = enemies[0]
+            chosen = first
         if chosen is not None and update:
             player.selected_target = chosen.identifier
         return chosen
@@ -2236,15 +3131,12 @@ class DungeonCog(commands.Cog):
         requirement_type = str(requirement.get("type", "")).lower()
         if requirement_type == "spell_slot":
             level_value = requirement.get("level", 1)
-            level_key = str(level_value)
             try:
                 amount = max(1, int(requirement.get("amount", 1)))
             except (TypeError, ValueError):
                 amount = 1
             slots = player.resources.setdefault("spell_slots", {})
-            slot_entry = slots.get(level_key)
-            if slot_entry is None and level_key.isdigit():
-                slot_entry = slots.get(int(level_key))
+            slot_entry = slots.get(self._slot_key(level_value))
             if not isinstance(slot_entry, MutableMapping):
                 return False, f"You have no level {level_value} spell slots remaining."
             available = int(slot_entry.get("available", slot_entry.get("remaining", 0)))
@@ -2280,6 +3172,19 @@ class DungeonCog(commands.Cog):
             return True, None
         return False, "This action cannot be resolved because its resource type is unknown."
 
+    @staticmethod
+    def _slot_key(level: object) -> str:
+        return str(level)
+
+    @staticmethod
+    def _normalise_spell_slot_keys(resources: MutableMapping[str, object]) -> None:
+        slots = resources.get("spell_slots")
+        if not isinstance(slots, MutableMapping):
+            return
+        stray = [key for key in slots if not isinstance(key, str)]
+        for key in stray:
+            slots.setdefault(str(key), slots.pop(key))
+
     def _resource_status_text(
         self, player: CombatantState, requirement: Optional[Mapping[str, object]]
     ) -> Optional[str]:
@@ -2289,9 +3194,7 @@ class DungeonCog(commands.Cog):
         if requirement_type == "spell_slot":
             level_value = requirement.get("level", 1)
             slots = player.resources.get("spell_slots", {})
-            slot_entry = slots.get(str(level_value))
-            if slot_entry is None and str(level_value).isdigit():
-                slot_entry = slots.get(int(level_value))
+            slot_entry = slots.get(self._slot_key(level_value))
             if isinstance(slot_entry, Mapping):
                 available = slot_entry.get("available")
                 max_uses = slot_entry.get("max")
@@ -2320,7 +3223,8 @@ class DungeonCog(commands.Cog):
         spell_slots = combatant.resources.get("spell_slots")
         if isinstance(spell_slots, Mapping):
             slot_parts: List[str] = []
-            for level_key, payload in sorted(spell_slots.items(), key=lambda item: str(item[0])):
+            for level_key in _SPELL_SLOT_LEVELS:
+                payload = spell_slots.get(level_key)
                 if not isinstance(payload, Mapping):
                     continue
                 available = payload.get("available")
@@ -2343,10 +3247,10 @@ class DungeonCog(commands.Cog):
         return " | ".join(parts) if parts else None
 
     def _any_players_alive(self, state: CombatState) -> bool:
-        return any(combatant.is_player and not combatant.defeated for combatant in state.order)
+        return state.any_living(players=True)
 
     def _any_monsters_alive(self, state: CombatState) -> bool:
-        return any((not combatant.is_player) and not combatant.defeated for combatant in state.order)
+        return state.any_living(players=False)
 
     def _ensure_current_combatant(self, state: CombatState) -> Optional[CombatantState]:
         current = state.current_combatant()
@@ -2367,9 +3271,10 @@ class DungeonCog(commands.Cog):
                 self._update_party_health_tracking(session, combatant)
         if victory:
             state.log.append("The party is victorious!")
-            encounter = session.room.encounter
+            room = session.room
+            encounter = room.encounter
             session.monsters_defeated += len(encounter.monsters)
-            session.room.encounter = replace(
+            room.encounter = replace(
                 encounter,
                 monsters=tuple(),
             )
@@ -2386,60 +3291,174 @@ class DungeonCog(commands.Cog):
             self._finish_combat(session, state, victory=False)
 
     @staticmethod
-    def _normalise_damage_traits(value: object) -> Set[str]:
-        traits: Set[str] = set()
+    def _normalise_damage_traits(value: object) -> FrozenSet[str]:
         if not value:
-            return traits
+            return frozenset()
         if isinstance(value, str):
-            cleaned = value.strip().lower()
-            if cleaned:
-                traits.add(cleaned)
-            return traits
+            cleaned = _damage_type_key(value)
+            return frozenset((cleaned,)) if cleaned else frozenset()
         if isinstance(value, Mapping):
             iterable = value.values()
-        elif isinstance(value, Iterable) and not isinstance(value, (str, bytes)):
+        elif isinstance(value, Iterable) and not isinstance(value, bytes):
             iterable = value
         else:
-            return traits
-        for entry in iterable:
-            if not entry:
-                continue
-            cleaned = str(entry).strip().lower()
-            if cleaned:
-                traits.add(cleaned)
-        return traits
+            return frozenset()
+        traits = frozenset(_damage_type_key(entry) for entry in iterable)
+        return traits - {None} if None in traits else traits  # type: ignore[return-value]
+
+    def _damage_traits(
+        self, combatant: CombatantState
+    ) -> Tuple[FrozenSet[str], FrozenSet[str], FrozenSet[str]]:
+        """Return the combatant's normalised (resistances, vulnerabilities, immunities)."""
+
+        metadata = combatant.metadata
+        sources = (
+            metadata.get("resistances"),
+            metadata.get("vulnerabilities"),
+            metadata.get("immunities"),
+        )
+        return combatant.derived(
+            "damage_traits",
+            sources,
+            lambda: tuple(  # type: ignore[return-value]
+                self._normalise_damage_traits(value) for value in sources
+            ),
+        )
 
     @staticmethod
     def _monster_action_key(action: Mapping[str, object]) -> str:
         key = action.get("key") or action.get("name")
         return str(key).lower() if key is not None else ""
 
-    def _monster_actions(self, monster: CombatantState) -> List[Mapping[str, object]]:
+    def _monster_actions(self, monster: CombatantState) -> Tuple[Mapping[str, object], ...]:
         actions_raw = monster.metadata.get("actions")
-        actions: List[Mapping[str, object]] = []
-        if isinstance(actions_raw, Sequence) and not isinstance(actions_raw, (str, bytes)):
-            for entry in actions_raw:
-                if isinstance(entry, Mapping):
-                    actions.append(entry)
-        return actions
 
+        def build() -> Tuple[Mapping[str, object], ...]:
+            if isinstance(actions_raw, Sequence) and not isinstance(actions_raw, (str, bytes)):
+                return tuple(entry for entry in actions_raw if isinstance(entry, Mapping))
+            return ()
+
+        return monster.derived("actions", (actions_raw,), build)
+
+    def _monster_action_index(
+        self, monster: CombatantState, actions: Sequence[Mapping[str, object]]
+    ) -> Mapping[str, Mapping[str, object]]:
+        """Map action keys to actions, keeping the first action listed for each key."""
+
+        def build() -> Dict[str, Mapping[str, object]]:
+            index: Dict[str, Mapping[str, object]] = {}
+            for action in actions:
+                index.setdefault(self._monster_action_key(action), action)
+            return index
+
+        return monster.derived("action_index", (actions,), build)
+
+    @staticmethod
     def _find_monster_action(
-        self, actions: Sequence[Mapping[str, object]], reference: object
+        index: Mapping[str, Mapping[str, object]], reference: object
     ) -> Optional[Mapping[str, object]]:
         if reference is None:
             return None
-        key = str(reference).lower()
-        for action in actions:
-            if self._monster_action_key(action) == key:
-                return action
-        return None
+        return index.get(str(reference).lower())
 
     def _expand_multiattack_actions(
         self, monster: CombatantState, actions: Sequence[Mapping[str, object]]
-    ) -> List[Mapping[str, object]]:
+    ) -> Tuple[Mapping[str, object], ...]:
         multiattack_raw = monster.metadata.get("multiattack")
         if not multiattack_raw:
-            return []
+            return ()
+        return monster.derived(
+            "multiattack",
+            (multiattack_raw, actions),
+            lambda: tuple(
+                self._build_multiattack_actions(
+                    multiattack_raw, self._monster_action_index(monster, actions)
+                )
+            ),
+        )
+
+    def _monster_plan(self, monster: CombatantState) -> MonsterActionPlan:
+        metadata = monster.metadata
+        actions = self._monster_actions(monster)
+        multiattack = self._expand_multiattack_actions(monster, actions)
+        # Attack profiles fall back to these monster-level fields.
+        sources = (
+            actions,
+            multiattack,
+            monster.name,
+            metadata.get("attack_name"),
+            metadata.get("weapon_name"),
+            metadata.get("attack_bonus"),
+            metadata.get("damage"),
+            metadata.get("damage_type"),
+            metadata.get("save_dc"),
+            metadata.get("save_ability"),
+        )
+
+        def build() -> MonsterActionPlan:
+            if multiattack:
+                return MonsterActionPlan(
+                    kind=ActionKind.MULTIATTACK,
+                    name="",
+                    attacks=tuple(
+                        self._monster_attack_profile(monster, action) for action in multiattack
+                    ),
+                )
+            action = self._choose_monster_action(monster, actions)
+            action_type = str(action.get("type", "attack")).lower() if action else "attack"
+            name = str(action.get("name", action_type.title())) if action else action_type.title()
+            if action_type == "save":
+                return MonsterActionPlan(
+                    kind=ActionKind.SAVE,
+                    name=name,
+                    action=action,
+                    save=self._monster_save_profile(monster, action or {}),
+                )
+            if action_type == "auto":
+                return MonsterActionPlan(kind=ActionKind.AUTO, name=name, action=action)
+            return MonsterActionPlan(
+                kind=ActionKind.ATTACK,
+                name=name,
+                action=action,
+                attacks=(self._monster_attack_profile(monster, action),),
+            )
+
+        return monster.derived("plan", sources, build)
+
+    @staticmethod
+    def _condition_names(conditions: object) -> Tuple[str, ...]:
+        if not conditions:
+            return ()
+        if isinstance(conditions, str):
+            conditions = (conditions,)
+        elif not isinstance(conditions, Iterable) or isinstance(conditions, bytes):
+            return ()
+        names = (str(condition).strip() for condition in conditions if condition)
+        return tuple(name for name in names if name)
+
+    def _monster_save_profile(
+        self, monster: CombatantState, action: Mapping[str, object]
+    ) -> SaveActionProfile:
+        metadata = monster.metadata
+        ability = action.get("save_ability", metadata.get("save_ability", "DEX"))
+        return SaveActionProfile(
+            name=str(action.get("name", f"{monster.name}'s spell")),
+            dc=int(action.get("save_dc", metadata.get("save_dc", 10))),
+            ability=sys.intern(str(ability).upper()),
+            damage=str(action.get("damage", metadata.get("damage", "1d6+1"))),
+            damage_type=_damage_type_key(action.get("damage_type", metadata.get("damage_type"))),
+            half_on_success=bool(action.get("half_on_success")),
+            success_conditions=self._condition_names(action.get("success_conditions")),
+            fail_conditions=self._condition_names(
+                action.get("fail_conditions")
+                or action.get("conditions_on_fail")
+                or action.get("conditions")
+            ),
+        )
+
+    def _build_multiattack_actions(
+        self, multiattack_raw: object, index: Mapping[str, Mapping[str, object]]
+    ) -> List[Mapping[str, object]]:
         if isinstance(multiattack_raw, Mapping):
             payload = multiattack_raw.get("attacks") or multiattack_raw.get("actions")
         else:
@@ -2455,7 +3474,7 @@ class DungeonCog(commands.Cog):
                 except (TypeError, ValueError):
                     repeats = 1
                 if "ref" in entry:
-                    ref = self._find_monster_action(actions, entry.get("ref"))
+                    ref = self._find_monster_action(index, entry.get("ref"))
                     if ref is None:
                         continue
                     for _ in range(repeats):
@@ -2464,35 +3483,43 @@ class DungeonCog(commands.Cog):
                     for _ in range(repeats):
                         expanded.append(entry)
             elif isinstance(entry, str):
-                ref = self._find_monster_action(actions, entry)
+                ref = self._find_monster_action(index, entry)
                 if ref is not None:
                     expanded.append(ref)
         return expanded
 
-    def _create_monster_attack(
+    def _monster_attack_profile(
         self,
         monster: CombatantState,
         action: Optional[Mapping[str, object]],
-    ) -> tuple[Attack, Tuple[str, ...]]:
+    ) -> _AttackProfile:
+        """Return the action's attack with unrolled damage, its damage dice and extra crit dice."""
+
         metadata = monster.metadata
         action_data: Mapping[str, object] = action or {}
-        name = str(
-            action_data.get(
-                "name",
+        # Fall back to the monster's metadata only when the action leaves a field
+        # unset, so the default name is not formatted for every named action.
+        name_raw = action_data.get("name")
+        if name_raw is None:
+            name_raw = (
                 metadata.get("attack_name")
                 or metadata.get("weapon_name")
-                or f"{monster.name} Attack",
+                or f"{monster.name} Attack"
             )
-        )
+        name = str(name_raw)
+        bonus_raw = action_data.get("attack_bonus")
         try:
-            attack_bonus = int(action_data.get("attack_bonus", metadata.get("attack_bonus", 0)))
+            attack_bonus = int(
+                bonus_raw if bonus_raw is not None else metadata.get("attack_bonus", 0)
+            )
         except (TypeError, ValueError):
             attack_bonus = int(metadata.get("attack_bonus", 0))
-        damage_expr = str(action_data.get("damage", metadata.get("damage", "1d6+1")))
-        damage_type_raw = action_data.get("damage_type", metadata.get("damage_type"))
-        damage_type = str(damage_type_raw).lower() if damage_type_raw else None
-        base_damage = self._roll_damage(damage_expr)
-        packet = DamagePacket(amount=base_damage, damage_type=damage_type)
+        damage_raw = action_data.get("damage")
+        damage_expr = str(damage_raw if damage_raw is not None else metadata.get("damage", "1d6+1"))
+        damage_type_raw = action_data.get("damage_type")
+        if damage_type_raw is None:
+            damage_type_raw = metadata.get("damage_type")
+        packet = DamagePacket(amount=0, damage_type=_damage_type_key(damage_type_raw))
         advantage_sources = ()
         disadvantage_sources = ()
         advantage_raw = action_data.get("advantage")
@@ -2515,7 +3542,52 @@ class DungeonCog(commands.Cog):
             disadvantage_sources=disadvantage_sources,
             critical_double=critical_double,
         )
-        return attack, extra_dice
+        return attack, damage_expr, extra_dice
+
+    def _roll_monster_swing(
+        self,
+        attack: Attack,
+        damage_expr: str,
+        extra_dice: Sequence[str],
+        target_ac: int,
+        *,
+        rng: Optional[random.Random],
+        resistances: Iterable[str],
+        vulnerabilities: Iterable[str],
+        immunities: Iterable[str],
+    ) -> Tuple[AttackRollResult, int]:
+        """Roll to hit, then roll damage only for a swing that lands."""
+
+        roll = attack_roll(
+            attack.attack_bonus,
+            target_ac,
+            rng=rng,
+            advantage_state=resolve_advantage_state(
+                attack.advantage_sources, attack.disadvantage_sources
+            ),
+        )
+        if not roll.hits:
+            return roll, 0
+        damage_type = attack.damage_packets[0].damage_type
+        base_damage = self._roll_damage(damage_expr, rng=rng)
+        damage = apply_damage(
+            (DamagePacket(amount=base_damage, damage_type=damage_type),),
+            resistances=resistances,
+            vulnerabilities=vulnerabilities,
+            immunities=immunities,
+        )
+        if roll.is_critical_hit and attack.critical_double:
+            damage *= 2
+        if extra_dice:
+            extra_total = sum(self._roll_damage(str(dice), rng=rng) for dice in extra_dice)
+            if extra_total:
+                damage += apply_damage(
+                    (DamagePacket(amount=extra_total, damage_type=damage_type),),
+                    resistances=resistances,
+                    vulnerabilities=vulnerabilities,
+                    immunities=immunities,
+                )
+        return roll, damage
 
     def _apply_conditions_to_target(
         self, target: CombatantState, conditions: object
@@ -2541,17 +3613,21 @@ class DungeonCog(commands.Cog):
             return ", ".join(applied)
         return None
 
-    @staticmethod
     def _choose_monster_action(
-        actions: Sequence[Mapping[str, object]]
+        self, monster: CombatantState, actions: Sequence[Mapping[str, object]]
     ) -> Optional[Mapping[str, object]]:
-        if not actions:
-            return None
-        priority = {"melee": 0, "attack": 0, "ranged": 1, "spell": 2, "save": 3, "auto": 4}
-        return min(
-            actions,
-            key=lambda action: priority.get(str(action.get("type", "attack")).lower(), 5),
-        )
+        """Return the highest-priority action, preferring the first listed on ties."""
+
+        def build() -> Optional[Mapping[str, object]]:
+            if not actions:
+                return None
+            priorities = [
+                _MONSTER_ACTION_PRIORITY.get(str(action.get("type", "attack")).lower(), 5)
+                for action in actions
+            ]
+            return actions[priorities.index(min(priorities))]
+
+        return monster.derived("preferred_action", (actions,), build)
 
     def _resolve_monster_action(
         self,
@@ -2560,11 +3636,7 @@ class DungeonCog(commands.Cog):
         *,
         session: Optional[DungeonSession] = None,
     ) -> Optional[str]:
-        potential_targets = [
-            combatant
-            for combatant in state.order
-            if combatant.is_player and not combatant.is_dead
-        ]
+        potential_targets = state.contenders(players=True)
         if not potential_targets:
             state.current_action = {
                 "actor": monster.name,
@@ -2575,78 +3647,27 @@ class DungeonCog(commands.Cog):
                 "team": "enemy",
             }
             return None
-        conscious_targets = [target for target in potential_targets if target.current_hp > 0]
-        if conscious_targets:
-            target = random.choice(conscious_targets)
-        else:
-            target = random.choice(potential_targets)
-        actions = self._monster_actions(monster)
-        multiattack = self._expand_multiattack_actions(monster, actions)
-        target_ac = int(target.metadata.get("armor_class", DEFAULT_PLAYER_ARMOR_CLASS))
-        resistances = self._normalise_damage_traits(target.metadata.get("resistances"))
-        vulnerabilities = self._normalise_damage_traits(target.metadata.get("vulnerabilities"))
-        immunities = self._normalise_damage_traits(target.metadata.get("immunities"))
-        message: Optional[str]
+        # Downed players are only struck once nobody is left standing.
+        target = (self._session_rng(session) or random).choice(
+            [target for target in potential_targets if target.current_hp > 0]
+            or potential_targets
+        )
+        plan = self._monster_plan(monster)
+        defenses = TargetDefenses(
+            int(target.metadata.get("armor_class", DEFAULT_PLAYER_ARMOR_CLASS)),
+            *self._damage_traits(target),
+        )
+        handler_name, summary = self._MONSTER_ACTION_ROUTES[plan.kind]
         action_payload = {
             "actor": monster.name,
             "state": "monster action",
-            "summary": f"Strikes at {target.name}",
+            "summary": summary.format(target=target.name, action=plan.name),
             "emoji": "👹",
             "team": "enemy",
         }
-        if multiattack:
-            action_payload["summary"] = f"Unleashing a flurry against {target.name}"
-            message = self._execute_monster_multiattack(
-                session,
-                monster,
-                target,
-                multiattack,
-                target_ac=target_ac,
-                resistances=resistances,
-                vulnerabilities=vulnerabilities,
-                immunities=immunities,
-            )
-        else:
-            action = self._choose_monster_action(actions)
-            action_type = str(action.get("type", "attack")).lower() if action else "attack"
-            if action_type == "save":
-                message = self._execute_monster_save_action(
-                    session,
-                    monster,
-                    target,
-                    action,
-                    resistances=resistances,
-                    vulnerabilities=vulnerabilities,
-                    immunities=immunities,
-                )
-            elif action_type == "auto":
-                message = self._execute_monster_auto_action(
-                    session,
-                    monster,
-                    target,
-                    action,
-                    resistances=resistances,
-                    vulnerabilities=vulnerabilities,
-                    immunities=immunities,
-                )
-            else:
-                message = self._execute_monster_attack_action(
-                    session,
-                    monster,
-                    target,
-                    action,
-                    target_ac=target_ac,
-                    resistances=resistances,
-                    vulnerabilities=vulnerabilities,
-                    immunities=immunities,
-                )
-            action_name = str(action.get("name", action_type.title())) if action else action_type.title()
-            if action_type == "save":
-                action_payload["summary"] = f"Forcing {target.name} to resist {action_name}"
-            elif action_type == "auto":
-                action_payload["summary"] = f"Unleashing {action_name} on {target.name}"
-            else:
-                action_payload["summary"] = f"Striking {target.name} with {action_name}"
+        message: Optional[str] = getattr(self, handler_name)(
+            session, monster, target, plan, defenses
+        )
         if not message:
             message = f"{monster.name} hesitates, accomplishing nothing."
         action_payload["detail"] = message
@@ -2655,136 +3676,124 @@ class DungeonCog(commands.Cog):
         self._trim_combat_log(state)
         return message
 
+    # Executor and current-action summary for each kind of monster turn. Every
+    # executor is called as ``(session, monster, target, plan, defenses)``.
+    _MONSTER_ACTION_ROUTES: Mapping[ActionKind, Tuple[str, str]] = MappingProxyType({
+        ActionKind.ATTACK: ("_execute_monster_attack_action", "Striking {target} with {action}"),
+        ActionKind.SAVE: ("_execute_monster_save_action", "Forcing {target} to resist {action}"),
+        ActionKind.AUTO: ("_execute_monster_auto_action", "Unleashing {action} on {target}"),
+        ActionKind.MULTIATTACK: (
+            "_execute_monster_multiattack",
+            "Unleashing a flurry against {target}",
+        ),
+    })
+
+    def _deal_monster_damage(
+        self,
+        session: Optional[DungeonSession],
+        target: CombatantState,
+        damage: int,
+        *,
+        critical: bool = False,
+    ) -> int:
+        """Apply resolved monster damage to ``target`` and return what landed.
+
+        Every monster executor funnels through here so the "hitting a downed
+        creature counts as a critical" rule lives in one place.
+        """
+
+        if damage <= 0:
+            return 0
+        return self._apply_damage_to_combatant(
+            session,
+            target,
+            damage,
+            critical=critical or target.current_hp <= 0,
+            source="monster",
+        )
+
+    def _land_monster_swing(
+        self,
+        session: Optional[DungeonSession],
+        target: CombatantState,
+        profile: _AttackProfile,
+        defenses: TargetDefenses,
+        *,
+        rng: Optional[random.Random],
+    ) -> Tuple[AttackRollResult, int]:
+        """Roll one compiled attack against ``target`` and apply any damage."""
+
+        attack, damage_expr, extra_dice = profile
+        roll, pending_damage = self._roll_monster_swing(
+            attack,
+            damage_expr,
+            extra_dice,
+            defenses.armor_class,
+            rng=rng,
+            resistances=defenses.resistances,
+            vulnerabilities=defenses.vulnerabilities,
+            immunities=defenses.immunities,
+        )
+        if not roll.hits:
+            return roll, 0
+        dealt = self._deal_monster_damage(
+            session, target, pending_damage, critical=roll.is_critical_hit
+        )
+        return roll, dealt
+
     def _execute_monster_multiattack(
         self,
         session: Optional[DungeonSession],
         monster: CombatantState,
         target: CombatantState,
-        actions: Sequence[Mapping[str, object]],
-        *,
-        target_ac: int,
-        resistances: Iterable[str],
-        vulnerabilities: Iterable[str],
-        immunities: Iterable[str],
+        plan: MonsterActionPlan,
+        defenses: TargetDefenses,
     ) -> str:
+        rng = self._session_rng(session)
         parts: List[str] = []
-        for action in actions:
-            attack, extra_dice = self._create_monster_attack(monster, action)
-            outcome = resolve_attack(
-                attack,
-                target_ac,
-                resistances=resistances,
-                vulnerabilities=vulnerabilities,
-                immunities=immunities,
-            )
-            pending_damage = outcome.damage
-            if outcome.roll_result.hits and extra_dice:
-                damage_type = attack.damage_packets[0].damage_type
-                extra_packets = [
-                    DamagePacket(
-                        amount=self._roll_damage(str(dice)),
-                        damage_type=damage_type,
-                    )
-                    for dice in extra_dice
-                ]
-                if extra_packets:
-                    pending_damage += apply_damage(
-                        extra_packets,
-                        resistances=resistances,
-                        vulnerabilities=vulnerabilities,
-                        immunities=immunities,
-                    )
-            dealt = 0
-            if outcome.roll_result.hits and pending_damage > 0:
-                was_unconscious = target.current_hp <= 0
-                dealt = self._apply_damage_to_combatant(
-                    session,
-                    target,
-                    pending_damage,
-                    critical=outcome.roll_result.is_critical_hit or was_unconscious,
-                    source="monster",
-                )
-            if outcome.roll_result.hits:
-                text = (
+        for profile in plan.attacks:
+            attack = profile[0]
+            roll, dealt = self._land_monster_swing(session, target, profile, defenses, rng=rng)
+            if roll.hits:
+                parts.append(
                     f"{attack.name} hits {target.name} for {dealt} damage "
-                    f"(Attack {outcome.roll_result.total} vs AC {target_ac})."
+                    f"(Attack {roll.total} vs AC {defenses.armor_class})."
+                    f"{_CRITICAL_HIT_SUFFIX if roll.is_critical_hit else ''}"
                 )
-                if outcome.roll_result.is_critical_hit:
-                    text += " Critical hit!"
             else:
-                text = (
+                parts.append(
                     f"{attack.name} misses {target.name} "
-                    f"(Attack {outcome.roll_result.total} vs AC {target_ac})."
+                    f"(Attack {roll.total} vs AC {defenses.armor_class})."
                 )
-            parts.append(text)
             if target.is_dead:
                 break
         if not parts:
-            summary = f"{monster.name} struggles to land a blow on {target.name}."
-        else:
-            summary = f"{monster.name} unleashes a flurry on {target.name}: " + " ".join(parts)
-            if target.defeated:
-                summary += f" {target.name} is defeated!"
-        return summary
+            return f"{monster.name} struggles to land a blow on {target.name}."
+        defeated = f" {target.name} is defeated!" if target.defeated else ""
+        return f"{monster.name} unleashes a flurry on {target.name}: {' '.join(parts)}{defeated}"
 
     def _execute_monster_attack_action(
         self,
         session: Optional[DungeonSession],
         monster: CombatantState,
         target: CombatantState,
-        action: Optional[Mapping[str, object]],
-        *,
-        target_ac: int,
-        resistances: Iterable[str],
-        vulnerabilities: Iterable[str],
-        immunities: Iterable[str],
+        plan: MonsterActionPlan,
+        defenses: TargetDefenses,
     ) -> str:
-        attack, extra_dice = self._create_monster_attack(monster, action)
-        outcome = resolve_attack(
-            attack,
-            target_ac,
-            resistances=resistances,
-            vulnerabilities=vulnerabilities,
-            immunities=immunities,
+        attack = plan.attacks[0][0]
+        roll, dealt = self._land_monster_swing(
+            session, target, plan.attacks[0], defenses, rng=self._session_rng(session)
         )
-        pending_damage = outcome.damage
-        if outcome.roll_result.hits and extra_dice:
-            damage_type = attack.damage_packets[0].damage_type
-            extra_packets = [
-                DamagePacket(
-                    amount=self._roll_damage(str(dice)),
-                    damage_type=damage_type,
-                )
-                for dice in extra_dice
-            ]
-            if extra_packets:
-                pending_damage += apply_damage(
-                    extra_packets,
-                    resistances=resistances,
-                    vulnerabilities=vulnerabilities,
-                    immunities=immunities,
-                )
-        dealt = 0
-        if outcome.roll_result.hits and pending_damage > 0:
-            was_unconscious = target.current_hp <= 0
-            dealt = self._apply_damage_to_combatant(
-                session,
-                target,
-                pending_damage,
-                critical=outcome.roll_result.is_critical_hit or was_unconscious,
-                source="monster",
-            )
-        if outcome.roll_result.hits:
+        if roll.hits:
             message = (
                 f"{monster.name} uses {attack.name}, hitting {target.name} for {dealt} damage "
-                f"(Attack {outcome.roll_result.total} vs AC {target_ac})."
+                f"(Attack {roll.total} vs AC {defenses.armor_class})."
+                f"{_CRITICAL_HIT_SUFFIX if roll.is_critical_hit else ''}"
             )
-            if outcome.roll_result.is_critical_hit:
-                message += " Critical hit!"
         else:
             message = (
                 f"{monster.name} uses {attack.name}, missing {target.name} "
-                f"(Attack {outcome.roll_result.total} vs AC {target_ac})."
+                f"(Attack {roll.total} vs AC {defenses.armor_class})."
             )
         if target.defeated:
             message += f" {target.name} is defeated!"
@@ -2795,34 +3804,22 @@ class DungeonCog(commands.Cog):
         session: Optional[DungeonSession],
         monster: CombatantState,
         target: CombatantState,
-        action: Optional[Mapping[str, object]],
-        *,
-        resistances: Iterable[str],
-        vulnerabilities: Iterable[str],
-        immunities: Iterable[str],
+        plan: MonsterActionPlan,
+        defenses: TargetDefenses,
     ) -> str:
-        action_data: Mapping[str, object] = action or {}
+        action_data: Mapping[str, object] = plan.action or {}
         name = str(action_data.get("name", f"{monster.name}'s assault"))
         damage_expr = str(action_data.get("damage", monster.metadata.get("damage", "1d6+1")))
         damage_type_raw = action_data.get("damage_type", monster.metadata.get("damage_type"))
-        damage_type = str(damage_type_raw).lower() if damage_type_raw else None
-        base_damage = self._roll_damage(damage_expr)
-        packets = (DamagePacket(amount=base_damage, damage_type=damage_type),)
+        damage_type = _damage_type_key(damage_type_raw)
+        base_damage = self._roll_damage(damage_expr, rng=self._session_rng(session))
         damage = apply_damage(
-            packets,
-            resistances=resistances,
-            vulnerabilities=vulnerabilities,
-            immunities=immunities,
+            (DamagePacket(amount=base_damage, damage_type=damage_type),),
+            resistances=defenses.resistances,
+            vulnerabilities=defenses.vulnerabilities,
+            immunities=defenses.immunities,
         )
-        dealt = 0
-        if damage > 0:
-            dealt = self._apply_damage_to_combatant(
-                session,
-                target,
-                damage,
-                critical=target.current_hp <= 0,
-                source="monster",
-            )
+        dealt = self._deal_monster_damage(session, target, damage)
         condition_text = self._apply_conditions_to_target(target, action_data.get("conditions"))
         if dealt:
             message = (
@@ -2841,16 +3838,12 @@ class DungeonCog(commands.Cog):
         session: Optional[DungeonSession],
         monster: CombatantState,
         target: CombatantState,
-        action: Optional[Mapping[str, object]],
-        *,
-        resistances: Iterable[str],
-        vulnerabilities: Iterable[str],
-        immunities: Iterable[str],
+        plan: MonsterActionPlan,
+        defenses: TargetDefenses,
     ) -> str:
-        action_data: Mapping[str, object] = action or {}
-        name = str(action_data.get("name", f"{monster.name}'s spell"))
-        dc = int(action_data.get("save_dc", monster.metadata.get("save_dc", 10)))
-        ability = str(action_data.get("save_ability", monster.metadata.get("save_ability", "DEX"))).upper()
+        save = plan.save or self._monster_save_profile(monster, plan.action or {})
+        # Only the target's save bonus varies per turn; the rest was parsed with the plan.
+        name, dc, ability = save.name, save.dc, save.ability
         saving_throws = target.metadata.get("saving_throws")
         if isinstance(saving_throws, Mapping):
             try:
@@ -2860,50 +3853,31 @@ class DungeonCog(commands.Cog):
         else:
             save_bonus = 0
         save_result = saving_throw(save_bonus, dc)
-        damage_expr = str(action_data.get("damage", monster.metadata.get("damage", "1d6+1")))
-        damage_type_raw = action_data.get("damage_type", monster.metadata.get("damage_type"))
-        damage_type = str(damage_type_raw).lower() if damage_type_raw else None
-        damage_amount = self._roll_damage(damage_expr)
+        damage_amount = self._roll_damage(save.damage, rng=self._session_rng(session))
         if save_result.success:
-            if action_data.get("half_on_success"):
+            if save.half_on_success:
                 damage_amount //= 2
             else:
                 damage_amount = 0
-        packets = (DamagePacket(amount=damage_amount, damage_type=damage_type),)
         damage = apply_damage(
-            packets,
-            resistances=resistances,
-            vulnerabilities=vulnerabilities,
-            immunities=immunities,
+            (DamagePacket(amount=damage_amount, damage_type=save.damage_type),),
+            resistances=defenses.resistances,
+            vulnerabilities=defenses.vulnerabilities,
+            immunities=defenses.immunities,
         )
-        dealt = 0
-        if damage > 0:
-            dealt = self._apply_damage_to_combatant(
-                session,
-                target,
-                damage,
-                critical=target.current_hp <= 0,
-                source="monster",
-            )
+        dealt = self._deal_monster_damage(session, target, damage)
         if save_result.success:
             message = (
                 f"{monster.name} uses {name}; {target.name} succeeds on a DC {dc} {ability} save."
             )
             if dealt:
                 message += f" {target.name} still takes {dealt} damage."
-            condition_text = self._apply_conditions_to_target(
-                target, action_data.get("success_conditions")
-            )
+            condition_text = self._apply_conditions_to_target(target, save.success_conditions)
         else:
             message = (
                 f"{monster.name} uses {name}; {target.name} fails the DC {dc} {ability} save and takes {dealt} damage."
             )
-            fail_conditions = (
-                action_data.get("fail_conditions")
-                or action_data.get("conditions_on_fail")
-                or action_data.get("conditions")
-            )
-            condition_text = self._apply_conditions_to_target(target, fail_conditions)
+            condition_text = self._apply_conditions_to_target(target, save.fail_conditions)
         if condition_text:
             message += f" {target.name} gains {condition_text}."
         if target.defeated:
@@ -2958,11 +3932,29 @@ class DungeonCog(commands.Cog):
         equipment_keys: Sequence[str],
         ability_scores: Dict[str, int],
     ) -> tuple[List[Dict[str, object]], List[str]]:
-        proficiencies = {value.lower() for value in character.proficiencies}
-        proficiencies.update(value.lower() for value in character.character_class.weapon_proficiencies)
-        strength_mod = ability_modifier(int(ability_scores.get("STR", 10)))
-        dexterity_mod = ability_modifier(int(ability_scores.get("DEX", 10)))
-        options: List[Dict[str, object]] = []
+        options, warnings = self._weapon_attack_table(
+            tuple(equipment_keys),
+            ability_modifier(int(ability_scores.get("STR", 10))),
+            ability_modifier(int(ability_scores.get("DEX", 10))),
+            _proficiency_keys(
+                tuple(character.proficiencies),
+                tuple(character.character_class.weapon_proficiencies),
+            ),
+        )
+        return [dict(option) for option in options], list(warnings)
+
+    @staticmethod
+    @lru_cache(maxsize=256)
+    def _weapon_attack_table(
+        equipment_keys: Tuple[str, ...],
+        strength_mod: int,
+        dexterity_mod: int,
+        proficiencies: FrozenSet[str],
+    ) -> Tuple[Tuple[Mapping[str, object], ...], Tuple[str, ...]]:
+        """Build the sorted weapon options for one loadout; callers copy the entries."""
+
+        format_damage = DungeonCog._format_damage_expression
+        ranked: List[Tuple[Tuple[int, float], Mapping[str, object]]] = []
         warnings: List[str] = []
         seen: set[str] = set()
         for key in equipment_keys:
@@ -2981,59 +3973,45 @@ class DungeonCog(commands.Cog):
                 if dexterity_mod >= strength_mod:
                     ability = "DEX"
                     ability_mod = dexterity_mod
-            proficient = any(tag.lower() in proficiencies for tag in definition.categories)
+            proficient = not definition.category_keys.isdisjoint(proficiencies)
             attack_bonus = ability_mod + (PROFICIENCY_BONUS if proficient else 0)
-            damage = self._format_damage_expression(definition.damage_die, ability_mod)
             item = EQUIPMENT.get(key)
             display_name = definition.name or (item.name if item else key.replace("_", " ").title())
-            try:
-                dice_count_str, dice_sides_str = definition.damage_die.lower().split("d", 1)
-                dice_count = int(dice_count_str)
-                dice_sides = int(dice_sides_str)
-            except (AttributeError, ValueError):
-                dice_count = 1
-                dice_sides = 4
-            average_damage = dice_count * (dice_sides + 1) / 2 + ability_mod
-            option: Dict[str, object] = {
+            average_damage = definition.average_die + ability_mod
+            option = MappingProxyType({
                 "name": display_name,
                 "weapon_key": key,
                 "attack_bonus": attack_bonus,
-                "damage": damage,
+                "damage": format_damage(definition.damage_die, ability_mod),
                 "damage_die": definition.damage_die,
                 "ability": ability,
                 "ability_modifier": ability_mod,
                 "proficient": proficient,
                 "quantity": definition.quantity,
                 "average_damage": average_damage,
-            }
-            options.append(option)
+            })
+            ranked.append(((attack_bonus, average_damage), option))
             if not proficient:
                 warnings.append(f"Not proficient with {display_name}—attacks will suffer.")
-        if not options:
+        if not ranked:
             ability = "STR" if strength_mod >= dexterity_mod else "DEX"
             ability_mod = strength_mod if ability == "STR" else dexterity_mod
-            attack_bonus = ability_mod + PROFICIENCY_BONUS
             damage_die = "1d4"
-            options.append(
-                {
-                    "name": "Unarmed Strike",
-                    "weapon_key": "unarmed",
-                    "attack_bonus": attack_bonus,
-                    "damage": self._format_damage_expression(damage_die, ability_mod),
-                    "damage_die": damage_die,
-                    "ability": ability,
-                    "ability_modifier": ability_mod,
-                    "proficient": True,
-                    "quantity": 1,
-                    "average_damage": (4 + 1) / 2 + ability_mod,
-                }
-            )
-            warnings.append("No weapon found—defaulting to an unarmed strike.")
-        options.sort(
-            key=lambda option: (option["attack_bonus"], option.get("average_damage", 0.0)),
-            reverse=True,
-        )
-        return options, warnings
+            unarmed = MappingProxyType({
+                "name": "Unarmed Strike",
+                "weapon_key": "unarmed",
+                "attack_bonus": ability_mod + PROFICIENCY_BONUS,
+                "damage": format_damage(damage_die, ability_mod),
+                "damage_die": damage_die,
+                "ability": ability,
+                "ability_modifier": ability_mod,
+                "proficient": True,
+                "quantity": 1,
+                "average_damage": (4 + 1) / 2 + ability_mod,
+            })
+            return (unarmed,), ("No weapon found—defaulting to an unarmed strike.",)
+        ranked.sort(key=itemgetter(0), reverse=True)
+        return tuple(option for _, option in ranked), tuple(warnings)
 
     def _spellcasting_profile(
         self, character: Character, ability_scores: Dict[str, int]
@@ -3066,17 +4044,18 @@ class DungeonCog(commands.Cog):
             return []
         ability = str(spellcasting_profile.get("ability", "")).upper()
         ability_mod = ability_modifier(int(ability_scores.get(ability, 10))) if ability else 0
-        defaults = DEFAULT_SPELL_OPTIONS.get(character.character_class.key, [])
-        options: List[Dict[str, object]] = []
-        for entry in defaults:
-            option = copy.deepcopy(entry)
-            option["level"] = int(option.get("level", 0))
-            option.setdefault("attack_bonus", spellcasting_profile.get("attack_bonus", ability_mod))
-            option.setdefault("save_dc", spellcasting_profile.get("save_dc", 8 + ability_mod))
-            option.setdefault("ability_modifier", ability_mod)
-            option.setdefault("ability", ability)
-            options.append(option)
-        return options
+        fallbacks = {
+            "attack_bonus": spellcasting_profile.get("attack_bonus", ability_mod),
+            "save_dc": spellcasting_profile.get("save_dc", 8 + ability_mod),
+            "ability_modifier": ability_mod,
+            "ability": ability,
+        }
+        # Nested values are immutable, so one shallow merge per entry is enough;
+        # entry keys win over the caster fallbacks.
+        return [
+            {**fallbacks, **entry, "level": int(entry.get("level", 0))}
+            for entry in DEFAULT_SPELL_OPTIONS.get(character.character_class.key, ())
+        ]
 
     def _feature_action_options(
         self, character: Character, ability_scores: Mapping[str, int]
@@ -3230,14 +4209,7 @@ class DungeonCog(commands.Cog):
                     break
                 continue
             if current.is_player:
-                state.waiting_for = current.user_id
-                state.current_action = {
-                    "actor": current.name,
-                    "state": "awaiting action",
-                    "summary": "Awaiting their next move...",
-                    "emoji": "🎲",
-                    "team": "player",
-                }
+                self._await_player_turn(state, current)
                 await self._refresh_session_view(session)
                 break
             state.waiting_for = None
@@ -3255,23 +4227,63 @@ class DungeonCog(commands.Cog):
             await asyncio.sleep(random.uniform(*MONSTER_THINKING_DELAY_RANGE))
             if state.log and state.log[-1] == thinking_entry:
                 state.log.pop()
-            self._resolve_monster_action(state, current, session=session)
-            newly_fallen = self._identify_newly_fallen(session, state)
+            newly_fallen: list[CombatantState] = []
+            exhausted = False
+
+            def apply_monster_batch(run: DungeonSession) -> None:
+                nonlocal exhausted
+                exhausted = self._resolve_monster_batch(run, state, newly_fallen)
+
+            key = self._session_key(session.guild_id, session.channel_id)
+            if await self.sessions.update(key, apply_monster_batch) is None:
+                return
             for fallen in newly_fallen:
                 await self._announce_player_death(session, fallen)
-            self._evaluate_combat_state(session, state)
             await self._refresh_session_view(session)
-            await asyncio.sleep(random.uniform(*MONSTER_ACTION_PAUSE_RANGE))
-            if not state.active:
-                break
-            next_combatant = state.advance_turn()
-            if next_combatant is None:
+            if not state.active or exhausted:
                 break
+            await asyncio.sleep(random.uniform(*MONSTER_ACTION_PAUSE_RANGE))
         if not state.active:
             state.waiting_for = None
             state.current_action = None
             await self._refresh_session_view(session)
 
+    def _resolve_monster_batch(
+        self,
+        session: DungeonSession,
+        state: CombatState,
+        newly_fallen: list[CombatantState],
+    ) -> bool:
+        """Resolve consecutive monster turns up to the next player.
+
+        Fallen players are collected into ``newly_fallen``. Returns ``True`` when
+        no combatant is left standing to take the next turn.
+        """
+
+        current = state.current_combatant()
+        while state.active and current is not None and not current.is_player:
+            if not current.defeated:
+                self._resolve_monster_action(state, current, session=session)
+                newly_fallen.extend(self._identify_newly_fallen(session, state))
+                self._evaluate_combat_state(session, state)
+                if not state.active:
+                    break
+            current = state.advance_turn()
+            if current is None:
+                return True
+        return False
+
+    @staticmethod
+    def _await_player_turn(state: CombatState, player: CombatantState) -> None:
+        state.waiting_for = player.user_id
+        state.current_action = {
+            "actor": player.name,
+            "state": "awaiting action",
+            "summary": "Awaiting their next move...",
+            "emoji": "🎲",
+            "team": "player",
+        }
+
     def _schedule_automatic_turns(
         self, session: DungeonSession, state: Optional[CombatState]
     ) -> None:
@@ -3299,15 +4311,8 @@ class DungeonCog(commands.Cog):
         target = self._select_player_target(state, player)
         if target is None:
             return "There are no foes left to strike."
-        attack_bonus = int(player.metadata.get("attack_bonus", DEFAULT_PLAYER_ATTACK_BONUS))
-        damage_expr = str(player.metadata.get("damage", DEFAULT_PLAYER_DAMAGE))
-        weapon_label = str(player.metadata.get("weapon_name", "weapon"))
-        combat_options = player.metadata.get("combat_options", {})
-        options = combat_options.get("weapons") if isinstance(combat_options, Mapping) else None
-        option: Optional[Mapping[str, object]] = None
-        if not options:
-            options = player.metadata.get("attack_options")
-        if isinstance(options, list) and options:
+        option, options = self._player_attack_options(player)
+        if options:
             default_index = self._resolve_selection_index(
                 player.metadata.get("default_attack_index", 0), "weapon", 0
             )
@@ -3316,9 +4321,9 @@ class DungeonCog(commands.Cog):
                 option_index = 0
             option = options[option_index]
             player.metadata["default_attack_index"] = option_index
-            attack_bonus = int(option.get("attack_bonus", attack_bonus))
-            damage_expr = str(option.get("damage", damage_expr))
-            weapon_label = str(option.get("name", weapon_label))
+        attack_bonus = option.attack_bonus
+        damage_expr = option.damage
+        weapon_label = option.name
         target_ac = int(target.metadata.get("armor_class", 10))
         if weapon_label.lower() == "weapon":
             action_summary = f"Attacking {target.name}"
@@ -3332,37 +4337,28 @@ class DungeonCog(commands.Cog):
             "team": "player",
         }
         result = attack_roll(attack_bonus, target_ac)
+        weapon_text = "" if weapon_label.lower() == "weapon" else f" with your {weapon_label}"
         if result.hits:
-            extra_dice = option.get("critical_extra_dice") if isinstance(option, Mapping) else None
-            if isinstance(extra_dice, Sequence):
-                extra_dice_values: Optional[Sequence[str]] = [str(value) for value in extra_dice]
-            else:
-                extra_dice_values = None
             damage = self._roll_damage(
                 damage_expr,
                 critical=result.is_critical_hit,
-                extra_dice=extra_dice_values,
+                extra_dice=option.critical_extra_dice,
+                rng=self._session_rng(session),
             )
             dealt = self._apply_damage_to_combatant(
                 session, target, damage, critical=result.is_critical_hit
             )
-            weapon_text = "" if weapon_label.lower() == "weapon" else f" with your {weapon_label}"
+            critical_text = _CRITICAL_HIT_SUFFIX if result.is_critical_hit else ""
+            defeated = f" {target.name} is defeated!" if target.defeated else ""
             summary = (
                 f"You hit {target.name}{weapon_text} for {dealt} damage! "
-                f"(Attack {result.total} vs AC {target_ac})"
+                f"(Attack {result.total} vs AC {target_ac}){critical_text}"
             )
-            if result.is_critical_hit:
-                summary += " Critical hit!"
             log_entry = (
                 f"{player.name} hits {target.name}{weapon_text} for {dealt} damage. "
-                f"(Attack {result.total} vs AC {target_ac})"
+                f"(Attack {result.total} vs AC {target_ac}){critical_text}{defeated}"
             )
-            if result.is_critical_hit:
-                log_entry += " Critical hit!"
-            if target.defeated:
-                log_entry += f" {target.name} is defeated!"
         else:
-            weapon_text = "" if weapon_label.lower() == "weapon" else f" with your {weapon_label}"
             summary = (
                 f"Your attack{weapon_text} misses {target.name}. "
                 f"(Attack {result.total} vs AC {target_ac})"
@@ -3378,6 +4374,47 @@ class DungeonCog(commands.Cog):
         self._evaluate_combat_state(session, state)
         return summary
 
+    def _player_attack_options(
+        self, player: CombatantState
+    ) -> Tuple[AttackOption, Tuple[AttackOption, ...]]:
+        """Return the player's base attack and typed weapon options, built once.
+
+        The base attack comes from the top-level metadata and is used when the
+        player has no weapon options; it also supplies missing option fields.
+        """
+
+        metadata = player.metadata
+        weapons = player.combat_options().weapons
+        legacy = None if weapons else metadata.get("attack_options")
+        sources = (
+            weapons,
+            legacy,
+            metadata.get("attack_bonus"),
+            metadata.get("damage"),
+            metadata.get("weapon_name"),
+        )
+
+        def build() -> Tuple[AttackOption, Tuple[AttackOption, ...]]:
+            base = AttackOption(
+                name=str(metadata.get("weapon_name", "weapon")),
+                attack_bonus=int(metadata.get("attack_bonus", DEFAULT_PLAYER_ATTACK_BONUS)),
+                damage=str(metadata.get("damage", DEFAULT_PLAYER_DAMAGE)),
+            )
+            entries = weapons or legacy
+            if not isinstance(entries, (list, tuple)):
+                return base, ()
+            return base, tuple(AttackOption.from_entry(entry, base) for entry in entries)
+
+        return player.derived("attack_options", sources, build)
+
+    # Spell effect types mapped to the cog methods that resolve them; names are
+    # looked up on the instance so handlers stay patchable like any other method.
+    _SPELL_EFFECT_ROUTES: Mapping[str, str] = MappingProxyType({
+        "attack": "_cast_attack_spell",
+        "auto": "_cast_auto_spell",
+        "save": "_cast_save_spell",
+    })
+
     def _player_cast_spell(
         self,
         session: DungeonSession,
@@ -3385,9 +4422,8 @@ class DungeonCog(commands.Cog):
         player: CombatantState,
         selection: Optional[str],
     ) -> str:
-        combat_options = player.metadata.get("combat_options", {})
-        spells = combat_options.get("spells") if isinstance(combat_options, Mapping) else None
-        if not isinstance(spells, list) or not spells:
+        spells = player.combat_options().spells
+        if not spells:
             return "You have no spells prepared."
         spell_index = self._resolve_selection_index(selection, "spell", 0)
         if spell_index < 0 or spell_index >= len(spells):
@@ -3406,141 +4442,185 @@ class DungeonCog(commands.Cog):
         can_use, failure_reason = self._consume_resource(player, requirement)
         if not can_use:
             return failure_reason or f"You cannot cast {spell_name} right now."
+        extra_dice = spell.get("critical_extra_dice")
+        if isinstance(extra_dice, Sequence):
+            critical_dice: Optional[Sequence[str]] = [str(value) for value in extra_dice]
+        else:
+            critical_dice = None
+        target_label = target.name if target is not None else "the area"
+        if target_required and target is not None:
+            action_summary = f"Casting {spell_name} at {target_label}"
+        else:
+            action_summary = f"Channeling {spell_name}"
+        action_payload = {
+            "actor": player.name,
+            "state": "spell",
+            "summary": action_summary,
+            "emoji": "✨",
+            "team": "player",
+        }
+        handler_name = self._SPELL_EFFECT_ROUTES.get(effect_type) if target is not None else None
+        if handler_name is None:
+            summary = f"You focus your energies with {spell_name}, but nothing notable happens."
+            log_entry = f"{player.name} casts {spell_name}, but it has no immediate effect."
+        else:
+            summary, log_entry = getattr(self, handler_name)(
+                session,
+                player,
+                target,
+                spell,
+                spell_name,
+                damage_expr=str(spell.get("damage", DEFAULT_PLAYER_DAMAGE)),
+                critical_dice=critical_dice,
+            )
+        if spell.get("concentration"):
+            player.concentration = spell_name
+            self._sync_combatant_state(player, session)
+            summary += " You begin concentrating on the spell."
+            log_entry += f" {player.name} begins concentrating on {spell_name}."
+        status_text = self._resource_status_text(player, requirement)
+        if status_text:
+            summary += f" {status_text}"
+        self._sync_combatant_state(player, session)
+        action_payload["detail"] = summary
+        state.current_action = action_payload
+        state.log.append(log_entry)
+        self._trim_combat_log(state)
+        self._evaluate_combat_state(session, state)
+        return summary
+
+    def _cast_attack_spell(
+        self,
+        session: DungeonSession,
+        player: CombatantState,
+        target: CombatantState,
+        spell: Mapping[str, object],
+        spell_name: str,
+        *,
+        damage_expr: str,
+        critical_dice: Optional[Sequence[str]],
+    ) -> Tuple[str, str]:
         attack_bonus = int(
             spell.get(
                 "attack_bonus",
                 player.metadata.get("spell_attack_bonus", player.metadata.get("attack_bonus", 0)),
             )
         )
-        damage_expr = str(spell.get("damage", DEFAULT_PLAYER_DAMAGE))
         damage_type = spell.get("damage_type")
-        extra_dice = spell.get("critical_extra_dice") if isinstance(spell, Mapping) else None
-        if isinstance(extra_dice, Sequence):
-            critical_dice: Optional[Sequence[str]] = [str(value) for value in extra_dice]
+        target_ac = int(target.metadata.get("armor_class", DEFAULT_PLAYER_ARMOR_CLASS))
+        result = attack_roll(attack_bonus, target_ac)
+        if result.hits:
+            damage = self._roll_damage(
+                damage_expr,
+                critical=result.is_critical_hit,
+                extra_dice=critical_dice,
+                rng=self._session_rng(session),
+            )
+            dealt = self._apply_damage_to_combatant(
+                session,
+                target,
+                damage,
+                critical=result.is_critical_hit,
+            )
+            type_text = f" {str(damage_type).title()}" if damage_type else ""
+            critical_text = _CRITICAL_HIT_SUFFIX if result.is_critical_hit else ""
+            defeated = f" {target.name} is defeated!" if target.defeated else ""
+            summary = (
+                f"You cast {spell_name}, striking {target.name} for {dealt}{type_text} damage. "
+                f"(Attack {result.total} vs AC {target_ac}){critical_text}"
+            )
+            log_entry = (
+                f"{player.name} casts {spell_name}, hitting {target.name} for {dealt}{type_text} damage. "
+                f"(Attack {result.total} vs AC {target_ac}){critical_text}{defeated}"
+            )
         else:
-            critical_dice = None
-        log_entry: str
-        summary: str
-        target_label = target.name if target is not None else "the area"
-        if target_required and target is not None:
-            action_summary = f"Casting {spell_name} at {target_label}"
+            summary = (
+                f"Your {spell_name} misses {target.name}. "
+                f"(Attack {result.total} vs AC {target_ac})"
+            )
+            log_entry = (
+                f"{player.name}'s {spell_name} misses {target.name}. "
+                f"(Attack {result.total} vs AC {target_ac})"
+            )
+        return summary, log_entry
+
+    def _cast_auto_spell(
+        self,
+        session: DungeonSession,
+        player: CombatantState,
+        target: CombatantState,
+        spell: Mapping[str, object],
+        spell_name: str,
+        *,
+        damage_expr: str,
+        critical_dice: Optional[Sequence[str]],
+    ) -> Tuple[str, str]:
+        damage_type = spell.get("damage_type")
+        damage = self._roll_damage(
+            damage_expr, extra_dice=critical_dice, rng=self._session_rng(session)
+        )
+        dealt = self._apply_damage_to_combatant(session, target, damage)
+        type_text = f" {str(damage_type).title()}" if damage_type else ""
+        defeated = f" {target.name} is defeated!" if target.defeated else ""
+        summary = f"You unleash {spell_name}, automatically dealing {dealt}{type_text} damage to {target.name}."
+        log_entry = (
+            f"{player.name} casts {spell_name}, dealing {dealt}{type_text} damage to {target.name}.{defeated}"
+        )
+        return summary, log_entry
+
+    def _cast_save_spell(
+        self,
+        session: DungeonSession,
+        player: CombatantState,
+        target: CombatantState,
+        spell: Mapping[str, object],
+        spell_name: str,
+        *,
+        damage_expr: str,
+        critical_dice: Optional[Sequence[str]],
+    ) -> Tuple[str, str]:
+        dc = int(spell.get("save_dc", player.metadata.get("spell_save_dc", 10)))
+        ability = sys.intern(str(spell.get("save_ability", "DEX")).upper())
+        saving_throws = target.metadata.get("saving_throws")
+        if isinstance(saving_throws, Mapping):
+            try:
+                save_bonus = int(saving_throws.get(ability, 0))
+            except (TypeError, ValueError):
+                save_bonus = 0
         else:
-            action_summary = f"Channeling {spell_name}"
-        action_payload = {
-            "actor": player.name,
-            "state": "spell",
-            "summary": action_summary,
-            "emoji": "✨",
-            "team": "player",
-        }
-        if effect_type == "attack" and target is not None:
-            target_ac = int(target.metadata.get("armor_class", DEFAULT_PLAYER_ARMOR_CLASS))
-            result = attack_roll(attack_bonus, target_ac)
-            if result.hits:
-                damage = self._roll_damage(
-                    damage_expr,
-                    critical=result.is_critical_hit,
-                    extra_dice=critical_dice,
-                )
-                dealt = self._apply_damage_to_combatant(
-                    session,
-                    target,
-                    damage,
-                    critical=result.is_critical_hit,
-                )
-                type_text = f" {str(damage_type).title()}" if damage_type else ""
+            save_bonus = 0
+        save_result = saving_throw(save_bonus, dc)
+        damage = self._roll_damage(
+            damage_expr, extra_dice=critical_dice, rng=self._session_rng(session)
+        )
+        if save_result.success:
+            if spell.get("half_on_success"):
+                damage //= 2
+                dealt = self._apply_damage_to_combatant(session, target, damage)
                 summary = (
-                    f"You cast {spell_name}, striking {target.name} for {dealt}{type_text} damage. "
-                    f"(Attack {result.total} vs AC {target_ac})"
+                    f"{target.name} resists some of your {spell_name}, taking {dealt} damage after succeeding "
+                    f"the save (DC {dc})."
                 )
                 log_entry = (
-                    f"{player.name} casts {spell_name}, hitting {target.name} for {dealt}{type_text} damage. "
-                    f"(Attack {result.total} vs AC {target_ac})"
+                    f"{player.name} casts {spell_name}; {target.name} succeeds on the save (DC {dc}) and takes {dealt} damage."
                 )
-                if result.is_critical_hit:
-                    summary += " Critical hit!"
-                    log_entry += " Critical hit!"
-                if target.defeated:
-                    log_entry += f" {target.name} is defeated!"
             else:
                 summary = (
-                    f"Your {spell_name} misses {target.name}. "
-                    f"(Attack {result.total} vs AC {target_ac})"
+                    f"{target.name} shrugs off your {spell_name}, succeeding on the saving throw (DC {dc})."
                 )
                 log_entry = (
-                    f"{player.name}'s {spell_name} misses {target.name}. "
-                    f"(Attack {result.total} vs AC {target_ac})"
+                    f"{player.name} casts {spell_name}, but {target.name} succeeds on the save (DC {dc})."
                 )
-        elif effect_type == "auto" and target is not None:
-            damage = self._roll_damage(damage_expr, extra_dice=critical_dice)
+        else:
             dealt = self._apply_damage_to_combatant(session, target, damage)
-            type_text = f" {str(damage_type).title()}" if damage_type else ""
-            summary = f"You unleash {spell_name}, automatically dealing {dealt}{type_text} damage to {target.name}."
+            summary = (
+                f"{target.name} fails the save (DC {dc}) against your {spell_name}, taking {dealt} damage."
+            )
+            defeated = f" {target.name} is defeated!" if target.defeated else ""
             log_entry = (
-                f"{player.name} casts {spell_name}, dealing {dealt}{type_text} damage to {target.name}."
+                f"{player.name}'s {spell_name} forces {target.name} to fail the save (DC {dc}), taking {dealt} damage.{defeated}"
             )
-            if target.defeated:
-                log_entry += f" {target.name} is defeated!"
-        elif effect_type == "save" and target is not None:
-            dc = int(spell.get("save_dc", player.metadata.get("spell_save_dc", 10)))
-            ability = str(spell.get("save_ability", "DEX")).upper()
-            saving_throws = target.metadata.get("saving_throws")
-            if isinstance(saving_throws, Mapping):
-                try:
-                    save_bonus = int(saving_throws.get(ability, 0))
-                except (TypeError, ValueError):
-                    save_bonus = 0
-            else:
-                save_bonus = 0
-            save_result = saving_throw(save_bonus, dc)
-            damage = self._roll_damage(damage_expr, extra_dice=critical_dice)
-            if save_result.success:
-                if spell.get("half_on_success"):
-                    damage //= 2
-                    dealt = self._apply_damage_to_combatant(session, target, damage)
-                    summary = (
-                        f"{target.name} resists some of your {spell_name}, taking {dealt} damage after succeeding "
-                        f"the save (DC {dc})."
-                    )
-                    log_entry = (
-                        f"{player.name} casts {spell_name}; {target.name} succeeds on the save (DC {dc}) and takes {dealt} damage."
-                    )
-                else:
-                    summary = (
-                        f"{target.name} shrugs off your {spell_name}, succeeding on the saving throw (DC {dc})."
-                    )
-                    log_entry = (
-                        f"{player.name} casts {spell_name}, but {target.name} succeeds on the save (DC {dc})."
-                    )
-                    damage = 0
-            else:
-                dealt = self._apply_damage_to_combatant(session, target, damage)
-                summary = (
-                    f"{target.name} fails the save (DC {dc}) against your {spell_name}, taking {dealt} damage."
-                )
-                log_entry = (
-                    f"{player.name}'s {spell_name} forces {target.name} to fail the save (DC {dc}), taking {dealt} damage."
-                )
-                if target.defeated:
-                    log_entry += f" {target.name} is defeated!"
-        else:
-            summary = f"You focus your energies with {spell_name}, but nothing notable happens."
-            log_entry = f"{player.name} casts {spell_name}, but it has no immediate effect."
-        if spell.get("concentration"):
-            player.concentration = spell_name
-            self._sync_combatant_state(player, session)
-            summary += " You begin concentrating on the spell."
-            log_entry += f" {player.name} begins concentrating on {spell_name}."
-        status_text = self._resource_status_text(player, requirement)
-        if status_text:
-            summary += f" {status_text}"
-        self._sync_combatant_state(player, session)
-        action_payload["detail"] = summary
-        state.current_action = action_payload
-        state.log.append(log_entry)
-        self._trim_combat_log(state)
-        self._evaluate_combat_state(session, state)
-        return summary
+        return summary, log_entry
 
     def _player_use_feature(
         self,
@@ -3549,20 +4629,19 @@ class DungeonCog(commands.Cog):
         player: CombatantState,
         selection: Optional[str],
     ) -> str:
-        combat_options = player.metadata.get("combat_options", {})
-        features = combat_options.get("features") if isinstance(combat_options, Mapping) else None
-        if not isinstance(features, list) or not features:
+        features = player.combat_options().features
+        if not features:
             return "You have no combat features to use."
         feature_index = self._resolve_selection_index(selection, "feature", 0)
         if feature_index < 0 or feature_index >= len(features):
             return "That feature is not available right now."
         feature = features[feature_index]
         feature_name = str(feature.get("name", "Feature"))
-        requirement = feature.get("resource") if isinstance(feature, Mapping) else None
+        requirement = feature.get("resource")
         can_use, failure_reason = self._consume_resource(player, requirement if isinstance(requirement, Mapping) else None)
         if not can_use:
             return failure_reason or f"You cannot use {feature_name} right now."
-        effect = feature.get("effects") if isinstance(feature, Mapping) else None
+        effect = feature.get("effects")
         log_entry = f"{player.name} uses {feature_name}."
         summary = f"You activate {feature_name}."
         action_payload = {
@@ -3576,7 +4655,7 @@ class DungeonCog(commands.Cog):
             effect_type = str(effect.get("type", "")).lower()
             if effect_type == "heal":
                 heal_expr = str(effect.get("dice", "1d6"))
-                healed = self._roll_damage(heal_expr)
+                healed = self._roll_damage(heal_expr, rng=self._session_rng(session))
                 restored = self._apply_healing_to_combatant(session, player, healed)
                 summary = f"You use {feature_name}, regaining {restored} HP."
                 log_entry = f"{player.name} uses {feature_name}, regaining {restored} HP."
@@ -3649,8 +4728,30 @@ class DungeonCog(commands.Cog):
         warnings_log: List[str] = []
         guild_id = interaction.guild_id
         party_ids = list(party_order) if party_order is not None else sorted(session.party_ids)
+        # Load the whole party under one repository lock instead of one fetch per member.
+        party_characters: Dict[int, Character] = {}
+        unloaded_ids: FrozenSet[int] = frozenset()
+        if guild_id is not None and party_ids:
+            try:
+                party_characters, unloaded_ids = await self.characters.load_many(
+                    guild_id, party_ids
+                )
+            except Exception as exc:  # pragma: no cover - defensive
+                log.exception("Failed to load party characters in guild %s", guild_id, exc_info=exc)
+                unloaded_ids = frozenset(party_ids)
+            else:
+                for user_id in unloaded_ids:
+                    log.warning(
+                        "Failed to decode character for user %s in guild %s", user_id, guild_id
+                    )
+        monsters = session.room.encounter.monsters
+        initiative_rolls = iter(
+            (self._session_rng(session) or random).choices(
+                _D20_FACES, k=len(party_ids) + len(monsters)
+            )
+        )
         for user_id in party_ids:
-            roll = random.randint(1, 20)
+            roll = next(initiative_rolls)
             name = self._display_name_for_user(user_id, interaction=interaction)
             metadata: Dict[str, object]
             initiative_bonus = 0
@@ -3660,11 +4761,10 @@ class DungeonCog(commands.Cog):
             profile: Optional[Dict[str, object]] = None
             character: Optional[Character] = None
             if guild_id is not None:
-                try:
-                    character = await self.characters.get(guild_id, user_id)
-                except Exception as exc:  # pragma: no cover - defensive
-                    log.exception("Failed to load character for user %s", user_id, exc_info=exc)
+                if user_id in unloaded_ids:
                     warnings.append("Character data could not be loaded—using default combat profile.")
+                else:
+                    character = party_characters.get(user_id)
             else:
                 warnings.append("Characters are unavailable outside of guilds—using default combat profile.")
             if character is not None:
@@ -3746,14 +4846,15 @@ class DungeonCog(commands.Cog):
             initiative_total = roll + int(metadata.get("initiative_bonus", 0))
             conditions_raw = metadata.get("conditions") or []
             if isinstance(conditions_raw, (list, tuple, set)):
-                conditions = {str(value) for value in conditions_raw if str(value).strip()}
+                conditions = ConditionSet(conditions_raw)
             else:
-                conditions = set()
+                conditions = ConditionSet()
             concentration_raw = metadata.get("concentration")
             concentration = str(concentration_raw) if concentration_raw else None
             resources_payload = metadata.get("resources")
             if isinstance(resources_payload, MutableMapping):
-                shared_resources = copy.deepcopy(resources_payload)
+                shared_resources = _clone_resources(resources_payload)
+                self._normalise_spell_slot_keys(shared_resources)
             else:
                 shared_resources = {}
             metadata["resources"] = shared_resources
@@ -3791,15 +4892,10 @@ class DungeonCog(commands.Cog):
             )
             self._sync_combatant_state(combatant, session)
             combatants.append(combatant)
-        monster_labels = self._unique_monster_labels(session.room.encounter.monsters)
-        for index, (monster, display_name) in enumerate(
-            zip(session.room.encounter.monsters, monster_labels)
-        ):
-            roll = random.randint(1, 20)
-            initiative_total = roll
-            dex_score = monster.ability_scores.get("DEX") if monster.ability_scores else None
-            if dex_score is not None:
-                initiative_total += (int(dex_score) - 10) // 2
+        monster_labels = self._unique_monster_labels(monsters)
+        for index, (monster, display_name) in enumerate(zip(monsters, monster_labels)):
+            roll = next(initiative_rolls)
+            initiative_total = roll + monster.initiative_bonus
             monster_resources: Dict[str, object] = {}
             monster_combatant = CombatantState(
                 identifier=f"monster:{index}",
@@ -3818,7 +4914,8 @@ class DungeonCog(commands.Cog):
             )
             self._sync_combatant_state(monster_combatant)
             combatants.append(monster_combatant)
-        combatants.sort(key=lambda combatant: (combatant.initiative_total, combatant.initiative_roll), reverse=True)
+        # Stable descending sort: ties keep party-then-monster build order.
+        combatants.sort(key=_INITIATIVE_KEY, reverse=True)
         state = CombatState(order=combatants)
         if warnings_log:
             state.log.extend(warnings_log)
@@ -3840,11 +4937,14 @@ class DungeonCog(commands.Cog):
         self._ensure_room_discovery_state(session, room)
         trap_catalog = session.trap_catalog.get(room.id, {})
         trap_states = session.trap_states.get(room.id, {})
-        discovered_traps = session.discovered_traps.get(room.id, set())
-        trap_detected = any(
-            trap_states.get(trap.key, "hidden") != "hidden" or trap.key in discovered_traps
-            for trap in room.encounter.traps
-        )
+        discovered_traps = session.discovered_traps.get(room.id, frozenset())
+        has_active_traps = False
+        trap_detected = False
+        for trap in self._active_traps(session, room):
+            has_active_traps = True
+            if trap_states.get(trap.key, "hidden") != "hidden" or trap.key in discovered_traps:
+                trap_detected = True
+                break
 
         embed = discord.Embed(
             title=f"{dungeon.name} — Room {room.id + 1}: {room.name}",
@@ -3852,7 +4952,7 @@ class DungeonCog(commands.Cog):
             color=discord.Color.dark_purple(),
         )
         encounter_summary = room.encounter.summary or "Quiet for now."
-        if room.encounter.traps and not trap_detected:
+        if has_active_traps and not trap_detected:
             encounter_summary = "Quiet for now."
         embed.add_field(name="Encounter", value=encounter_summary, inline=False)
 
@@ -4555,6 +5655,42 @@ class DungeonCog(commands.Cog):
         except discord.HTTPException:
             pass
 
+    def _schedule_refresh(
+        self, interaction: discord.Interaction, session: DungeonSession
+    ) -> None:
+        """Queue a session message refresh, superseding any still waiting to run."""
+
+        key = self._session_key(session.guild_id, session.channel_id)
+        pending = self._pending_refresh.pop(key, None)
+        if pending is not None:
+            pending.cancel()
+        task = asyncio.create_task(
+            self._debounced_refresh(key, interaction, delay=REFRESH_DEBOUNCE_SECONDS)
+        )
+        self._pending_refresh[key] = task
+        task.add_done_callback(self._handle_refresh_completion)
+
+    async def _debounced_refresh(
+        self, key: SessionKey, interaction: discord.Interaction, *, delay: float
+    ) -> None:
+        await asyncio.sleep(delay)
+        # Once the edit starts it is no longer pending, so newer requests queue
+        # behind it instead of cancelling a message edit mid-flight.
+        if self._pending_refresh.get(key) is asyncio.current_task():
+            del self._pending_refresh[key]
+        session = await self.sessions.get(key)
+        if session is None:
+            return
+        await self._refresh_session_message(interaction, session)
+
+    @staticmethod
+    def _handle_refresh_completion(task: asyncio.Task) -> None:
+        if task.cancelled():
+            return
+        exc = task.exception()
+        if exc is not None:  # pragma: no cover - background task logging
+            log.error("Session refresh task failed", exc_info=exc)
+
     async def _find_tavern_channel(
         self, guild_id: Optional[int]
     ) -> Optional[discord.TextChannel]:
@@ -4627,7 +5763,7 @@ class DungeonCog(commands.Cog):
             description = "The party returns to the tavern victorious."
         embed = discord.Embed(colour=discord.Colour.green(), title=title, description=description)
 
-        party_ids = tuple(sorted(session.party_ids))
+        party_ids = session.party_snapshot()
         if party_ids:
             adventurers = "\n".join(f"• <@{user_id}>" for user_id in party_ids)
         else:
@@ -4680,7 +5816,7 @@ class DungeonCog(commands.Cog):
             inline=False,
         )
 
-        party_ids = tuple(sorted(session.party_ids))
+        party_ids = session.party_snapshot()
         if party_ids:
             adventurers = "\n".join(f"• <@{user_id}>" for user_id in party_ids)
         else:
@@ -4731,6 +5867,7 @@ class DungeonCog(commands.Cog):
             removed = session
         if party_snapshot:
             removed.party_ids.update(party_snapshot)
+        self._forget_party_channel_access(removed)
 
         guild = interaction.guild or (
             self.bot.get_guild(removed.guild_id) if removed.guild_id is not None else None
@@ -4905,7 +6042,10 @@ class DungeonCog(commands.Cog):
             )
             return False
 
-        await self.sessions.update(key, lambda run: setattr(run, "message_id", message.id))
+        def record_message(run: DungeonSession) -> None:
+            run.message_id = message.id
+
+        await self.sessions.update(key, record_message)
         self.bot.add_view(view, message_id=message.id)
 
         await self._update_tavern_access(interaction.guild_id)
@@ -5053,7 +6193,7 @@ class DungeonCog(commands.Cog):
     @dungeon_group.command(name="reset", description="Reset the active dungeon session in this channel.")
     @app_commands.checks.has_permissions(manage_guild=True)
     async def reset(self, interaction: discord.Interaction) -> None:
-        key = self._session_key(interaction.guild_id, interaction.channel_id)
+        key = self._interaction_session_key(interaction)
         session = await self.sessions.pop(key)
         if session is None:
             await interaction.response.send_message("There is no active dungeon in this channel.", ephemeral=True)
@@ -5187,7 +6327,7 @@ class DungeonCog(commands.Cog):
 
     # ---- Interaction handlers -------------------------------------------
     async def handle_exit(self, interaction: discord.Interaction, exit_key: str) -> None:
-        key = self._session_key(interaction.guild_id, interaction.channel_id)
+        key = self._interaction_session_key(interaction)
         session = await self.sessions.get(key)
         if session is None:
             await interaction.response.send_message("No active dungeon for this party.", ephemeral=True)
@@ -5218,30 +6358,21 @@ class DungeonCog(commands.Cog):
         def mutate(run: DungeonSession) -> None:
             nonlocal moved, backtracked, added_member, exit_label, destination_room
             nonlocal party_snapshot, triggered_events, avoidance_messages, completed_delve
-            if interaction.user.id not in run.party_ids:
-                run.party_ids.add(interaction.user.id)
+            if run.add_party_member(interaction.user.id):
                 added_member = True
 
             current_room = run.room
             self._ensure_room_damage_entry(run, current_room.id)
             self._ensure_room_trap_state(run, current_room)
             self._ensure_room_discovery_state(run, current_room)
-            catalog = run.trap_catalog.setdefault(current_room.id, {})
-            states = run.trap_states.setdefault(current_room.id, {})
-            traps = list(current_room.encounter.traps)
-            traps_changed = False
-            for trap in list(traps):
+            room_id_local = current_room.id
+            catalog = run.trap_catalog.setdefault(room_id_local, {})
+            states = run.trap_states.setdefault(room_id_local, {})
+            disarmable = run.disarmable_queue.setdefault(room_id_local, deque())
+            for trap in self._active_traps(run, current_room):
                 status = states.get(trap.key, "hidden")
-                if status in ("disarmed", "sprung"):
-                    continue
-                saving_throw_data = trap.saving_throw or {}
-                ability_value = saving_throw_data.get("ability", "DEX")
-                ability = str(ability_value).upper()
-                dc_raw = saving_throw_data.get("dc", 15)
-                try:
-                    dc_value = int(dc_raw)
-                except (TypeError, ValueError):
-                    dc_value = 15
+                ability = trap.save_ability or "DEX"
+                dc_value = trap.save_dc if trap.save_dc is not None else 15
                 result = saving_throw(save_bonus=5, dc=dc_value)
                 catalog.setdefault(trap.key, trap)
                 if result.success:
@@ -5261,13 +6392,14 @@ class DungeonCog(commands.Cog):
                             )
                         )
                     continue
-                triggered_events.append((current_room.id, trap, "ignored"))
-                self._set_trap_status(run, current_room.id, trap.key, "sprung")
-                traps.remove(trap)
-                traps_changed = True
-            if traps_changed:
-                run.room.encounter = replace(
-                    current_room.encounter, traps=tuple(traps)
+                triggered_events.append((room_id_local, trap, "ignored"))
+                self._update_trap_status(
+                    states,
+                    run.discovered_traps,
+                    room_id_local,
+                    disarmable,
+                    trap.key,
+                    "sprung",
                 )
             selected_exit = next((option for option in current_room.exits if option.key == exit_key), None)
             if selected_exit is None:
@@ -5282,7 +6414,7 @@ class DungeonCog(commands.Cog):
                 lower_label = selected_exit.label.lower()
                 run.last_travel_note = f"The party leaves via the {lower_label}."
                 run.stealthed = False
-                party_snapshot = tuple(sorted(run.party_ids))
+                party_snapshot = run.party_snapshot()
                 exit_label = selected_exit.label
                 moved = True
                 completed_delve = True
@@ -5331,7 +6463,7 @@ class DungeonCog(commands.Cog):
             else:
                 run.last_travel_note = f"The party takes the {lower_label}."
             run.stealthed = False
-            party_snapshot = tuple(sorted(run.party_ids))
+            party_snapshot = run.party_snapshot()
             destination_room = destination_room_local
             self._ensure_room_trap_state(run, destination_room_local)
             self._ensure_room_discovery_state(run, destination_room_local)
@@ -5355,7 +6487,7 @@ class DungeonCog(commands.Cog):
             )
             return
 
-        if added_member and interaction.guild_id is not None:
+        if added_member:
             await self._handle_party_membership_change(interaction.guild_id, session)
 
         if not moved:
@@ -5448,12 +6580,11 @@ class DungeonCog(commands.Cog):
         if triggered_messages:
             message = f"{message}\n\n" + "\n\n".join(triggered_messages)
 
+        self._schedule_refresh(interaction, session)
         await interaction.followup.send(message, ephemeral=True)
 
-        await self._refresh_session_message(interaction, session)
-
     async def handle_search(self, interaction: discord.Interaction) -> None:
-        key = self._session_key(interaction.guild_id, interaction.channel_id)
+        key = self._interaction_session_key(interaction)
         current_session = await self.sessions.get(key)
         if current_session is None:
             await interaction.response.send_message("No active dungeon to search.", ephemeral=True)
@@ -5469,10 +6600,9 @@ class DungeonCog(commands.Cog):
 
         def mutate(run: DungeonSession) -> None:
             nonlocal added_member, collected_loot, party_snapshot, loot_cursor, room_id
-            if interaction.user.id not in run.party_ids:
-                run.party_ids.add(interaction.user.id)
+            if run.add_party_member(interaction.user.id):
                 added_member = True
-            party_snapshot = tuple(sorted(run.party_ids))
+            party_snapshot = run.party_snapshot()
             room = run.room
             self._ensure_room_discovery_state(run, room)
             room_id_local = room.id
@@ -5483,16 +6613,16 @@ class DungeonCog(commands.Cog):
             if not discovered_loot:
                 return
             available = [
-                item for item in run.room.encounter.loot if item.key in discovered_loot
+                item for item in room.encounter.loot if item.key in discovered_loot
             ]
             if not available:
                 return
             collected_loot = tuple(available)
             loot_cursor = run.loot_cursor if party_snapshot else 0
             remaining = [
-                item for item in run.room.encounter.loot if item.key not in discovered_loot
+                item for item in room.encounter.loot if item.key not in discovered_loot
             ]
-            run.room.encounter = replace(run.room.encounter, loot=tuple(remaining))
+            room.encounter = replace(room.encounter, loot=tuple(remaining))
 
         session = await self.sessions.update(key, mutate)
         if session is None:
@@ -5500,10 +6630,10 @@ class DungeonCog(commands.Cog):
             return
 
         await interaction.response.defer(ephemeral=True)
-        if added_member and interaction.guild_id is not None:
+        if added_member:
             await self._handle_party_membership_change(interaction.guild_id, session)
         if not collected_loot:
-            await self._refresh_session_message(interaction, session)
+            self._schedule_refresh(interaction, session)
             await interaction.followup.send(
                 "You find nothing of value after a thorough search.",
                 ephemeral=True,
@@ -5512,9 +6642,8 @@ class DungeonCog(commands.Cog):
 
         def restore_loot(run: DungeonSession) -> None:
             if collected_loot:
-                run.room.encounter = replace(
-                    run.room.encounter, loot=tuple(collected_loot)
-                )
+                room = run.room
+                room.encounter = replace(room.encounter, loot=tuple(collected_loot))
                 if room_id is not None:
                     run.discovered_loot.setdefault(room_id, set()).update(
                         item.key for item in collected_loot
@@ -5522,17 +6651,19 @@ class DungeonCog(commands.Cog):
 
         if session.guild_id is None:
             await self.sessions.update(key, restore_loot)
-            await self._refresh_session_message(interaction, session)
+            self._schedule_refresh(interaction, session)
             await interaction.followup.send(
                 "Without a guild roster I can't assign the treasure to anyone.",
                 ephemeral=True,
             )
             return
 
-        characters = await self._load_party_characters(session.guild_id, party_snapshot)
+        characters = await self._load_party_characters_cached(
+            session.guild_id, party_snapshot, session.party_version
+        )
         if not characters:
             await self.sessions.update(key, restore_loot)
-            await self._refresh_session_message(interaction, session)
+            self._schedule_refresh(interaction, session)
             await interaction.followup.send(
                 "No one in the party has a ready character to claim the spoils just yet.",
                 ephemeral=True,
@@ -5542,7 +6673,7 @@ class DungeonCog(commands.Cog):
         shares = allocate_loot(collected_loot, party_snapshot, loot_cursor, characters.keys())
         if not shares:
             await self.sessions.update(key, restore_loot)
-            await self._refresh_session_message(interaction, session)
+            self._schedule_refresh(interaction, session)
             await interaction.followup.send(
                 "The treasure slips through your fingers—try again once everyone is ready.",
                 ephemeral=True,
@@ -5553,25 +6684,22 @@ class DungeonCog(commands.Cog):
             session.guild_id, characters, shares
         )
         delivered_items, delivered_gold = delivered_totals
-        if delivered_items or delivered_gold:
+        next_cursor: Optional[int] = None
+        if party_snapshot:
+            next_cursor = (loot_cursor + len(collected_loot)) % len(party_snapshot)
 
-            def record_rewards(run: DungeonSession) -> None:
-                run.treasure_items_claimed += delivered_items
-                run.treasure_gold_claimed += delivered_gold
+        def record_rewards(run: DungeonSession) -> None:
+            run.treasure_items_claimed += delivered_items
+            run.treasure_gold_claimed += delivered_gold
+            if next_cursor is not None:
+                run.loot_cursor = next_cursor
 
+        if delivered_items or delivered_gold or next_cursor is not None:
             updated = await self.sessions.update(key, record_rewards)
             if updated is not None:
                 session = updated
 
-        next_cursor = loot_cursor
-        if party_snapshot:
-            next_cursor = (loot_cursor + len(collected_loot)) % len(party_snapshot)
-            await self.sessions.update(
-                key, lambda run: setattr(run, "loot_cursor", next_cursor)
-            )
-            session.loot_cursor = next_cursor
-
-        await self._refresh_session_message(interaction, session)
+        self._schedule_refresh(interaction, session)
 
         message_lines: list[str] = ["You uncover hidden treasure!"]
         if item_lines:
@@ -5588,7 +6716,7 @@ class DungeonCog(commands.Cog):
 
 
     async def handle_perception(self, interaction: discord.Interaction) -> None:
-        key = self._session_key(interaction.guild_id, interaction.channel_id)
+        key = self._interaction_session_key(interaction)
         current_session = await self.sessions.get(key)
         if current_session is None:
             await interaction.response.send_message(
@@ -5605,8 +6733,7 @@ class DungeonCog(commands.Cog):
 
         def mutate(run: DungeonSession) -> None:
             nonlocal added_member, nothing_hidden, room_id
-            if interaction.user.id not in run.party_ids:
-                run.party_ids.add(interaction.user.id)
+            if run.add_party_member(interaction.user.id):
                 added_member = True
             room = run.room
             self._ensure_room_trap_state(run, room)
@@ -5614,7 +6741,8 @@ class DungeonCog(commands.Cog):
             room_id_local = room.id
             room_id = room_id_local
             trap_states = run.trap_states.setdefault(room_id_local, {})
-            discovered_traps = run.discovered_traps.setdefault(room_id_local, set())
+            discovered_traps = run.discovered_traps.get(room_id_local, frozenset())
+            disarmable = run.disarmable_queue.setdefault(room_id_local, deque())
             discovered_loot = run.discovered_loot.setdefault(room_id_local, set())
             discovered_exits = run.discovered_exits.setdefault(room_id_local, set())
             attempts_map = run.perception_attempts.setdefault(room_id_local, {})
@@ -5622,11 +6750,8 @@ class DungeonCog(commands.Cog):
             difficulty_map = run.perception_difficulties.setdefault(room_id_local, {})
 
             hidden_traps: list[Trap] = []
-            for trap in room.encounter.traps:
+            for trap in self._active_traps(run, room):
                 trap_catalog.setdefault(trap.key, trap)
-                status = trap_states.get(trap.key, "hidden")
-                if status in {"disarmed", "sprung"}:
-                    continue
                 if trap.key in discovered_traps:
                     continue
                 hidden_traps.append(trap)
@@ -5644,21 +6769,24 @@ class DungeonCog(commands.Cog):
             attempts_map[interaction.user.id] = attempts_used + 1
 
             for trap in hidden_traps:
-                saving_throw_data = trap.saving_throw or {}
-                ability_value = saving_throw_data.get("ability", "WIS")
-                ability = str(ability_value).upper()
-                dc_raw = saving_throw_data.get("dc", DEFAULT_PERCEPTION_DC)
-                try:
-                    dc_value = int(dc_raw)
-                except (TypeError, ValueError):
-                    dc_value = DEFAULT_PERCEPTION_DC
+                ability = trap.save_ability or "WIS"
+                dc_value = (
+                    trap.save_dc if trap.save_dc is not None else DEFAULT_PERCEPTION_DC
+                )
                 difficulty_key = ("trap", trap.key)
                 dc_shift = difficulty_map.get(difficulty_key, 0)
                 adjusted_dc = dc_value + dc_shift
                 result = saving_throw(save_bonus=5, dc=adjusted_dc)
                 results.append(("trap", trap.name, result, adjusted_dc, ability))
                 if result.success:
-                    self._set_trap_status(run, room_id_local, trap.key, "discovered")
+                    self._update_trap_status(
+                        trap_states,
+                        run.discovered_traps,
+                        room_id_local,
+                        disarmable,
+                        trap.key,
+                        "discovered",
+                    )
                     if difficulty_key in difficulty_map:
                         difficulty_map.pop(difficulty_key, None)
                 elif random.random() < PERCEPTION_DC_INCREASE_CHANCE:
@@ -5698,11 +6826,11 @@ class DungeonCog(commands.Cog):
             return
 
         await interaction.response.defer(ephemeral=True)
-        if added_member and interaction.guild_id is not None:
+        if added_member:
             await self._handle_party_membership_change(interaction.guild_id, session)
 
         if room_id is None:
-            await self._refresh_session_message(interaction, session)
+            self._schedule_refresh(interaction, session)
             await interaction.followup.send(
                 "There is nothing here that a keen eye might uncover.",
                 ephemeral=True,
@@ -5710,12 +6838,12 @@ class DungeonCog(commands.Cog):
             return
 
         if nothing_hidden and not results:
-            await self._refresh_session_message(interaction, session)
+            self._schedule_refresh(interaction, session)
             await interaction.followup.send(
                 "You find no clues to any hidden dangers.", ephemeral=True
             )
             return
-        await self._refresh_session_message(interaction, session)
+        self._schedule_refresh(interaction, session)
 
         if not results:
             await interaction.followup.send(
@@ -5749,7 +6877,7 @@ class DungeonCog(commands.Cog):
 
 
     async def handle_disarm(self, interaction: discord.Interaction) -> None:
-        key = self._session_key(interaction.guild_id, interaction.channel_id)
+        key = self._interaction_session_key(interaction)
         current_session = await self.sessions.get(key)
         if current_session is None:
             await interaction.response.send_message("No traps challenge the party right now.", ephemeral=True)
@@ -5757,123 +6885,120 @@ class DungeonCog(commands.Cog):
         if interaction.user.id not in current_session.party_ids:
             if not await self._ensure_character_available(interaction):
                 return
-        added_member = False
-        party_snapshot: tuple[int, ...] = ()
-        attempted_trap: Optional[Trap] = None
-        disarm_result: Optional[SavingThrowResult] = None
-        dc = 15
-        ability = "DEX"
-        room_id: Optional[int] = None
-        loot_cursor = 0
-        trap_trigger: Optional[Trap] = None
-        trigger_reason: Optional[str] = None
-        no_trap_available = False
 
-        def mutate(run: DungeonSession) -> None:
-            nonlocal added_member, party_snapshot, attempted_trap, disarm_result, dc, ability, room_id, loot_cursor, trap_trigger, trigger_reason, no_trap_available
-            if interaction.user.id not in run.party_ids:
-                run.party_ids.add(interaction.user.id)
-                added_member = True
-            party_snapshot = tuple(sorted(run.party_ids))
+        def pick_trap(run: DungeonSession) -> DisarmOutcome:
+            outcome = DisarmOutcome()
+            outcome.added_member = run.add_party_member(interaction.user.id)
+            party_snapshot = run.party_snapshot()
+            outcome.party_snapshot = party_snapshot
             room = run.room
+            # _ensure_room_trap_state also prepares the room's discovery maps.
             self._ensure_room_trap_state(run, room)
-            self._ensure_room_discovery_state(run, room)
-            traps = list(room.encounter.traps)
-            if not traps:
-                no_trap_available = True
-                return
             room_id_local = run.current_room
-            room_id = room_id_local
-            discovered = run.discovered_traps.get(room_id_local, set())
-            if not discovered:
-                no_trap_available = True
-                return
-            states = run.trap_states.setdefault(room_id_local, {})
+            queue = run.disarmable_queue.get(room_id_local)
             trap_local: Optional[Trap] = None
-            for trap in traps:
-                if trap.key not in discovered:
-                    continue
-                status = states.get(trap.key, "hidden")
-                if status in ("disarmed", "sprung"):
-                    continue
-                trap_local = trap
-                break
+            if queue:
+                trap_local = run.trap_catalog.get(room_id_local, {}).get(queue[0])
             if trap_local is None:
-                no_trap_available = True
-                return
-            attempted_trap = trap_local
-            run.trap_catalog.setdefault(room_id_local, {}).setdefault(trap_local.key, trap_local)
-            saving_throw_data = trap_local.saving_throw or {}
-            ability_value = saving_throw_data.get("ability", "DEX")
-            ability = str(ability_value).upper()
-            dc_raw = saving_throw_data.get("dc", 15)
-            try:
-                dc_value = int(dc_raw)
-            except (TypeError, ValueError):
-                dc_value = 15
-            dc = dc_value
-            loot_cursor = run.loot_cursor if party_snapshot else 0
-            disarm_result = saving_throw(save_bonus=5, dc=dc_value)
-            if disarm_result.success:
-                self._set_trap_status(run, room_id_local, trap_local.key, "disarmed")
-                remaining = [trap for trap in traps if trap.key != trap_local.key]
-                if len(remaining) != len(traps):
-                    run.room.encounter = replace(run.room.encounter, traps=tuple(remaining))
-            else:
-                self._set_trap_status(run, room_id_local, trap_local.key, "sprung")
-                trap_trigger = trap_local
-                trigger_reason = "disarm"
-                remaining = [trap for trap in traps if trap.key != trap_local.key]
-                if len(remaining) != len(traps):
-                    run.room.encounter = replace(run.room.encounter, traps=tuple(remaining))
-
-        session = await self.sessions.update(key, mutate)
-        if session is None:
+                outcome.no_trap_available = True
+                return outcome
+            outcome.room_id = room_id_local
+            outcome.trap = trap_local
+            outcome.ability = trap_local.save_ability or "DEX"
+            if trap_local.save_dc is not None:
+                outcome.dc = trap_local.save_dc
+            outcome.loot_cursor = run.loot_cursor if party_snapshot else 0
+            return outcome
+
+        session, outcome = await self.sessions.update_with_result(key, pick_trap)
+        if session is None or outcome is None:
             await interaction.response.send_message("No traps challenge the party right now.", ephemeral=True)
             return
 
-        await interaction.response.defer(ephemeral=True)
-        if added_member and interaction.guild_id is not None:
-            await self._handle_party_membership_change(interaction.guild_id, session)
-        if attempted_trap is None or disarm_result is None:
-            await self._refresh_session_message(interaction, session)
-            if no_trap_available:
-                await interaction.followup.send(
-                    "No revealed traps are ready to be disarmed.",
-                    ephemeral=True,
+        if outcome.trap is not None and outcome.room_id is not None:
+            # Roll outside the lock; the second mutation only records the result.
+            picked_trap = outcome.trap
+            picked_room = outcome.room_id
+            disarm_result = saving_throw(save_bonus=5, dc=outcome.dc)
+
+            def apply_result(run: DungeonSession) -> bool:
+                states = run.trap_states.setdefault(picked_room, {})
+                if states.get(picked_trap.key, "hidden") != "discovered":
+                    return False
+                status: TrapStatus = "disarmed" if disarm_result.success else "sprung"
+                if disarm_result.success:
+                    run.traps_disarmed += 1
+                self._update_trap_status(
+                    states,
+                    run.discovered_traps,
+                    picked_room,
+                    run.disarmable_queue.setdefault(picked_room, deque()),
+                    picked_trap.key,
+                    status,
                 )
+                return True
+
+            updated_session, applied = await self.sessions.update_with_result(
+                key, apply_result
+            )
+            if updated_session is not None:
+                session = updated_session
+            if applied:
+                outcome.disarm = disarm_result
+                if not disarm_result.success:
+                    outcome.trigger_reason = "disarm"
             else:
-                await interaction.followup.send(
-                    "There are no traps present in this room.",
-                    ephemeral=True,
-                )
+                outcome.trap = None
+                outcome.no_trap_available = True
+
+        attempted_trap = outcome.trap
+        disarm_result = outcome.disarm
+        if attempted_trap is None or disarm_result is None:
+            # Nothing slow happens on this path, so answer without deferring.
+            if outcome.no_trap_available:
+                message = "No revealed traps are ready to be disarmed."
+            else:
+                message = "There are no traps present in this room."
+            await interaction.response.send_message(message, ephemeral=True)
+            if outcome.added_member:
+                await self._handle_party_membership_change(interaction.guild_id, session)
+            self._schedule_refresh(interaction, session)
             return
 
+        await interaction.response.defer(ephemeral=True)
+        if outcome.added_member:
+            await self._handle_party_membership_change(interaction.guild_id, session)
+        party_snapshot = outcome.party_snapshot
+        loot_cursor = outcome.loot_cursor
+        dc = outcome.dc
+
         triggered_lines: list[str] = []
-        if trap_trigger is not None:
+        if outcome.trigger_reason is not None:
             triggered_lines = await self._resolve_trap_trigger(
                 interaction,
                 session,
-                trap=trap_trigger,
+                trap=attempted_trap,
                 party_snapshot=party_snapshot,
             )
-            if trigger_reason == "disarm":
+            if outcome.trigger_reason == "disarm":
                 triggered_lines = ["Your attempt destabilises the mechanism!", *triggered_lines]
 
-        check_summary = f"(Disarm roll {disarm_result.total}, DC {dc} {ability} save)"
+        check_summary = f"(Disarm roll {disarm_result.total}, DC {dc} {outcome.ability} save)"
         if disarm_result.success:
             reward_lines: list[str] = []
-            updated_session = await self.sessions.update(
-                key, lambda run: setattr(run, "traps_disarmed", run.traps_disarmed + 1)
-            )
-            if updated_session is not None:
-                session = updated_session
+            delivered_items = 0
+            delivered_gold = 0
+            next_cursor: Optional[int] = None
             if session.guild_id is not None and party_snapshot:
-                characters = await self._load_party_characters(session.guild_id, party_snapshot)
+                characters = await self._load_party_characters_cached(
+                    session.guild_id, party_snapshot, session.party_version
+                )
                 if characters:
-                    order = eligible_order(party_snapshot, loot_cursor, characters.keys())
+                    order = eligible_order_cached(
+                        party_snapshot, loot_cursor, frozenset(characters)
+                    )
                     reward_amount = trap_reward_value(attempted_trap, dc)
-                    shares = split_gold(reward_amount, order)
+                    shares = split_gold_cached(reward_amount, order)
                     if shares:
                         (
                             _,
@@ -5884,25 +7009,27 @@ class DungeonCog(commands.Cog):
                         )
                         reward_lines.extend(gold_lines)
                         delivered_items, delivered_gold = delivered_totals
-                        if delivered_items or delivered_gold:
-
-                            def record_rewards(run: DungeonSession) -> None:
-                                run.treasure_items_claimed += delivered_items
-                                run.treasure_gold_claimed += delivered_gold
-
-                            updated_rewards = await self.sessions.update(
-                                key, record_rewards
-                            )
-                            if updated_rewards is not None:
-                                session = updated_rewards
                         if order and party_snapshot:
                             remainder = reward_amount % len(order)
                             if remainder:
                                 next_cursor = (loot_cursor + remainder) % len(party_snapshot)
-                                await self.sessions.update(
-                                    key, lambda run: setattr(run, "loot_cursor", next_cursor)
-                                )
-                                session.loot_cursor = next_cursor
+
+            # The hazard-pay totals cannot ride along with apply_result: the trap
+            # must be marked disarmed before anyone is paid, so a concurrent
+            # attempt on the same trap cannot pay out twice, and the totals are
+            # only known once the payout has been written.
+            def finalize(run: DungeonSession) -> None:
+                run.treasure_items_claimed += delivered_items
+                run.treasure_gold_claimed += delivered_gold
+                if next_cursor is not None:
+                    run.loot_cursor = next_cursor
+
+            if delivered_items or delivered_gold or next_cursor is not None:
+                updated_session = await self.sessions.update(key, finalize)
+                if updated_session is not None:
+                    session = updated_session
+            # The refresh edit runs in the background while the reply is sent.
+            self._schedule_refresh(interaction, session)
             message_lines = [
                 f"You disarm the {attempted_trap.name} with steady hands {check_summary}.",
             ]
@@ -5918,72 +7045,70 @@ class DungeonCog(commands.Cog):
             if triggered_lines:
                 lines.append("")
                 lines.extend(triggered_lines)
+            self._schedule_refresh(interaction, session)
             await interaction.followup.send("\n".join(lines), ephemeral=True)
-        await self._refresh_session_message(interaction, session)
 
     async def handle_engage(self, interaction: discord.Interaction) -> None:
-        key = self._session_key(interaction.guild_id, interaction.channel_id)
+        key = self._interaction_session_key(interaction)
         current_session = await self.sessions.get(key)
         if current_session is None:
             await interaction.response.send_message("No foes stand before the party right now.", ephemeral=True)
             return
-        added_member = False
         started_combat = False
-        combat_in_progress = False
-        no_targets = False
-        should_start_combat = False
-        trigger_monster_turns = False
-        party_snapshot: tuple[int, ...] = ()
 
         if interaction.user.id not in current_session.party_ids:
             if not await self._ensure_character_available(interaction):
                 return
 
-        def mutate(run: DungeonSession) -> None:
-            nonlocal added_member, combat_in_progress, no_targets, should_start_combat, party_snapshot
-            if interaction.user.id not in run.party_ids:
-                run.party_ids.add(interaction.user.id)
-                added_member = True
+        def mutate(run: DungeonSession) -> EngageOutcome:
+            outcome = EngageOutcome()
+            outcome.added_member = run.add_party_member(interaction.user.id)
             combat = run.combat_state
             if combat and combat.active:
-                combat_in_progress = True
-                return
+                outcome.combat_in_progress = True
+                return outcome
             if not run.room.encounter.monsters:
-                no_targets = True
-                return
-            party_snapshot = tuple(sorted(run.party_ids))
+                outcome.no_targets = True
+                return outcome
+            outcome.party_snapshot = run.party_snapshot()
             run.stealthed = False
-            should_start_combat = True
+            outcome.should_start_combat = True
+            return outcome
 
-        session = await self.sessions.update(key, mutate)
-        if session is None:
+        session, outcome = await self.sessions.update_with_result(key, mutate)
+        if session is None or outcome is None:
             await interaction.response.send_message("No foes stand before the party right now.", ephemeral=True)
             return
+        combat_in_progress = outcome.combat_in_progress
 
         combat: Optional[CombatState] = None
-        if should_start_combat and not combat_in_progress and not no_targets and session is not None:
-            combat = await self._build_combat_state(interaction, session, party_snapshot)
+        if outcome.should_start_combat:
+            # Only building the encounter loads character sheets; every other
+            # branch replies straight away without a deferral round-trip.
+            await interaction.response.defer(ephemeral=True)
+            combat = await self._build_combat_state(interaction, session, outcome.party_snapshot)
 
-            def apply_combat(run: DungeonSession) -> None:
-                nonlocal started_combat, combat_in_progress, trigger_monster_turns
+            def apply_combat(run: DungeonSession) -> bool:
                 if run.combat_state and run.combat_state.active:
-                    combat_in_progress = True
-                    return
+                    return False
                 run.combat_state = combat
-                started_combat = True
-                trigger_monster_turns = True
+                return True
 
-            session = await self.sessions.update(key, apply_combat)
+            session, started_combat = await self.sessions.update_with_result(key, apply_combat)
             if session is None:
-                await interaction.response.send_message("No foes stand before the party right now.", ephemeral=True)
+                await self._send_ephemeral_message(
+                    interaction, "No foes stand before the party right now."
+                )
                 return
-            if trigger_monster_turns:
+            if started_combat:
                 self._schedule_automatic_turns(session, session.combat_state)
+            else:
+                combat_in_progress = True
 
-        if added_member and interaction.guild_id is not None:
+        if outcome.added_member:
             await self._handle_party_membership_change(interaction.guild_id, session)
 
-        if no_targets:
+        if outcome.no_targets:
             await self._send_ephemeral_message(
                 interaction,
                 "The room is eerily quiet—there is nothing to fight here.",
@@ -6002,16 +7127,16 @@ class DungeonCog(commands.Cog):
                 message = "Combat is underway—stand by while the monsters act."
             else:
                 message = "Combat has already concluded in this room."
+            self._schedule_refresh(interaction, session)
             await self._send_ephemeral_message(interaction, message)
-            await self._refresh_session_message(interaction, session)
             return
 
         if not started_combat or combat is None:
+            self._schedule_refresh(interaction, session)
             await self._send_ephemeral_message(
                 interaction,
                 "Unable to begin combat at this time.",
             )
-            await self._refresh_session_message(interaction, session)
             return
 
         if combat.active:
@@ -6026,8 +7151,8 @@ class DungeonCog(commands.Cog):
         else:
             message = "The battle is over before it truly begins."
 
+        self._schedule_refresh(interaction, session)
         await self._send_ephemeral_message(interaction, message)
-        await self._refresh_session_message(interaction, session)
 
     async def handle_combat_action(
         self,
@@ -6044,7 +7169,7 @@ class DungeonCog(commands.Cog):
         ],
         selection: Optional[str] = None,
     ) -> None:
-        key = self._session_key(interaction.guild_id, interaction.channel_id)
+        key = self._interaction_session_key(interaction)
         current_session = await self.sessions.get(key)
         if current_session is None:
             await self._send_ephemeral_message(
@@ -6052,25 +7177,17 @@ class DungeonCog(commands.Cog):
                 "No active dungeon for this party.",
             )
             return
-        added_member = False
-        error: Optional[str] = None
-        summary: Optional[str] = None
-        trigger_monster_turns = False
-        pending_fallen: list[CombatantState] = []
-
         if interaction.user.id not in current_session.party_ids:
             if not await self._ensure_character_available(interaction):
                 return
 
-        def mutate(run: DungeonSession) -> None:
-            nonlocal added_member, error, summary, trigger_monster_turns, pending_fallen
-            if interaction.user.id not in run.party_ids:
-                run.party_ids.add(interaction.user.id)
-                added_member = True
+        def mutate(run: DungeonSession) -> CombatActionOutcome:
+            outcome = CombatActionOutcome()
+            outcome.added_member = run.add_party_member(interaction.user.id)
             combat = run.combat_state
             if combat is None or not combat.active:
-                error = "Combat isn't currently active."
-                return
+                outcome.error = "Combat isn't currently active."
+                return outcome
             current = combat.current_combatant()
             if (
                 current is None
@@ -6078,63 +7195,60 @@ class DungeonCog(commands.Cog):
                 or current.user_id != interaction.user.id
                 or current.defeated
             ):
-                error = "It isn't your turn to act."
-                return
+                outcome.error = "It isn't your turn to act."
+                return outcome
 
             consumes_turn = True
             if action == "weapon" or action == "attack":
-                summary = self._player_weapon_attack(run, combat, current, selection)
-                pending_fallen.extend(self._identify_newly_fallen(run, combat))
+                outcome.summary = self._player_weapon_attack(run, combat, current, selection)
             elif action == "spell":
-                summary = self._player_cast_spell(run, combat, current, selection)
-                pending_fallen.extend(self._identify_newly_fallen(run, combat))
+                outcome.summary = self._player_cast_spell(run, combat, current, selection)
             elif action == "feature":
-                summary = self._player_use_feature(run, combat, current, selection)
-                pending_fallen.extend(self._identify_newly_fallen(run, combat))
+                outcome.summary = self._player_use_feature(run, combat, current, selection)
             elif action == "defend":
-                summary = self._player_defend(combat, current)
-                pending_fallen.extend(self._identify_newly_fallen(run, combat))
+                outcome.summary = self._player_defend(combat, current)
             elif action == "end":
                 combat.log.append(f"{current.name} ends their turn without further action.")
                 self._trim_combat_log(combat)
-                summary = "You end your turn."
+                outcome.summary = "You end your turn."
             elif action == "death_save":
                 if current.current_hp > 0:
-                    error = "You are still conscious—you don't need a death save."
-                    return
+                    outcome.error = "You are still conscious—you don't need a death save."
+                    return outcome
                 if current.is_dead:
-                    error = "You have already succumbed to your wounds."
-                    return
+                    outcome.error = "You have already succumbed to your wounds."
+                    return outcome
                 if current.stable:
-                    error = "You are stable and cannot roll another death save."
-                    return
-                summary = self._player_roll_death_save(run, combat, current)
-                pending_fallen.extend(self._identify_newly_fallen(run, combat))
+                    outcome.error = "You are stable and cannot roll another death save."
+                    return outcome
+                outcome.summary = self._player_roll_death_save(run, combat, current)
             elif action == "target":
                 consumes_turn = False
                 target_identifier = self._resolve_target_identifier(selection)
                 if not target_identifier:
-                    error = "That target cannot be selected."
-                    return
+                    outcome.error = "That target cannot be selected."
+                    return outcome
                 target = self._find_combatant_by_identifier(combat, target_identifier)
                 if target is None or target.is_player or target.defeated:
-                    error = "That target is no longer available."
-                    return
+                    outcome.error = "That target is no longer available."
+                    return outcome
                 current.selected_target = target.identifier
-                summary = f"You focus on {target.name}."
+                outcome.summary = f"You focus on {target.name}."
                 combat.current_action = {
                     "actor": current.name,
                     "state": "targeting",
                     "summary": f"Taking aim at {target.name}",
-                    "detail": summary,
+                    "detail": outcome.summary,
                     "emoji": "🎯",
                     "team": "player",
                 }
                 combat.log.append(f"{current.name} focuses on {target.name}.")
                 self._trim_combat_log(combat)
             else:  # pragma: no cover - defensive
-                error = "Unknown combat action."
-                return
+                outcome.error = "Unknown combat action."
+                return outcome
+
+            outcome.pending_fallen.extend(self._identify_newly_fallen(run, combat))
 
             if consumes_turn:
                 combat.waiting_for = None
@@ -6143,38 +7257,42 @@ class DungeonCog(commands.Cog):
                     next_combatant = combat.advance_turn()
                     if next_combatant is None:
                         self._finish_combat(run, combat, victory=False)
+                    elif next_combatant.is_player and next_combatant.current_hp > 0:
+                        # Handing the turn to a conscious player needs no background task.
+                        self._await_player_turn(combat, next_combatant)
                     else:
-                        nonlocal trigger_monster_turns
-                        trigger_monster_turns = True
+                        outcome.trigger_monster_turns = True
             else:
                 combat.waiting_for = current.user_id
+            return outcome
 
-        session = await self.sessions.update(key, mutate)
-        if session is None:
+        session, outcome = await self.sessions.update_with_result(key, mutate)
+        if session is None or outcome is None:
             await self._send_ephemeral_message(
                 interaction,
                 "No active dungeon for this party.",
             )
             return
 
-        for fallen in pending_fallen:
+        for fallen in outcome.pending_fallen:
             await self._announce_player_death(session, fallen)
 
-        if trigger_monster_turns:
+        if outcome.trigger_monster_turns:
             self._schedule_automatic_turns(session, session.combat_state)
 
-        if added_member and interaction.guild_id is not None:
+        if outcome.added_member:
             await self._handle_party_membership_change(interaction.guild_id, session)
 
-        if error is not None:
-            await self._send_ephemeral_message(interaction, error)
+        if outcome.error is not None:
+            await self._send_ephemeral_message(interaction, outcome.error)
             return
 
+        summary = outcome.summary
         if summary is None:
             summary = "Your action resolves."  # fallback message
 
+        self._schedule_refresh(interaction, session)
         await self._send_ephemeral_message(interaction, summary)
-        await self._refresh_session_message(interaction, session)
 
 
 async def setup(bot: commands.Bot) -> None:
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -251,7 +252,9 @@ class Character:
     @classmethod
     def from_dict(cls, data: Mapping[str, object]) -> "Character":
         race_key = str(data["race"]).lower()
-        class_key = str(data["class"]).lower()
+        # Class keys index the class tables on every combat build; intern them so
+        # lookups against the loaded keys short-circuit on identity.
+        class_key = sys.intern(str(data["class"]).lower())
         background_value = data.get("background")
         background_key = str(background_value).lower() if background_value else None
         base_source = data.get("base_ability_scores") or data.get("ability_scores")
@@ -468,7 +471,7 @@ def _load_classes(equipment_lookup: Mapping[str, EquipmentItem]) -> Dict[str, Ch
     classes: Dict[str, CharacterClass] = {}
     for entry in _require_sequence("classes", raw):
         mapping = _require_mapping("class entry", entry)
-        key = str(mapping.get("key") or mapping.get("id") or mapping.get("name")).lower()
+        key = sys.intern(str(mapping.get("key") or mapping.get("id") or mapping.get("name")).lower())
         if not key:
             raise SRDLoadError("Class entry missing key")
         name = str(mapping.get("name") or key.title())
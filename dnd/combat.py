@@ -4,7 +4,7 @@ from __future__ import annotations
 
 import random
 from dataclasses import dataclass
-from typing import Iterable, List, Sequence, Tuple
+from typing import AbstractSet, Iterable, List, Sequence, Tuple
 
 from .characters import AbilityScores
 from .dungeon import MonsterDefinition
@@ -256,6 +256,31 @@ def saving_throw(
     return SavingThrowResult(total=total, roll=roll, natural=natural, success=success)
 
 
+# (numerator, denominator) damage multipliers indexed by
+# ``immune << 2 | vulnerable << 1 | resistant``. Immunity wins outright and
+# resistance cancels vulnerability.
+_DAMAGE_FACTORS: Tuple[Tuple[int, int], ...] = (
+    (1, 1),  # no trait
+    (1, 2),  # resistant
+    (2, 1),  # vulnerable
+    (1, 1),  # resistant and vulnerable cancel out
+    (0, 1),
+    (0, 1),
+    (0, 1),
+    (0, 1),
+)
+
+
+def _damage_type_set(values: Iterable[str] | None) -> AbstractSet[str]:
+    # Callers that normalise their traits up front pass lowercase frozensets,
+    # which are reused without copying; anything else is lowercased here.
+    if isinstance(values, frozenset) and all(
+        damage_type.islower() for damage_type in values
+    ):
+        return values
+    return {damage_type.lower() for damage_type in (values or ())}
+
+
 def apply_damage(
     packets: Sequence[DamagePacket],
     *,
@@ -263,32 +288,32 @@ def apply_damage(
     vulnerabilities: Iterable[str] | None = None,
     immunities: Iterable[str] | None = None,
 ) -> int:
-    """Calculate final damage after applying resistances and vulnerabilities."""
+    """Calculate final damage after applying resistances and vulnerabilities.
+
+    Damage types are matched case-insensitively.
+    """
 
-    resistance_set = {damage_type.lower() for damage_type in (resistances or [])}
-    vulnerability_set = {damage_type.lower() for damage_type in (vulnerabilities or [])}
-    immunity_set = {damage_type.lower() for damage_type in (immunities or [])}
+    resistance_set = _damage_type_set(resistances)
+    vulnerability_set = _damage_type_set(vulnerabilities)
+    immunity_set = _damage_type_set(immunities)
 
     total = 0
     for packet in packets:
         amount = max(0, packet.amount)
         if amount == 0:
             continue
-        damage_type = packet.damage_type.lower() if packet.damage_type else None
-        if damage_type and damage_type in immunity_set:
+        damage_type = packet.damage_type
+        if not damage_type:
+            total += amount
             continue
-        adjusted = amount
-        if damage_type:
-            resistant = damage_type in resistance_set
-            vulnerable = damage_type in vulnerability_set
-            if resistant and vulnerable:
-                # They cancel out.
-                resistant = vulnerable = False
-            if resistant:
-                adjusted = amount // 2
-            elif vulnerable:
-                adjusted = amount * 2
-        total += adjusted
+        if not damage_type.islower():
+            damage_type = damage_type.lower()
+        numerator, denominator = _DAMAGE_FACTORS[
+            (damage_type in immunity_set) << 2
+            | (damage_type in vulnerability_set) << 1
+            | (damage_type in resistance_set)
+        ]
+        total += amount * numerator // denominator
     return total
 
 
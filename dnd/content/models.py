@@ -47,6 +47,14 @@ class Monster:
     damage: str
     ability_scores: Mapping[str, int] = field(default_factory=dict)
     tags: Sequence[str] = field(default_factory=tuple)
+    initiative_bonus: int = field(default=0, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Every combat rolls initiative for the encounter's monsters; derive the
+        # Dexterity modifier once rather than on each roll.
+        dex_score = self.ability_scores.get("DEX") if self.ability_scores else None
+        if dex_score is not None:
+            object.__setattr__(self, "initiative_bonus", (int(dex_score) - 10) // 2)
 
     @classmethod
     def from_mapping(cls, key: str, data: Mapping[str, object]) -> "Monster":
@@ -81,7 +89,7 @@ class Monster:
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Trap:
     """Static data describing an interactable trap."""
 
@@ -91,6 +99,25 @@ class Trap:
     saving_throw: Mapping[str, object] | None = None
     damage: str | None = None
     tags: Sequence[str] = field(default_factory=tuple)
+    save_ability: str | None = field(default=None, init=False, repr=False, compare=False)
+    save_dc: int | None = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Normalise the saving throw once; ``None`` means the content left it unset.
+        ability: str | None = None
+        dc: int | None = None
+        if self.saving_throw:
+            ability_raw = self.saving_throw.get("ability")
+            if ability_raw:
+                ability = str(ability_raw).upper()
+            dc_raw = self.saving_throw.get("dc")
+            if dc_raw is not None:
+                try:
+                    dc = int(dc_raw)
+                except (TypeError, ValueError):
+                    dc = None
+        object.__setattr__(self, "save_ability", ability)
+        object.__setattr__(self, "save_dc", dc)
 
     @classmethod
     def from_mapping(cls, key: str, data: Mapping[str, object]) -> "Trap":
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Iterable, Mapping, Sequence
 
 from dnd.content import Item, Trap
@@ -92,6 +93,22 @@ def split_gold(amount: int, order: Sequence[int]) -> list[RewardShare]:
     return shares
 
 
+@lru_cache(maxsize=1024)
+def eligible_order_cached(
+    party_order: tuple[int, ...], start_index: int, eligible: frozenset[int]
+) -> tuple[int, ...]:
+    """Memoised :func:`eligible_order` for hashable party snapshots."""
+
+    return tuple(eligible_order(party_order, start_index, eligible))
+
+
+@lru_cache(maxsize=4096)
+def split_gold_cached(amount: int, order: tuple[int, ...]) -> tuple[RewardShare, ...]:
+    """Memoised :func:`split_gold`; the shares are frozen so they can be shared."""
+
+    return tuple(split_gold(amount, order))
+
+
 def allocate_loot(
     items: Sequence[Item],
     party_order: Sequence[int],
@@ -5,7 +5,7 @@ from __future__ import annotations
 import asyncio
 import json
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Callable, Dict, FrozenSet, Iterable, Mapping, Optional, Set, Tuple
 
 from .characters import Character
 
@@ -19,6 +19,16 @@ class CharacterRepository:
         self._cache: Dict[str, Dict[str, Dict[str, object]]] = {}
         self._loaded = False
         self._storage_serial: Optional[tuple[int, int]] = None
+        self._generation = 0
+
+    @property
+    def generation(self) -> int:
+        """Counter bumped whenever the stored characters may have changed.
+
+        Callers caching decoded characters compare it to know when to re-read.
+        """
+
+        return self._generation
 
     async def _ensure_loaded(self) -> None:
         current_serial = await self._current_storage_serial()
@@ -31,6 +41,7 @@ class CharacterRepository:
             self._storage_serial = None
             return
         self._cache = {}
+        self._generation += 1
         data = await asyncio.to_thread(self._storage_path.read_text)
         if data.strip():
             try:
@@ -50,6 +61,7 @@ class CharacterRepository:
         self._storage_serial = current_serial
 
     async def _persist(self) -> None:
+        self._generation += 1
         self._storage_path.parent.mkdir(parents=True, exist_ok=True)
         text = json.dumps(self._cache, indent=2, sort_keys=True)
         await asyncio.to_thread(self._storage_path.write_text, text)
@@ -72,6 +84,38 @@ class CharacterRepository:
             raw = guild_bucket.get(str(user_id))
             return Character.from_dict(raw) if raw else None
 
+    async def get_many(
+        self, guild_id: int, user_ids: Iterable[int]
+    ) -> Dict[int, Character]:
+        """Return the characters stored for ``user_ids`` keyed by user id.
+
+        The storage is checked and locked once for the whole batch. Users without
+        a character, or whose stored payload cannot be decoded, are omitted.
+        """
+
+        characters, _ = await self.load_many(guild_id, user_ids)
+        return characters
+
+    async def load_many(
+        self, guild_id: int, user_ids: Iterable[int]
+    ) -> Tuple[Dict[int, Character], FrozenSet[int]]:
+        """Like :meth:`get_many`, also returning the ids whose payload failed to decode."""
+
+        async with self._lock:
+            await self._ensure_loaded()
+            guild_bucket = self._cache.get(str(guild_id), {})
+            characters: Dict[int, Character] = {}
+            failed: Set[int] = set()
+            for user_id in user_ids:
+                raw = guild_bucket.get(str(user_id))
+                if not raw:
+                    continue
+                try:
+                    characters[user_id] = Character.from_dict(raw)
+                except (KeyError, ValueError):
+                    failed.add(user_id)
+            return characters, frozenset(failed)
+
     async def exists(self, guild_id: int, user_id: int) -> bool:
         async with self._lock:
             await self._ensure_loaded()
@@ -85,6 +129,39 @@ class CharacterRepository:
             guild_bucket[str(character.user_id)] = character.to_dict()
             await self._persist()
 
+    async def update_many(
+        self,
+        guild_id: int,
+        updates: Mapping[int, Callable[[Character], Character]],
+    ) -> Dict[int, Character]:
+        """Apply ``updates`` to the stored characters and persist them in one write.
+
+        Each callable receives the character as currently stored, so changes saved
+        since the caller last read it are kept. Users without a stored character,
+        or whose payload cannot be decoded, are skipped rather than recreated.
+        """
+
+        if not updates:
+            return {}
+        async with self._lock:
+            await self._ensure_loaded()
+            guild_bucket = self._cache.get(str(guild_id), {})
+            updated: Dict[int, Character] = {}
+            for user_id, update in updates.items():
+                raw = guild_bucket.get(str(user_id))
+                if not raw:
+                    continue
+                try:
+                    current = Character.from_dict(raw)
+                except (KeyError, ValueError):
+                    continue
+                character = update(current)
+                guild_bucket[str(user_id)] = character.to_dict()
+                updated[user_id] = character
+            if updated:
+                await self._persist()
+            return updated
+
     async def clear(self, guild_id: int, user_id: int) -> None:
         async with self._lock:
             await self._ensure_loaded()
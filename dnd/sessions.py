@@ -3,11 +3,12 @@
 from __future__ import annotations
 
 import asyncio
-from typing import Callable, Dict, Generic, Optional, Tuple, TypeVar
+from typing import Callable, Dict, FrozenSet, Generic, Optional, Set, Tuple, TypeVar
 
 SessionKey = Tuple[Optional[int], int]
 
 T = TypeVar("T")
+R = TypeVar("R")
 
 
 class SessionManager(Generic[T]):
@@ -19,10 +20,12 @@ class SessionManager(Generic[T]):
     several buttons are pressed at the same time).
     """
 
-    __slots__ = ("_sessions", "_lock")
+    __slots__ = ("_sessions", "_channels_by_guild", "_lock")
 
     def __init__(self) -> None:
         self._sessions: Dict[SessionKey, T] = {}
+        # Mirror of the session keys grouped by guild, kept in step with _sessions.
+        self._channels_by_guild: Dict[Optional[int], Set[int]] = {}
         self._lock = asyncio.Lock()
 
     @staticmethod
@@ -44,13 +47,17 @@ class SessionManager(Generic[T]):
 
         async with self._lock:
             self._sessions[key] = session
+            self._channels_by_guild.setdefault(key[0], set()).add(key[1])
             return session
 
     async def pop(self, key: SessionKey) -> Optional[T]:
         """Remove and return the session for ``key`` if it exists."""
 
         async with self._lock:
-            return self._sessions.pop(key, None)
+            session = self._sessions.pop(key, None)
+            if session is not None:
+                self._forget_channel(key)
+            return session
 
     async def clear_guild(self, guild_id: int) -> int:
         """Remove all sessions associated with ``guild_id``.
@@ -59,10 +66,19 @@ class SessionManager(Generic[T]):
         """
 
         async with self._lock:
-            to_remove = [key for key in self._sessions if key[0] == guild_id]
-            for key in to_remove:
-                del self._sessions[key]
-            return len(to_remove)
+            channel_ids = self._channels_by_guild.pop(guild_id, set())
+            for channel_id in channel_ids:
+                del self._sessions[(guild_id, channel_id)]
+            return len(channel_ids)
+
+    def _forget_channel(self, key: SessionKey) -> None:
+        guild_id, channel_id = key
+        channel_ids = self._channels_by_guild.get(guild_id)
+        if channel_ids is None:
+            return
+        channel_ids.discard(channel_id)
+        if not channel_ids:
+            del self._channels_by_guild[guild_id]
 
     async def update(self, key: SessionKey, mutator: Callable[[T], None]) -> Optional[T]:
         """Apply ``mutator`` to the session mapped to ``key``.
@@ -78,12 +94,32 @@ class SessionManager(Generic[T]):
             mutator(session)
             return session
 
+    async def update_with_result(
+        self, key: SessionKey, mutator: Callable[[T], R]
+    ) -> Tuple[Optional[T], Optional[R]]:
+        """Apply ``mutator`` like :meth:`update` and also return its result.
+
+        Returns ``(None, None)`` when no session is mapped to ``key``.
+        """
+
+        async with self._lock:
+            session = self._sessions.get(key)
+            if session is None:
+                return None, None
+            return session, mutator(session)
+
     async def keys(self) -> Tuple[SessionKey, ...]:
         """Return a snapshot of the active session keys."""
 
         async with self._lock:
             return tuple(self._sessions.keys())
 
+    async def channels_for_guild(self, guild_id: Optional[int]) -> FrozenSet[int]:
+        """Return a snapshot of the channel ids with an active session in ``guild_id``."""
+
+        async with self._lock:
+            return frozenset(self._channels_by_guild.get(guild_id, ()))
+
     async def values(self) -> Tuple[T, ...]:
         """Return a snapshot of the active session objects."""
 
@@ -49,6 +49,7 @@ def test_character_serialization_round_trip() -> None:
     assert restored.equipment
     assert restored.inventory == restored.equipment
     assert restored.gold_coins == 0
+    assert restored.class_key is restored.character_class.key
 
 
 def test_creation_state_validations() -> None:
@@ -1,4 +1,5 @@
 import asyncio
+import json
 from dataclasses import replace
 from pathlib import Path
 import sys
@@ -65,3 +66,38 @@ def test_repository_detects_external_updates(tmp_path) -> None:
         assert await repo_one.get(recreated.guild_id, recreated.user_id) == recreated
 
     asyncio.run(scenario())
+
+
+def test_repository_get_many_returns_stored_party(tmp_path) -> None:
+    async def scenario() -> None:
+        repo = CharacterRepository(tmp_path / "characters.json")
+        first = _make_character(name="First")
+        second = replace(first, user_id=789, name="Second")
+        await repo.save(first)
+        await repo.save(second)
+
+        characters = await repo.get_many(first.guild_id, (first.user_id, 999, second.user_id))
+
+        assert characters == {first.user_id: first, second.user_id: second}
+        assert await repo.get_many(1, (first.user_id,)) == {}
+
+    asyncio.run(scenario())
+
+
+def test_repository_load_many_reports_undecodable_payloads(tmp_path) -> None:
+    async def scenario() -> None:
+        storage = tmp_path / "characters.json"
+        repo = CharacterRepository(storage)
+        first = _make_character(name="First")
+        await repo.save(first)
+        payload = json.loads(storage.read_text())
+        payload[str(first.guild_id)]["789"] = {"name": "Broken"}
+        storage.write_text(json.dumps(payload))
+
+        characters, failed = await repo.load_many(first.guild_id, (first.user_id, 789, 999))
+
+        assert characters == {first.user_id: first}
+        assert failed == frozenset({789})
+        assert await repo.get_many(first.guild_id, (first.user_id, 789)) == characters
+
+    asyncio.run(scenario())
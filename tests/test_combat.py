@@ -64,6 +64,42 @@ def test_apply_damage_with_resistance_and_vulnerability() -> None:
     assert neutral_total == 12
 
 
+def test_apply_damage_matches_mixed_case_traits() -> None:
+    packets = [DamagePacket(amount=9, damage_type="Fire")]
+
+    assert apply_damage(packets, resistances=["FIRE"]) == 4
+    assert apply_damage(packets, resistances=frozenset({"Fire"})) == 4
+    assert apply_damage(packets, immunities=frozenset({"fire"})) == 0
+    assert apply_damage(packets, vulnerabilities=frozenset({"cold"})) == 9
+
+
+@pytest.mark.parametrize(
+    ("resistant", "vulnerable", "immune", "expected"),
+    [
+        (False, False, False, 7),
+        (True, False, False, 3),
+        (False, True, False, 14),
+        (True, True, False, 7),
+        (False, False, True, 0),
+        (True, True, True, 0),
+    ],
+)
+def test_apply_damage_trait_combinations(
+    resistant: bool, vulnerable: bool, immune: bool, expected: int
+) -> None:
+    def traits(enabled: bool) -> frozenset[str]:
+        return frozenset({"acid"}) if enabled else frozenset()
+
+    total = apply_damage(
+        [DamagePacket(amount=7, damage_type="acid"), DamagePacket(amount=2, damage_type=None)],
+        resistances=traits(resistant),
+        vulnerabilities=traits(vulnerable),
+        immunities=traits(immune),
+    )
+    # The untyped packet ignores every trait.
+    assert total == expected + 2
+
+
 def test_resolve_multiattack_aggregates_damage() -> None:
     rng = random.Random(0)
     attacks = [
@@ -8,9 +8,28 @@ import discord
 import pytest
 
 import dnd.combat as combat_utils
-from cogs.dungeon import CombatantState, CombatState, DungeonCog, DungeonSession
+from cogs.dungeon import (
+    ActionKind,
+    AttackOption,
+    CombatActionView,
+    CombatantState,
+    CombatOptions,
+    CombatState,
+    Condition,
+    ConditionSet,
+    DungeonCog,
+    DungeonSession,
+    SaveActionProfile,
+    WeaponDefinition,
+    _clone_resources,
+    _damage_type_key,
+    _parse_damage,
+    _proficiency_keys,
+    _roll_dice,
+)
 from dnd.content.models import EncounterTable, Monster, Theme
 from dnd.dungeon.generator import Dungeon, EncounterResult, Room
+from dnd.sessions import SessionManager
 
 
 def _make_session() -> DungeonSession:
@@ -69,6 +88,80 @@ def test_unique_monster_labels_assign_suffixes() -> None:
     assert labels == ["Skeleton 1", "Skeleton 2", "Zombie"]
 
 
+def test_build_combat_state_orders_initiative_and_keeps_ties_stable(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cog = _make_cog()
+    session = _make_session()
+    monsters = tuple(
+        Monster(
+            key=key,
+            name=name,
+            challenge=0.25,
+            armor_class=12,
+            hit_points=7,
+            attack_bonus=4,
+            damage="1d6",
+            ability_scores={"DEX": dex},
+        )
+        for key, name, dex in (("kobold", "Kobold", 10), ("goblin", "Goblin", 14), ("rat", "Rat", 10))
+    )
+    session.room.encounter = EncounterResult(
+        kind="combat", summary="", monsters=monsters, traps=(), loot=()
+    )
+    assert [monster.initiative_bonus for monster in monsters] == [0, 2, 0]
+    monkeypatch.setattr(random, "choices", lambda faces, *, k: [12, 10, 12][:k])
+
+    state = asyncio.run(
+        cog._build_combat_state(SimpleNamespace(guild_id=None), session, party_order=[])
+    )
+
+    assert [combatant.name for combatant in state.order] == ["Kobold", "Rat", "Goblin"]
+    assert [combatant.initiative_total for combatant in state.order] == [12, 12, 12]
+    assert state.order[2].initiative_roll == 10
+
+
+def test_build_combat_state_loads_the_party_in_one_batch() -> None:
+    cog = _make_cog()
+    session = _make_session()
+    calls: list[tuple[int, list[int]]] = []
+
+    async def load_many(
+        guild_id: int, user_ids: list[int]
+    ) -> tuple[dict[int, object], frozenset[int]]:
+        calls.append((guild_id, list(user_ids)))
+        return {}, frozenset({3})
+
+    cog.characters = SimpleNamespace(load_many=load_many)
+    cog.bot = SimpleNamespace(get_user=lambda _: None)
+    interaction = SimpleNamespace(guild_id=7, guild=None)
+
+    state = asyncio.run(cog._build_combat_state(interaction, session, party_order=[3, 1]))
+
+    assert calls == [(7, [3, 1])]
+    assert sorted(combatant.user_id for combatant in state.order) == [1, 3]
+    assert all(not combatant.metadata["character_loaded"] for combatant in state.order)
+    # Only the member whose stored character failed to decode is warned about.
+    warning = "Character data could not be loaded—using default combat profile."
+    assert sum(warning in entry for entry in state.log) == 1
+
+
+def test_build_combat_state_rolls_initiative_from_the_session_rng() -> None:
+    cog = _make_cog()
+    cog.bot = SimpleNamespace(get_user=lambda _: None)
+    interaction = SimpleNamespace(guild_id=None, guild=None)
+
+    def rolled() -> list[int]:
+        session = _make_session()
+        session.rng = random.Random(11)
+        state = asyncio.run(cog._build_combat_state(interaction, session, party_order=[1, 2, 3]))
+        return [combatant.initiative_roll for combatant in state.order]
+
+    first = rolled()
+    assert len(first) == 3 and all(1 <= roll <= 20 for roll in first)
+    assert rolled() == first
+
+
 def test_select_player_target_prefers_existing_selection() -> None:
     cog = _make_cog()
     player = CombatantState(
@@ -113,6 +206,8 @@ def test_select_player_target_prefers_existing_selection() -> None:
     assert target is enemy_b
 
     enemy_b.current_hp = 0
+    assert cog._select_player_target(state, player, update=False) is None
+    assert player.selected_target == enemy_b.identifier
     target = cog._select_player_target(state, player)
     assert target is enemy_a
     assert player.selected_target == enemy_a.identifier
@@ -331,6 +426,49 @@ def test_monster_save_action_applies_conditions(monkeypatch: pytest.MonkeyPatch)
     assert "fails the DC" in state.log[-1]
 
 
+def test_monster_batch_resolves_until_next_player(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog()
+    session = _make_session()
+    player = CombatantState(
+        identifier="player:7",
+        name="Hero",
+        initiative_roll=5,
+        initiative_total=5,
+        max_hp=40,
+        current_hp=40,
+        is_player=True,
+        user_id=7,
+        metadata={"armor_class": 10},
+    )
+    monsters = [
+        CombatantState(
+            identifier=f"monster:{index}",
+            name=f"Goblin {index + 1}",
+            initiative_roll=15 - index,
+            initiative_total=15 - index,
+            max_hp=7,
+            current_hp=7,
+            is_player=False,
+            metadata={"armor_class": 13, "attack_bonus": 4, "damage": "1d6+2"},
+        )
+        for index in range(2)
+    ]
+    state = CombatState(order=[*monsters, player], log=[], active=True)
+
+    monkeypatch.setattr(random, "choice", lambda seq: seq[0])
+    monkeypatch.setattr(DungeonCog, "_roll_damage", lambda self, *_, **__: 4)
+    monkeypatch.setattr(combat_utils, "roll_d20", lambda rng=None: 18)
+
+    fallen: list[CombatantState] = []
+    exhausted = cog._resolve_monster_batch(session, state, fallen)
+
+    assert exhausted is False
+    assert fallen == []
+    assert player.current_hp == 32
+    assert state.current_combatant() is player
+    assert state.round_number == 1
+
+
 def test_player_death_saves_and_target_selection(monkeypatch: pytest.MonkeyPatch) -> None:
     cog = _make_cog()
     downed = CombatantState(
@@ -397,6 +535,43 @@ def test_player_death_saves_and_target_selection(monkeypatch: pytest.MonkeyPatch
     assert "Critical failure" in summary
 
 
+def test_identify_newly_fallen_reports_each_death_once() -> None:
+    cog = _make_cog()
+    session = _make_session()
+    doomed = CombatantState(
+        identifier="player:5",
+        name="Doomed",
+        initiative_roll=9,
+        initiative_total=9,
+        max_hp=10,
+        current_hp=0,
+        is_player=True,
+        user_id=5,
+        metadata={},
+    )
+    survivor = CombatantState(
+        identifier="player:6",
+        name="Survivor",
+        initiative_roll=11,
+        initiative_total=11,
+        max_hp=10,
+        current_hp=10,
+        is_player=True,
+        user_id=6,
+        metadata={},
+    )
+    state = CombatState(order=[doomed, survivor], log=[], active=True)
+
+    assert cog._identify_newly_fallen(session, state) == []
+    assert state.surviving_players() == [doomed, survivor]
+
+    doomed.death_save_failures = 3
+    assert cog._identify_newly_fallen(session, state) == [doomed]
+    assert state.surviving_players() == [survivor]
+    assert cog._identify_newly_fallen(session, state) == []
+    assert session.fallen_players == {5}
+
+
 def test_player_spell_consumes_resources(monkeypatch: pytest.MonkeyPatch) -> None:
     cog = _make_cog()
     session = _make_session()
@@ -450,6 +625,90 @@ def test_player_spell_consumes_resources(monkeypatch: pytest.MonkeyPatch) -> Non
     assert "Magic Missile" in state.log[-1]
 
 
+def test_clone_resources_copies_nested_pools_independently() -> None:
+    marker = SimpleNamespace(uses=1)
+    payload = {"spell_slots": {"1": {"max": 2, "available": 2}}, "notes": ["ki"], "custom": marker}
+
+    cloned = _clone_resources(payload)
+    cloned["spell_slots"]["1"]["available"] = 0
+    cloned["notes"].append("rage")
+    cloned["custom"].uses = 0
+
+    assert payload == {"spell_slots": {"1": {"max": 2, "available": 2}}, "notes": ["ki"], "custom": marker}
+    assert marker.uses == 1
+
+
+def test_player_spell_effects_dispatch_through_routes() -> None:
+    cog = _make_cog()
+    session = _make_session()
+    monster = CombatantState(
+        identifier="monster:4",
+        name="Goblin",
+        initiative_roll=7,
+        initiative_total=7,
+        max_hp=12,
+        current_hp=12,
+        is_player=False,
+        metadata={"armor_class": 11},
+    )
+    player = CombatantState(
+        identifier="player:5",
+        name="Mage",
+        initiative_roll=12,
+        initiative_total=14,
+        max_hp=18,
+        current_hp=18,
+        is_player=True,
+        user_id=5,
+        metadata={"combat_options": {"spells": [{"name": "Smite", "type": "damage"}]}},
+    )
+    state = CombatState(order=[player, monster], log=[], active=True)
+
+    assert all(callable(getattr(cog, name)) for name in DungeonCog._SPELL_EFFECT_ROUTES.values())
+    summary = cog._player_cast_spell(session, state, player, selection=None)
+
+    assert summary == "You focus your energies with Smite, but nothing notable happens."
+    assert monster.current_hp == 12
+
+
+def test_player_save_spell_routes_to_its_handler(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog()
+    session = _make_session()
+    monkeypatch.setattr(combat_utils, "roll_d20", lambda rng=None: 2)
+    monkeypatch.setattr(DungeonCog, "_roll_damage", lambda self, *_, **__: 7)
+    monster = CombatantState(
+        identifier="monster:4",
+        name="Goblin",
+        initiative_roll=7,
+        initiative_total=7,
+        max_hp=12,
+        current_hp=12,
+        is_player=False,
+        metadata={"armor_class": 11, "saving_throws": {"DEX": 1}},
+    )
+    spell = {"name": "Acid Splash", "type": "save", "save_dc": 13, "save_ability": "DEX"}
+    player = CombatantState(
+        identifier="player:5",
+        name="Mage",
+        initiative_roll=12,
+        initiative_total=14,
+        max_hp=18,
+        current_hp=18,
+        is_player=True,
+        user_id=5,
+        metadata={"combat_options": {"spells": [spell]}},
+    )
+    state = CombatState(order=[player, monster], log=[], active=True)
+
+    summary = cog._player_cast_spell(session, state, player, selection=None)
+
+    assert summary == "Goblin fails the save (DC 13) against your Acid Splash, taking 7 damage."
+    assert monster.current_hp == 5
+    assert state.log[-1] == (
+        "Mage's Acid Splash forces Goblin to fail the save (DC 13), taking 7 damage."
+    )
+
+
 def test_player_death_announcement_clears_character_and_offers_return() -> None:
     async def _run() -> None:
         cog = _make_cog()
@@ -549,3 +808,928 @@ def test_player_death_announcement_clears_character_and_offers_return() -> None:
         assert fake_tavern.mention in message_content
 
     asyncio.run(_run())
+
+
+def test_player_turn_handoff_skips_automatic_turns() -> None:
+    async def _run() -> None:
+        cog = _make_cog()
+        cog.sessions = SessionManager()
+        cog._pending_refresh = {}
+        cog._refresh_session_message = AsyncMock()
+        scheduled: list[object] = []
+        cog._schedule_automatic_turns = lambda session, state: scheduled.append(state)
+
+        session = _make_session()
+        first = CombatantState(
+            identifier="player:1",
+            name="First",
+            initiative_roll=15,
+            initiative_total=15,
+            max_hp=12,
+            current_hp=12,
+            is_player=True,
+            user_id=1,
+            metadata={},
+        )
+        second = CombatantState(
+            identifier="player:2",
+            name="Second",
+            initiative_roll=10,
+            initiative_total=10,
+            max_hp=12,
+            current_hp=12,
+            is_player=True,
+            user_id=2,
+            metadata={},
+        )
+        monster = CombatantState(
+            identifier="monster:0",
+            name="Goblin",
+            initiative_roll=5,
+            initiative_total=5,
+            max_hp=7,
+            current_hp=7,
+            is_player=False,
+            metadata={},
+        )
+        session.party_ids.update({1, 2})
+        session.combat_state = CombatState(order=[first, second, monster], log=[], active=True)
+        key = cog._session_key(session.guild_id, session.channel_id)
+        await cog.sessions.set(key, session)
+
+        class DummyResponse:
+            def __init__(self) -> None:
+                self.messages: list[str] = []
+
+            def is_done(self) -> bool:
+                return bool(self.messages)
+
+            async def send_message(self, content: str, *, ephemeral: bool) -> None:
+                self.messages.append(content)
+
+        interaction = SimpleNamespace(
+            response=DummyResponse(),
+            guild_id=session.guild_id,
+            channel_id=session.channel_id,
+            user=SimpleNamespace(id=1),
+        )
+        await cog.handle_combat_action(interaction, "end")
+
+        state = session.combat_state
+        assert state.current_combatant() is second
+        assert state.waiting_for == 2
+        assert state.current_action and state.current_action["state"] == "awaiting action"
+        assert scheduled == []
+
+        interaction.user = SimpleNamespace(id=2)
+        interaction.response = DummyResponse()
+        await cog.handle_combat_action(interaction, "end")
+
+        assert state.current_combatant() is monster
+        assert scheduled == [state]
+
+    asyncio.run(_run())
+
+
+def test_combat_options_cached_until_metadata_replaced() -> None:
+    strike = {"name": "Strike", "attack_bonus": 5, "damage": "1d8+3"}
+    combatant = CombatantState(
+        identifier="player:9",
+        name="Hero",
+        initiative_roll=10,
+        initiative_total=10,
+        max_hp=10,
+        current_hp=10,
+        is_player=True,
+        user_id=9,
+        metadata={"combat_options": {"weapons": [strike, "broken"], "spells": "invalid"}},
+    )
+
+    options = combatant.combat_options()
+    assert options.weapons == (strike,)
+    assert options.spells == ()
+    assert options.features == ()
+    assert combatant.combat_options() is options
+
+    combatant.metadata["combat_options"] = {"features": [{"name": "Second Wind"}]}
+    refreshed = combatant.combat_options()
+    assert refreshed is not options
+    assert refreshed.weapons == ()
+    assert refreshed.features == ({"name": "Second Wind"},)
+
+
+def test_select_options_reused_until_loadout_changes() -> None:
+    combatant = CombatantState(
+        identifier="player:9",
+        name="Hero",
+        initiative_roll=10,
+        initiative_total=10,
+        max_hp=10,
+        current_hp=10,
+        is_player=True,
+        user_id=9,
+        metadata={
+            "combat_options": {
+                "weapons": [{"name": "Strike", "attack_bonus": 5, "damage": "1d8+3"}],
+                "spells": [],
+            }
+        },
+    )
+    view = CombatActionView.__new__(CombatActionView)
+
+    first = view._weapon_options(combatant)
+    second = view._weapon_options(combatant)
+    assert first is not second
+    assert [option.label for option in first] == ["Strike"]
+    assert first[0] is second[0]
+
+    spells, disabled = view._spell_options(combatant)
+    assert disabled is True
+    assert spells[0].label == "No spells prepared"
+
+    combatant.metadata["combat_options"] = {"weapons": [{"name": "Axe"}]}
+    rebuilt = view._weapon_options(combatant)
+    assert [option.label for option in rebuilt] == ["Axe"]
+
+
+def test_living_combatants_prunes_the_dead() -> None:
+    hero = CombatantState(
+        identifier="player:1",
+        name="Hero",
+        initiative_roll=12,
+        initiative_total=12,
+        max_hp=10,
+        current_hp=10,
+        is_player=True,
+        user_id=1,
+        metadata={},
+    )
+    goblin = CombatantState(
+        identifier="monster:0",
+        name="Goblin",
+        initiative_roll=8,
+        initiative_total=8,
+        max_hp=7,
+        current_hp=7,
+        is_player=False,
+        metadata={},
+    )
+    state = CombatState(order=[hero, goblin], log=[], active=True)
+
+    assert state.living_combatants() == (hero, goblin)
+    assert state.living_combatants(players=False) == (goblin,)
+
+    hero.current_hp = 0
+    hero.stable = True
+    assert state.living_combatants(players=True) == ()
+    assert state.any_living(players=True) is False
+    assert state.any_living(players=False) is True
+    assert state.contenders(players=True) == (hero,)
+
+    goblin.current_hp = 0
+    assert state.contenders() == (hero,)
+    assert state._contenders == [hero]
+
+    hero.death_save_failures = 3
+    state.mark_defeated(hero)
+    assert state._contenders == []
+
+
+def test_advance_turn_skips_fallen_and_counts_rounds() -> None:
+    combatants = [
+        CombatantState(
+            identifier=f"monster:{index}",
+            name=f"Goblin {index + 1}",
+            initiative_roll=10 - index,
+            initiative_total=10 - index,
+            max_hp=7,
+            current_hp=7,
+            is_player=False,
+            metadata={},
+        )
+        for index in range(4)
+    ]
+    state = CombatState(order=combatants, log=[], active=True)
+
+    assert state.advance_turn() is combatants[1]
+    combatants[2].current_hp = 0
+    assert state.advance_turn() is combatants[3]
+    assert state.round_number == 1
+    assert state.advance_turn() is combatants[0]
+    assert state.turn_index == 0
+    assert state.round_number == 2
+
+    for combatant in combatants[1:]:
+        combatant.current_hp = 0
+    assert state.advance_turn() is combatants[0]
+    assert state.round_number == 3
+
+    combatants[0].current_hp = 0
+    assert state.advance_turn() is None
+    assert state.turn_index == 0
+
+
+def test_advance_turn_resumes_after_a_directly_assigned_slot() -> None:
+    combatants = [
+        CombatantState(
+            identifier=f"monster:{index}",
+            name=f"Goblin {index + 1}",
+            initiative_roll=10 - index,
+            initiative_total=10 - index,
+            max_hp=7,
+            current_hp=7,
+            is_player=False,
+            metadata={},
+        )
+        for index in range(5)
+    ]
+    state = CombatState(order=combatants, log=[], active=True)
+    combatants[1].current_hp = 0
+    assert state.contenders() == (combatants[0], *combatants[2:])
+
+    # The fallen goblin's slot is no longer in the pool but still resumes in order.
+    state.turn_index = 1
+    assert state.advance_turn() is combatants[2]
+    state.turn_index = 4
+    assert state.advance_turn() is combatants[0]
+    assert state.round_number == 2
+
+
+def test_reassigning_order_resets_cached_combatant_views() -> None:
+    def goblins(prefix: str) -> list[CombatantState]:
+        return [
+            CombatantState(
+                identifier=f"{prefix}:{index}",
+                name=f"Goblin {index + 1}",
+                initiative_roll=10 - index,
+                initiative_total=10 - index,
+                max_hp=7,
+                current_hp=7,
+                is_player=index == 0,
+                metadata={},
+            )
+            for index in range(3)
+        ]
+
+    first = goblins("first")
+    state = CombatState(order=first, log=[], active=True)
+    assert state.advance_turn() is first[1]
+    assert state.surviving_players() == [first[0]]
+    assert state.contenders() == tuple(first)
+
+    # Same length as the previous order, so only identity reveals the change.
+    second = goblins("second")
+    state.order = second
+    state.turn_index = 0
+    assert state.advance_turn() is second[1]
+    assert state.turn_index == 1
+    assert state.surviving_players() == [second[0]]
+    assert state.contenders() == tuple(second)
+
+
+def test_default_spell_options_are_shared_read_only() -> None:
+    cog = _make_cog()
+    character = SimpleNamespace(character_class=SimpleNamespace(key="wizard"))
+    profile = {"ability": "INT", "attack_bonus": 5, "save_dc": 13}
+
+    first = cog._spell_options_for_character(character, {"INT": 16}, profile)
+    second = cog._spell_options_for_character(character, {"INT": 16}, profile)
+
+    assert [option["name"] for option in first] == ["Fire Bolt", "Magic Missile"]
+    assert first[0] is not second[0]
+    assert first[0]["attack_bonus"] == 5
+    assert (first[1]["save_dc"], first[1]["ability"], first[1]["level"]) == (13, "INT", 1)
+    first[0]["damage"] = "9d9"
+    assert second[0]["damage"] == "1d10"
+    with pytest.raises(TypeError):
+        first[1]["consumes"]["level"] = 9  # type: ignore[index]
+
+
+def test_condition_set_tracks_standard_conditions_as_bits() -> None:
+    conditions = ConditionSet(["poisoned", "Raging", " "])
+
+    assert conditions.mask == Condition.POISONED
+    assert "Poisoned" in conditions
+    assert Condition.POISONED in conditions
+    assert "Raging" in conditions
+    assert len(conditions) == 2
+
+    conditions.add(Condition.UNCONSCIOUS)
+    conditions.discard("POISONED")
+    conditions.discard("Raging")
+    assert list(conditions) == ["Unconscious"]
+    assert conditions == ConditionSet([Condition.UNCONSCIOUS])
+
+    conditions.discard(Condition.UNCONSCIOUS)
+    assert not conditions
+
+
+def test_condition_set_accepts_combined_flags() -> None:
+    conditions = ConditionSet([Condition.UNCONSCIOUS])
+    version = conditions.version
+
+    conditions.add(Condition.UNCONSCIOUS | Condition.PRONE)
+    assert list(conditions) == ["Prone", "Unconscious"]
+    assert conditions.version == version + 1
+
+    conditions.discard(Condition.UNCONSCIOUS | Condition.DEAD)
+    assert list(conditions) == ["Prone"]
+
+
+def test_condition_set_shares_label_and_custom_name_strings() -> None:
+    first = ConditionSet([Condition.PRONE, "".join(["Rag", "ing"])])
+    second = ConditionSet([Condition.PRONE, "".join(["Rag", "ing"])])
+
+    assert [a is b for a, b in zip(first, second)] == [True, True]
+
+
+def test_weapon_definition_parses_damage_die_once() -> None:
+    greataxe = WeaponDefinition(damage_die="2d6", categories=("martial weapons",))
+    broken = WeaponDefinition(damage_die="heavy", categories=())
+
+    assert (greataxe.damage_count, greataxe.damage_sides) == (2, 6)
+    assert (broken.damage_count, broken.damage_sides) == (1, 4)
+    assert greataxe.average_die == 7.0
+    assert broken.average_die == 2.5
+    assert greataxe.category_keys == frozenset({"martial weapons"})
+
+
+@pytest.mark.parametrize("count,sides", [(1, 1), (1, 4), (2, 6), (3, 8), (1, 12), (1, 20)])
+def test_roll_dice_stays_within_bounds(count: int, sides: int) -> None:
+    random.seed(1234)
+    totals = {_roll_dice(count, sides) for _ in range(500)}
+
+    assert min(totals) == count
+    assert max(totals) == count * sides
+
+
+def test_session_rng_makes_damage_rolls_reproducible() -> None:
+    cog = _make_cog()
+    first = _make_session()
+    second = _make_session()
+    first.rng = random.Random(7)
+    second.rng = random.Random(7)
+
+    rolls = [
+        cog._roll_damage("3d6+1", extra_dice=["1d8"], rng=DungeonCog._session_rng(session))
+        for session in (first, second, first, second)
+    ]
+
+    assert rolls[0] == rolls[1]
+    assert rolls[2] == rolls[3]
+    assert DungeonCog._session_rng(None) is None
+
+
+def test_empty_select_placeholders_are_shared() -> None:
+    first = CombatActionView._build_spell_options(CombatOptions())
+    second = CombatActionView._build_spell_options(CombatOptions())
+
+    assert [option.label for option in first] == ["No spells prepared"]
+    assert first is not second
+    assert first[0] is second[0]
+
+
+def test_roll_damage_shares_parse_cache_for_padded_expressions() -> None:
+    cog = _make_cog()
+    _parse_damage.cache_clear()
+
+    for expression in ("2d6+3", " 2d6+3 ", "2d6+3\n"):
+        assert 5 <= cog._roll_damage(expression) <= 15
+
+    info = _parse_damage.cache_info()
+    assert info.misses == 1
+    assert info.hits == 2
+
+
+def test_monster_actions_are_memoised_until_metadata_changes() -> None:
+    cog = _make_cog()
+    bite = {"key": "bite", "name": "Bite", "damage": "1d6"}
+    claw = {"key": "claw", "name": "Claw", "damage": "1d4"}
+    monster = CombatantState(
+        identifier="wolf",
+        name="Wolf",
+        initiative_roll=10,
+        initiative_total=12,
+        max_hp=11,
+        current_hp=11,
+        is_player=False,
+        metadata={
+            "actions": [bite, "broken", claw],
+            "multiattack": {"attacks": [{"ref": "bite", "count": 2}, "claw", "missing"]},
+        },
+    )
+
+    actions = cog._monster_actions(monster)
+    assert actions == (bite, claw)
+    assert cog._monster_actions(monster) is actions
+
+    multiattack = cog._expand_multiattack_actions(monster, actions)
+    assert multiattack == (bite, bite, claw)
+    assert cog._expand_multiattack_actions(monster, actions) is multiattack
+
+    monster.metadata["actions"] = [claw]
+    refreshed = cog._monster_actions(monster)
+    assert refreshed == (claw,)
+    assert cog._expand_multiattack_actions(monster, refreshed) == (claw,)
+
+
+def test_monster_action_index_keeps_first_action_per_key() -> None:
+    cog = _make_cog()
+    first = {"name": "Slam", "damage": "1d8"}
+    second = {"key": "slam", "damage": "2d8"}
+    monster = CombatantState(
+        identifier="golem",
+        name="Golem",
+        initiative_roll=5,
+        initiative_total=5,
+        max_hp=30,
+        current_hp=30,
+        is_player=False,
+        metadata={"actions": [first, second]},
+    )
+
+    actions = cog._monster_actions(monster)
+    index = cog._monster_action_index(monster, actions)
+
+    assert cog._find_monster_action(index, "SLAM") is first
+    assert cog._find_monster_action(index, None) is None
+    assert cog._monster_action_index(monster, actions) is index
+
+
+def test_damage_traits_are_cached_until_metadata_is_replaced() -> None:
+    cog = _make_cog()
+    target = CombatantState(
+        identifier="player:1",
+        name="Hero",
+        initiative_roll=10,
+        initiative_total=10,
+        max_hp=10,
+        current_hp=10,
+        is_player=True,
+        metadata={"resistances": ["Fire", " cold "], "immunities": "Poison"},
+    )
+
+    traits = cog._damage_traits(target)
+    assert traits == (frozenset({"fire", "cold"}), frozenset(), frozenset({"poison"}))
+    assert cog._damage_traits(target) is traits
+
+    target.metadata["vulnerabilities"] = ["Thunder"]
+    assert cog._damage_traits(target)[1] == frozenset({"thunder"})
+
+
+def test_monster_plan_is_compiled_once_per_metadata() -> None:
+    cog = _make_cog()
+    claw = {"key": "claw", "name": "Claw", "damage": "1d6", "damage_type": "slashing"}
+    breath = {"key": "breath", "name": "Breath", "type": "save", "save_dc": 12}
+    monster = CombatantState(
+        identifier="monster:1",
+        name="Wyrmling",
+        initiative_roll=5,
+        initiative_total=5,
+        max_hp=30,
+        current_hp=30,
+        is_player=False,
+        metadata={"actions": [breath, claw], "multiattack": ["claw", "claw"]},
+    )
+
+    plan = cog._monster_plan(monster)
+    assert plan.kind is ActionKind.MULTIATTACK
+    assert [attack.name for attack, _, _ in plan.attacks] == ["Claw", "Claw"]
+    assert cog._monster_plan(monster) is plan
+
+    monster.metadata["multiattack"] = []
+    plan = cog._monster_plan(monster)
+    assert (plan.kind, plan.name, plan.action) == (ActionKind.ATTACK, "Claw", claw)
+    assert plan.attacks[0][1] == "1d6"
+
+    monster.metadata["actions"] = [breath]
+    plan = cog._monster_plan(monster)
+    assert (plan.kind, plan.name, plan.attacks) == (ActionKind.SAVE, "Breath", ())
+    assert plan.save is not None and (plan.save.dc, plan.save.ability) == (12, "DEX")
+
+
+def test_monster_save_profile_coerces_static_fields() -> None:
+    cog = _make_cog()
+    monster = CombatantState(
+        identifier="monster:1",
+        name="Naga",
+        initiative_roll=5,
+        initiative_total=5,
+        max_hp=30,
+        current_hp=30,
+        is_player=False,
+        metadata={"save_dc": "14", "damage_type": " Poison "},
+    )
+
+    save = cog._monster_save_profile(
+        monster,
+        {
+            "save_ability": "con",
+            "damage": "2d8",
+            "half_on_success": 1,
+            "success_conditions": "",
+            "conditions_on_fail": ["Poisoned", " ", None],
+        },
+    )
+
+    assert save == SaveActionProfile(
+        name="Naga's spell",
+        dc=14,
+        ability="CON",
+        damage="2d8",
+        damage_type="poison",
+        half_on_success=True,
+        success_conditions=(),
+        fail_conditions=("Poisoned",),
+    )
+
+
+def test_choose_monster_action_prefers_melee_and_first_on_ties() -> None:
+    cog = _make_cog()
+    breath = {"name": "Breath", "type": "save"}
+    bite = {"name": "Bite", "type": "Melee"}
+    claw = {"name": "Claw"}
+    monster = CombatantState(
+        identifier="drake",
+        name="Drake",
+        initiative_roll=5,
+        initiative_total=5,
+        max_hp=30,
+        current_hp=30,
+        is_player=False,
+        metadata={"actions": [breath, bite, claw]},
+    )
+
+    actions = cog._monster_actions(monster)
+
+    assert cog._choose_monster_action(monster, actions) is bite
+    assert cog._choose_monster_action(monster, ()) is None
+
+
+def test_sync_combatant_state_reuses_unchanged_condition_names() -> None:
+    cog = _make_cog()
+    combatant = CombatantState(
+        identifier="hero",
+        name="Hero",
+        initiative_roll=10,
+        initiative_total=12,
+        max_hp=10,
+        current_hp=10,
+        is_player=True,
+    )
+    combatant.conditions.add("Poisoned")
+
+    cog._sync_combatant_state(combatant)
+    names = combatant.metadata["conditions"]
+    death_saves = combatant.metadata["death_saves"]
+    assert names == ["Poisoned"]
+
+    combatant.conditions.add("Poisoned")
+    cog._sync_combatant_state(combatant)
+    assert combatant.metadata["conditions"] is names
+    assert combatant.metadata["death_saves"] is death_saves
+
+    combatant.conditions.add(Condition.PRONE)
+    combatant.death_save_failures = 1
+    cog._sync_combatant_state(combatant)
+    assert combatant.metadata["conditions"] == ["Poisoned", "Prone"]
+    assert combatant.metadata["death_saves"]["failures"] == 1
+
+
+def test_resource_summary_lists_slots_in_level_order() -> None:
+    cog = _make_cog()
+    combatant = CombatantState(
+        identifier="mage",
+        name="Mage",
+        initiative_roll=10,
+        initiative_total=12,
+        max_hp=10,
+        current_hp=10,
+        is_player=True,
+        resources={
+            "spell_slots": {
+                "3": {"max": 2, "available": 1},
+                "1": {"max": 4, "available": 4},
+                "2": {"max": 3},
+            },
+            "feature_uses": {"Arcane Recovery": {"max": 1, "available": 0}},
+        },
+    )
+
+    summary = cog._summarise_combatant_resources(combatant)
+
+    assert summary == "Slots L1:4/4, L3:1/2 | Arcane Recovery: 0/1"
+
+
+def test_spell_slot_keys_are_normalised_to_strings() -> None:
+    cog = _make_cog()
+    resources = {"spell_slots": {1: {"max": 2, "available": 2}, "2": {"max": 1, "available": 1}}}
+
+    DungeonCog._normalise_spell_slot_keys(resources)
+
+    assert list(resources["spell_slots"]) == ["2", "1"]
+    player = CombatantState(
+        identifier="mage",
+        name="Mage",
+        initiative_roll=10,
+        initiative_total=12,
+        max_hp=10,
+        current_hp=10,
+        is_player=True,
+        resources=resources,
+    )
+    ok, error = cog._consume_resource(player, {"type": "spell_slot", "level": 1})
+    assert ok and error is None
+    assert resources["spell_slots"]["1"]["available"] == 1
+    assert cog._resource_status_text(player, {"type": "spell_slot", "level": 1}) == (
+        "Level 1 slots remaining: 1/2."
+    )
+
+
+@pytest.mark.parametrize(
+    "roll, successes, failures, stable",
+    [(2, 0, 2, False), (9, 0, 2, False), (10, 1, 1, True), (19, 1, 1, True)],
+)
+def test_death_save_steps_follow_roll_thresholds(
+    monkeypatch: pytest.MonkeyPatch, roll: int, successes: int, failures: int, stable: bool
+) -> None:
+    cog = _make_cog()
+    downed = CombatantState(
+        identifier="player:7",
+        name="Downed",
+        initiative_roll=8,
+        initiative_total=8,
+        max_hp=10,
+        current_hp=0,
+        is_player=True,
+        user_id=7,
+    )
+    downed.death_save_failures = 1
+    downed.stable = True
+    monkeypatch.setattr(DungeonCog, "_death_save_roll", lambda self=None: roll)
+
+    summary = cog._resolve_player_death_save(None, downed)
+
+    assert summary.startswith(f"Downed rolls a {roll} on their death save.")
+    assert downed.death_save_successes == successes
+    assert downed.death_save_failures == failures
+    assert downed.stable is stable
+
+
+@pytest.mark.parametrize(
+    "value, expected",
+    [
+        (None, set()),
+        ("  Fire ", {"fire"}),
+        ("   ", set()),
+        (["Cold", " cold", "", None, "  "], {"cold"}),
+        ({"a": "Poison", "b": "Necrotic"}, {"poison", "necrotic"}),
+        (b"fire", set()),
+        (5, set()),
+    ],
+)
+def test_normalise_damage_traits(value: object, expected: set) -> None:
+    assert DungeonCog._normalise_damage_traits(value) == expected
+
+
+def test_monster_attack_profile_falls_back_to_metadata_for_unset_fields() -> None:
+    cog = _make_cog()
+    monster = CombatantState(
+        identifier="monster:1",
+        name="Ogre",
+        initiative_roll=5,
+        initiative_total=5,
+        max_hp=30,
+        current_hp=30,
+        is_player=False,
+        metadata={"attack_bonus": 6, "damage": "2d8+4", "damage_type": "Bludgeoning"},
+    )
+
+    attack, damage_expr, extra_dice = cog._monster_attack_profile(
+        monster, {"name": "Club", "attack_bonus": None}
+    )
+    assert attack.name == "Club"
+    assert attack.attack_bonus == 6
+    assert damage_expr == "2d8+4"
+    assert attack.damage_packets[0].damage_type == "bludgeoning"
+    assert extra_dice == ()
+
+    attack, damage_expr, _ = cog._monster_attack_profile(
+        monster, {"damage": "1d4", "damage_type": "piercing"}
+    )
+    assert attack.name == "Ogre Attack"
+    assert damage_expr == "1d4"
+    assert attack.damage_packets[0].damage_type == "piercing"
+
+
+def test_damage_types_and_traits_share_interned_strings() -> None:
+    cog = _make_cog()
+    monster = CombatantState(
+        identifier="monster:1",
+        name="Imp",
+        initiative_roll=5,
+        initiative_total=5,
+        max_hp=10,
+        current_hp=10,
+        is_player=False,
+    )
+    attack, _, _ = cog._monster_attack_profile(monster, {"damage_type": "Fire "})
+    traits = DungeonCog._normalise_damage_traits(["FIRE"])
+
+    damage_type = attack.damage_packets[0].damage_type
+    assert damage_type == "fire"
+    assert next(iter(traits)) is damage_type
+    assert _damage_type_key("  ") is None
+
+
+def test_monster_swing_skips_damage_rolls_on_a_miss(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog()
+    rolled: list[str] = []
+
+    def fake_roll_damage(self, expression: str, **__: object) -> int:
+        rolled.append(expression)
+        return 6
+
+    monkeypatch.setattr(DungeonCog, "_roll_damage", fake_roll_damage)
+    monster = CombatantState(
+        identifier="monster:1",
+        name="Wolf",
+        initiative_roll=5,
+        initiative_total=5,
+        max_hp=11,
+        current_hp=11,
+        is_player=False,
+    )
+    attack, damage_expr, extra_dice = cog._monster_attack_profile(
+        monster,
+        {"name": "Bite", "attack_bonus": 4, "damage": "2d4+2", "critical_extra_dice": ["1d6"]},
+    )
+    traits = {"resistances": (), "vulnerabilities": (), "immunities": ()}
+
+    monkeypatch.setattr(combat_utils, "roll_d20", lambda rng=None: 2)
+    roll, damage = cog._roll_monster_swing(attack, damage_expr, extra_dice, 12, rng=None, **traits)
+    assert not roll.hits and damage == 0
+    assert rolled == []
+
+    monkeypatch.setattr(combat_utils, "roll_d20", lambda rng=None: 20)
+    roll, damage = cog._roll_monster_swing(attack, damage_expr, extra_dice, 12, rng=None, **traits)
+    assert roll.is_critical_hit
+    assert damage == 6 * 2 + 6
+    assert rolled == ["2d4+2", "1d6"]
+
+
+def test_monster_swing_resists_extra_dice_as_one_total(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog()
+    monkeypatch.setattr(DungeonCog, "_roll_damage", lambda self, *_, **__: 3)
+    monkeypatch.setattr(combat_utils, "roll_d20", lambda rng=None: 15)
+    monster = CombatantState(
+        identifier="monster:1",
+        name="Hound",
+        initiative_roll=5,
+        initiative_total=5,
+        max_hp=11,
+        current_hp=11,
+        is_player=False,
+    )
+    attack, damage_expr, extra_dice = cog._monster_attack_profile(
+        monster,
+        {"damage": "1d6", "damage_type": "fire", "critical_extra_dice": ["1d4", "1d4"]},
+    )
+
+    _, damage = cog._roll_monster_swing(
+        attack,
+        damage_expr,
+        extra_dice,
+        10,
+        rng=None,
+        resistances=frozenset({"fire"}),
+        vulnerabilities=frozenset(),
+        immunities=frozenset(),
+    )
+
+    # Base 3 halves to 1; the extra dice total 6 and halve to 3.
+    assert damage == 1 + 3
+
+
+def test_monster_swing_rolls_with_attack_disadvantage(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog()
+    rolls = iter([18, 3])
+    monkeypatch.setattr(combat_utils, "roll_d20", lambda rng=None: next(rolls))
+    monkeypatch.setattr(DungeonCog, "_roll_damage", lambda self, *_, **__: 5)
+    attack = combat_utils.Attack(
+        name="Bite",
+        attack_bonus=4,
+        damage_packets=(combat_utils.DamagePacket(amount=0, damage_type="piercing"),),
+        disadvantage_sources=("blinded",),
+    )
+
+    roll, damage = cog._roll_monster_swing(
+        attack,
+        "1d6",
+        (),
+        12,
+        rng=None,
+        resistances=frozenset(),
+        vulnerabilities=frozenset(),
+        immunities=frozenset(),
+    )
+
+    assert (roll.natural, roll.hits) == (3, False)
+    assert damage == 0
+
+
+def test_monster_damage_against_downed_target_is_critical(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cog = _make_cog()
+    applied: list[tuple[int, bool]] = []
+
+    def fake_apply(self, session, combatant, amount, *, critical=False, source="other"):
+        applied.append((amount, critical))
+        return amount
+
+    monkeypatch.setattr(DungeonCog, "_apply_damage_to_combatant", fake_apply)
+    target = CombatantState(
+        identifier="player:1",
+        name="Ally",
+        initiative_roll=5,
+        initiative_total=5,
+        max_hp=12,
+        current_hp=4,
+        is_player=True,
+        user_id=1,
+    )
+
+    assert cog._deal_monster_damage(None, target, 0) == 0
+    assert cog._deal_monster_damage(None, target, 3) == 3
+    target.current_hp = 0
+    assert cog._deal_monster_damage(None, target, 2) == 2
+    assert applied == [(3, False), (2, True)]
+
+
+def test_player_attack_options_are_typed_once() -> None:
+    cog = _make_cog()
+    player = CombatantState(
+        identifier="player:1",
+        name="Hero",
+        initiative_roll=10,
+        initiative_total=10,
+        max_hp=10,
+        current_hp=10,
+        is_player=True,
+        user_id=1,
+        metadata={
+            "attack_bonus": 4,
+            "damage": "1d6+2",
+            "combat_options": {
+                "weapons": [
+                    {"name": "Longsword", "attack_bonus": "5", "damage": "1d8+3"},
+                    {"name": "Dagger", "critical_extra_dice": ["1d4"]},
+                ]
+            },
+        },
+    )
+
+    base, options = cog._player_attack_options(player)
+
+    assert base == AttackOption(name="weapon", attack_bonus=4, damage="1d6+2")
+    assert options == (
+        AttackOption(name="Longsword", attack_bonus=5, damage="1d8+3"),
+        AttackOption(
+            name="Dagger", attack_bonus=4, damage="1d6+2", critical_extra_dice=("1d4",)
+        ),
+    )
+    assert cog._player_attack_options(player)[1] is options
+
+
+def test_proficiency_keys_lowercase_both_sources_once() -> None:
+    keys = _proficiency_keys(("Simple Weapons",), ("Longswords", "simple weapons"))
+
+    assert keys == frozenset({"simple weapons", "longswords"})
+    assert _proficiency_keys(("Simple Weapons",), ("Longswords", "simple weapons")) is keys
+
+
+def test_weapon_attack_options_are_ranked_and_returned_as_fresh_copies() -> None:
+    cog = _make_cog()
+    character = SimpleNamespace(
+        proficiencies=("Simple Weapons",),
+        character_class=SimpleNamespace(weapon_proficiencies=("Longswords",)),
+    )
+    scores = {"STR": 16, "DEX": 12}
+
+    options, warnings = cog._weapon_attack_options(
+        character, ["dagger", "longsword", "longbow"], scores
+    )
+
+    assert [option["name"] for option in options] == ["Longsword", "Dagger", "Longbow"]
+    assert options[0]["damage"] == "1d8+3"
+    assert warnings == ["Not proficient with Longbow—attacks will suffer."]
+
+    options[0]["attack_bonus"] = 99
+    again, _ = cog._weapon_attack_options(character, ["dagger", "longsword", "longbow"], scores)
+    assert again[0]["attack_bonus"] == 5
+
+    unarmed, unarmed_warnings = cog._weapon_attack_options(character, [], {"DEX": 14})
+    assert unarmed[0]["name"] == "Unarmed Strike"
+    assert unarmed[0]["damage"] == "1d4+2"
+    assert unarmed_warnings == ["No weapon found—defaulting to an unarmed strike."]
@@ -1,5 +1,6 @@
 import asyncio
 import sys
+from collections import OrderedDict
 from pathlib import Path
 from types import SimpleNamespace
 
@@ -101,6 +102,9 @@ def _make_cog(monkeypatch: pytest.MonkeyPatch) -> DungeonCog:
     cog = DungeonCog.__new__(DungeonCog)
     cog.sessions = SessionManager()
     cog.bot = SimpleNamespace(add_view=lambda *args, **kwargs: None, get_user=lambda _uid: None)
+    cog._party_character_cache = OrderedDict()
+    cog.characters = SimpleNamespace(generation=0)
+    cog._pending_refresh = {}
     async def noop_refresh(_interaction, _session) -> None:
         return None
     async def noop_membership_change(_guild_id, _session) -> None:
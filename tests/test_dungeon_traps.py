@@ -58,6 +58,7 @@ def _make_cog(monkeypatch: pytest.MonkeyPatch) -> DungeonCog:
     cog = DungeonCog.__new__(DungeonCog)
     cog.sessions = SessionManager()
     cog.bot = SimpleNamespace(add_view=lambda *args, **kwargs: None, get_user=lambda _uid: None)
+    cog._pending_refresh = {}
 
     async def noop_refresh(_interaction, _session) -> None:
         return None
@@ -329,7 +330,7 @@ def test_failed_disarm_triggers_damage(monkeypatch: pytest.MonkeyPatch) -> None:
     room_id = session.room.id
     trap_key = "pit"
     assert session.trap_states[room_id][trap_key] == "sprung"
-    assert not session.room.encounter.traps
+    assert not list(cog._active_traps(session, session.room))
     assert interaction.followup.sent_messages
     last_message = interaction.followup.sent_messages[-1]
     assert "sprung" in last_message
@@ -465,12 +466,110 @@ def test_successful_detection_and_disarm_updates_state(monkeypatch: pytest.Monke
 
     room_id = session.room.id
     assert session.trap_states[room_id][trap_key] == "disarmed"
-    assert not session.room.encounter.traps
+    assert session.traps_disarmed == 1
+    assert not list(cog._active_traps(session, session.room))
     assert interaction.followup.sent_messages
     assert "uncover" in interaction.followup.sent_messages[0]
     assert "disarm" in interaction.followup.sent_messages[-1]
 
 
+def test_disarmable_queue_follows_trap_status(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog(monkeypatch)
+    spikes = Trap(
+        key="spikes",
+        name="Spike Plate",
+        description="Spikes burst from the floor.",
+        saving_throw={"ability": "DEX", "dc": 12},
+        damage="1d6 piercing",
+    )
+    darts = Trap(
+        key="darts",
+        name="Dart Volley",
+        description="Darts fire from the walls.",
+        saving_throw={"ability": "DEX", "dc": 14},
+        damage="1d4 piercing",
+    )
+    session = _make_trap_session(traps=(spikes, darts))
+    room_id = session.room.id
+    cog._ensure_room_trap_state(session, session.room)
+
+    cog._set_trap_status(session, room_id, "darts", "discovered")
+    cog._set_trap_status(session, room_id, "spikes", "discovered")
+    cog._set_trap_status(session, room_id, "darts", "discovered")
+    assert list(session.disarmable_queue[room_id]) == ["darts", "spikes"]
+
+    interaction = DummyInteraction()
+    key = cog._session_key(interaction.guild_id, interaction.channel_id)
+
+    async def runner() -> None:
+        await cog.sessions.set(key, session)
+        monkeypatch.setattr(
+            dungeon_module,
+            "saving_throw",
+            lambda *_, **__: SavingThrowResult(total=19, roll=19, natural=19, success=True),
+        )
+        await cog.handle_disarm(interaction)
+
+    asyncio.run(runner())
+
+    assert session.trap_states[room_id]["darts"] == "disarmed"
+    assert session.trap_states[room_id]["spikes"] == "discovered"
+    assert list(session.disarmable_queue[room_id]) == ["spikes"]
+    assert "Dart Volley" in interaction.followup.sent_messages[-1]
+
+
+def test_disarm_without_revealed_trap_skips_defer(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog(monkeypatch)
+    session = _make_trap_session()
+    interaction = DummyInteraction()
+    key = cog._session_key(interaction.guild_id, interaction.channel_id)
+    deferred: list[bool] = []
+
+    async def fail_defer(*_args, **_kwargs) -> None:
+        deferred.append(True)
+
+    interaction.response.defer = fail_defer  # type: ignore[assignment]
+
+    async def runner() -> None:
+        await cog.sessions.set(key, session)
+        await cog.handle_disarm(interaction)
+
+    asyncio.run(runner())
+
+    assert not deferred
+    assert interaction.response.is_done()
+    assert not interaction.followup.sent_messages
+
+
+def test_discovered_traps_swap_snapshot_only_on_change(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    cog = _make_cog(monkeypatch)
+    trap = Trap(
+        key="spikes",
+        name="Spike Plate",
+        description="Spikes burst from the floor.",
+        saving_throw={"ability": "DEX", "dc": 12},
+        damage="1d6 piercing",
+    )
+    session = _make_trap_session(traps=(trap,))
+    room_id = session.room.id
+    cog._ensure_room_trap_state(session, session.room)
+    cog._ensure_room_discovery_state(session, session.room)
+
+    cog._set_trap_status(session, room_id, "spikes", "discovered")
+    snapshot = session.discovered_traps[room_id]
+    assert isinstance(snapshot, frozenset)
+    assert snapshot == {"spikes"}
+
+    cog._set_trap_status(session, room_id, "spikes", "sprung")
+    assert session.discovered_traps[room_id] is snapshot
+
+    cog._set_trap_status(session, room_id, "spikes", "hidden")
+    assert session.discovered_traps[room_id] == frozenset()
+    assert snapshot == {"spikes"}
+
+
 def test_loot_hidden_until_discovered(monkeypatch: pytest.MonkeyPatch) -> None:
     loot_item = Item(key="amulet", name="Jeweled Amulet", rarity="Rare")
     cog = _make_cog(monkeypatch)
@@ -787,3 +886,369 @@ def test_trap_death_triggers_announcement(monkeypatch: pytest.MonkeyPatch) -> No
     assert any("slain" in line for line in lines)
     assert user_id in session.fallen_players
     assert announced, "Death announcements should be triggered"
+
+
+def test_trap_trigger_rolls_before_touching_session(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog(monkeypatch)
+    session = _make_trap_session(user_id=10)
+    session.party_ids.add(20)
+    trap = session.room.encounter.traps[0]
+    session.party_health[10] = {"current": 12, "max": 12}
+    session.party_health[20] = {"current": 12, "max": 12}
+    outcomes = iter((True, False))
+
+    monkeypatch.setattr(
+        dungeon_module,
+        "saving_throw",
+        lambda *_, **__: SavingThrowResult(
+            total=10, roll=10, natural=10, success=next(outcomes)
+        ),
+    )
+    monkeypatch.setattr(
+        DungeonCog,
+        "_roll_damage",
+        lambda self, expression, *, critical=False, extra_dice=None: 6,
+    )
+
+    trigger = cog._compute_trap_trigger(trap, (10, 20), {})
+
+    assert [save.success for save in trigger.saves] == [True, False]
+    assert trigger.damage_amount == 6
+    assert session.traps_triggered == 0
+    assert session.party_health[10]["current"] == 12
+
+    lines, deaths = cog._apply_trap_trigger_batch(session, trigger)
+
+    assert not deaths
+    assert session.traps_triggered == 1
+    assert session.party_health[10]["current"] == 9
+    assert session.party_health[20]["current"] == 6
+    assert len([line for line in lines if line.startswith("•")]) == 2
+
+
+def test_party_snapshot_tracks_membership_changes() -> None:
+    session = _make_trap_session(user_id=30)
+    first = session.party_snapshot()
+    assert first == (30,)
+    assert session.party_snapshot() is first
+
+    assert session.add_party_member(10)
+    assert not session.add_party_member(10)
+    assert session.party_snapshot() == (10, 30)
+
+    assert session.remove_party_member(30)
+    assert not session.remove_party_member(30)
+    assert session.party_snapshot() == (10,)
+
+
+def test_scheduled_refreshes_are_debounced(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog(monkeypatch)
+    session = _make_trap_session()
+    interaction = DummyInteraction()
+    key = cog._session_key(session.guild_id, session.channel_id)
+    refreshed: list[DungeonSession] = []
+
+    async def record_refresh(_interaction, target_session) -> None:
+        refreshed.append(target_session)
+
+    cog._refresh_session_message = record_refresh  # type: ignore[assignment]
+
+    async def runner() -> None:
+        await cog.sessions.set(key, session)
+        cog._schedule_refresh(interaction, session)
+        cog._schedule_refresh(interaction, session)
+        cog._schedule_refresh(interaction, session)
+        await asyncio.sleep(dungeon_module.REFRESH_DEBOUNCE_SECONDS * 4)
+
+    asyncio.run(runner())
+
+    assert refreshed == [session]
+    assert not cog._pending_refresh
+
+
+def test_cog_unload_cancels_pending_refreshes(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog(monkeypatch)
+    cog.bot.tree = SimpleNamespace(remove_command=lambda *_args, **_kwargs: None)
+    session = _make_trap_session()
+    interaction = DummyInteraction()
+    refreshed: list[DungeonSession] = []
+
+    async def record_refresh(_interaction, target_session) -> None:
+        refreshed.append(target_session)
+
+    cog._refresh_session_message = record_refresh  # type: ignore[assignment]
+
+    async def runner() -> None:
+        key = cog._session_key(session.guild_id, session.channel_id)
+        await cog.sessions.set(key, session)
+        cog._schedule_refresh(interaction, session)
+        task = cog._pending_refresh[key]
+        cog.cog_unload()
+        await asyncio.sleep(dungeon_module.REFRESH_DEBOUNCE_SECONDS * 4)
+        assert task.cancelled()
+
+    asyncio.run(runner())
+
+    assert refreshed == []
+    assert not cog._pending_refresh
+
+
+def test_interaction_session_key_bound_per_task(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog(monkeypatch)
+    calls: list[tuple[object, object]] = []
+    original = cog._session_key
+
+    def counting_key(guild_id, channel_id):
+        calls.append((guild_id, channel_id))
+        return original(guild_id, channel_id)
+
+    cog._session_key = counting_key  # type: ignore[assignment]
+    first = DummyInteraction(channel_id=5)
+    second = DummyInteraction(channel_id=6)
+
+    async def runner() -> tuple[object, ...]:
+        return (
+            cog._interaction_session_key(first),
+            cog._interaction_session_key(first),
+            cog._interaction_session_key(second),
+        )
+
+    keys = asyncio.run(runner())
+
+    assert keys == ((None, 5), (None, 5), (None, 6))
+    assert calls == [(None, 5), (None, 6)]
+
+
+def test_trap_normalises_saving_throw_once() -> None:
+    trap = Trap.from_mapping(
+        "Spikes",
+        {"name": "Spike Plate", "saving_throw": {"ability": "dex", "dc": "13"}},
+    )
+    assert trap.save_ability == "DEX"
+    assert trap.save_dc == 13
+
+    unset = Trap(key="pit", name="Pit", description="", saving_throw={"dc": "high"})
+    assert unset.save_ability is None
+    assert unset.save_dc is None
+
+
+def test_navigation_buttons_route_to_cog_handlers(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog(monkeypatch)
+    session = _make_trap_session()
+    session.discovered_exits[session.room.id] = {"forward"}
+    calls: list[tuple[str, tuple[object, ...]]] = []
+
+    def _recorder(name: str):
+        async def _handler(_interaction, *args) -> None:
+            calls.append((name, args))
+
+        return _handler
+
+    for name in ("handle_search", "handle_perception", "handle_exit"):
+        monkeypatch.setattr(cog, name, _recorder(name), raising=False)
+
+    async def runner() -> None:
+        view = dungeon_module.DungeonNavigationView(cog, session)
+        by_id = {getattr(item, "custom_id", None): item for item in view.children}
+        await by_id["dungeon:search"].callback(DummyInteraction())
+        await by_id["dungeon:perception"].callback(DummyInteraction())
+        await by_id[f"dungeon:exit:{session.channel_id}:forward"].callback(DummyInteraction())
+
+    asyncio.run(runner())
+
+    assert calls == [
+        ("handle_search", ()),
+        ("handle_perception", ()),
+        ("handle_exit", ("forward",)),
+    ]
+
+
+def test_party_display_resolves_members_then_users(monkeypatch: pytest.MonkeyPatch) -> None:
+    cog = _make_cog(monkeypatch)
+    session = _make_trap_session()
+    session.party_ids.clear()
+    for user_id in (30, 10, 20):
+        session.add_party_member(user_id)
+    session.party_health[10] = {"current": 4, "max": 12}
+    members = {10: SimpleNamespace(display_name="Member Ten")}
+    users = {20: SimpleNamespace(display_name="User Twenty")}
+    user_lookups: list[int] = []
+
+    def get_user(user_id: int):
+        user_lookups.append(user_id)
+        return users.get(user_id)
+
+    guild = SimpleNamespace(get_member=members.get)
+    cog.bot = SimpleNamespace(get_user=get_user, get_guild=lambda _guild_id: guild)
+    interaction = SimpleNamespace(guild=guild)
+
+    display = cog._party_display(interaction, session)
+
+    assert display.splitlines() == [
+        "• Member Ten [4/12]",
+        f"• User Twenty [{dungeon_module.DEFAULT_PLAYER_HP}/{dungeon_module.DEFAULT_PLAYER_HP}]",
+        f"• <@30> [{dungeon_module.DEFAULT_PLAYER_HP}/{dungeon_module.DEFAULT_PLAYER_HP}]",
+    ]
+    # Members resolve from the guild without touching the user cache.
+    assert user_lookups == [20, 30]
+
+
+def test_party_channel_access_sync_uses_single_edit(monkeypatch: pytest.MonkeyPatch) -> None:
+    import discord
+
+    class DummyMember:
+        def __init__(self, member_id: int, *, manager: bool = False) -> None:
+            self.id = member_id
+            self.guild_permissions = SimpleNamespace(manage_channels=manager)
+
+        def __hash__(self) -> int:
+            return self.id
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, DummyMember) and other.id == self.id
+
+    class DummyRole:
+        id = 321
+
+    default_role = DummyRole()
+    joining = DummyMember(1)
+    stale = DummyMember(2)
+    moderator = DummyMember(3, manager=True)
+
+    class DummyChannel:
+        def __init__(self) -> None:
+            self.overwrites = {
+                stale: discord.PermissionOverwrite(view_channel=True),
+                moderator: discord.PermissionOverwrite(view_channel=True),
+            }
+            self.id = 654
+            self.edits: list[dict[str, object]] = []
+
+        async def edit(self, **kwargs: object) -> None:
+            self.edits.append(kwargs)
+            self.overwrites = dict(kwargs["overwrites"])  # type: ignore[arg-type]
+
+    channel = DummyChannel()
+    guild = SimpleNamespace(
+        id=321,
+        default_role=default_role,
+        get_channel=lambda _channel_id: channel,
+        get_member=lambda member_id: joining if member_id == 1 else None,
+    )
+
+    monkeypatch.setattr(discord, "Member", DummyMember)
+    monkeypatch.setattr(discord, "TextChannel", DummyChannel)
+
+    cog = DungeonCog.__new__(DungeonCog)
+    cog.bot = SimpleNamespace(get_guild=lambda _guild_id: guild)
+    cog._party_access_signatures = {}
+    session = SimpleNamespace(guild_id=321, channel_id=654, party_ids={1})
+
+    asyncio.run(cog._sync_party_channel_access(session))
+
+    assert len(channel.edits) == 1
+    overwrites = channel.overwrites
+    assert overwrites[default_role].view_channel is False
+    assert overwrites[joining].send_messages is True
+    assert stale not in overwrites
+    assert moderator in overwrites
+
+    looked_up: list[int] = []
+    guild.get_member = lambda member_id: looked_up.append(member_id) or joining
+    asyncio.run(cog._sync_party_channel_access(session))
+    assert len(channel.edits) == 1
+    assert looked_up == []
+
+    asyncio.run(cog._clear_party_channel_access(session))
+    assert len(channel.edits) == 2
+    assert set(channel.overwrites) == {default_role, moderator}
+
+
+def test_party_channel_access_retries_members_that_failed_to_resolve(
+    monkeypatch: pytest.MonkeyPatch,
+) -> None:
+    import discord
+
+    class DummyMember:
+        def __init__(self, member_id: int) -> None:
+            self.id = member_id
+            self.guild_permissions = SimpleNamespace(manage_channels=False)
+
+        def __hash__(self) -> int:
+            return self.id
+
+        def __eq__(self, other: object) -> bool:
+            return isinstance(other, DummyMember) and other.id == self.id
+
+    class DummyRole:
+        id = 321
+
+    class FetchFailed(discord.HTTPException):
+        def __init__(self) -> None:
+            pass
+
+    default_role = DummyRole()
+    present = DummyMember(1)
+    late = DummyMember(2)
+
+    class DummyChannel:
+        def __init__(self) -> None:
+            self.overwrites: dict[object, discord.PermissionOverwrite] = {}
+            self.id = 654
+            self.edits: list[dict[str, object]] = []
+
+        async def edit(self, **kwargs: object) -> None:
+            self.edits.append(kwargs)
+            self.overwrites = dict(kwargs["overwrites"])  # type: ignore[arg-type]
+
+    fetch_attempts: list[int] = []
+
+    async def fetch_member(member_id: int) -> DummyMember:
+        fetch_attempts.append(member_id)
+        if len(fetch_attempts) == 1:
+            raise FetchFailed()
+        return late
+
+    channel = DummyChannel()
+    guild = SimpleNamespace(
+        id=321,
+        default_role=default_role,
+        get_channel=lambda _channel_id: channel,
+        get_member=lambda member_id: present if member_id == 1 else None,
+        fetch_member=fetch_member,
+    )
+
+    monkeypatch.setattr(discord, "Member", DummyMember)
+    monkeypatch.setattr(discord, "TextChannel", DummyChannel)
+
+    cog = DungeonCog.__new__(DungeonCog)
+    cog.bot = SimpleNamespace(get_guild=lambda _guild_id: guild)
+    cog._party_access_signatures = {}
+    session = SimpleNamespace(guild_id=321, channel_id=654, party_ids={1, 2})
+
+    asyncio.run(cog._sync_party_channel_access(session))
+    assert len(channel.edits) == 1
+    assert late not in channel.overwrites
+    assert channel.id not in cog._party_access_signatures
+
+    asyncio.run(cog._sync_party_channel_access(session))
+    assert fetch_attempts == [2, 2]
+    assert len(channel.edits) == 2
+    assert channel.overwrites[late].send_messages is True
+    assert channel.id in cog._party_access_signatures
+
+    asyncio.run(cog._sync_party_channel_access(session))
+    assert fetch_attempts == [2, 2]
+    assert len(channel.edits) == 2
+
+
+def test_party_channel_access_signature_dropped_when_channel_is_gone() -> None:
+    cog = DungeonCog.__new__(DungeonCog)
+    guild = SimpleNamespace(get_channel=lambda _channel_id: None)
+    cog.bot = SimpleNamespace(get_guild=lambda _guild_id: guild)
+    cog._party_access_signatures = {654: (frozenset({1}), ())}
+    session = SimpleNamespace(guild_id=321, channel_id=654, party_ids={1})
+
+    asyncio.run(cog._clear_party_channel_access(session))
+
+    assert cog._party_access_signatures == {}
@@ -0,0 +1,123 @@
+import asyncio
+import sys
+from collections import OrderedDict
+from dataclasses import replace
+from pathlib import Path
+from types import SimpleNamespace
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from cogs import dungeon as dungeon_module
+from cogs.dungeon import DungeonCog
+from dnd import AbilityScores, Character, CharacterRepository
+from dnd.dungeon.rewards import RewardShare
+
+
+def _make_cog() -> tuple[DungeonCog, list[tuple[int, tuple[int, ...]]]]:
+    cog = DungeonCog.__new__(DungeonCog)
+    cog._party_character_cache = OrderedDict()
+    cog.characters = SimpleNamespace(generation=0)
+    calls: list[tuple[int, tuple[int, ...]]] = []
+
+    async def fake_load(guild_id, party_ids):
+        calls.append((guild_id, tuple(party_ids)))
+        return {user_id: SimpleNamespace(user_id=user_id) for user_id in party_ids}
+
+    cog._load_party_characters = fake_load  # type: ignore[assignment]
+    return cog, calls
+
+
+def test_cached_party_characters_reused_until_version_or_generation_changes() -> None:
+    cog, calls = _make_cog()
+
+    async def runner() -> None:
+        first = await cog._load_party_characters_cached(1, (10, 20), 0)
+        second = await cog._load_party_characters_cached(1, (10, 20), 0)
+        assert first is second
+        assert len(calls) == 1
+
+        third = await cog._load_party_characters_cached(1, (10, 20), 1)
+        assert third is not first
+        assert len(calls) == 2
+
+        cog.characters.generation += 1
+        fourth = await cog._load_party_characters_cached(1, (10, 20), 1)
+        assert fourth is not third
+        assert len(calls) == 3
+
+    asyncio.run(runner())
+
+
+def test_cached_party_characters_are_bounded_and_forgettable(monkeypatch) -> None:
+    cog, calls = _make_cog()
+    monkeypatch.setattr(dungeon_module, "PARTY_CHARACTER_CACHE_SIZE", 2)
+
+    async def runner() -> None:
+        await cog._load_party_characters_cached(1, (10,), 0)
+        await cog._load_party_characters_cached(1, (20,), 0)
+        await cog._load_party_characters_cached(1, (30,), 0)
+        assert list(cog._party_character_cache) == [(1, (20,)), (1, (30,))]
+
+        cog._forget_cached_character(1, 30)
+        assert list(cog._party_character_cache) == [(1, (20,))]
+        await cog._load_party_characters_cached(1, (30,), 0)
+        assert calls[-1] == (1, (30,))
+
+    asyncio.run(runner())
+
+
+def _make_character() -> Character:
+    scores = AbilityScores.from_assignments(
+        {"STR": 15, "DEX": 14, "CON": 13, "INT": 12, "WIS": 10, "CHA": 8},
+        method="standard_array",
+    )
+    return Character(
+        guild_id=1,
+        user_id=10,
+        race_key="human",
+        class_key="fighter",
+        background_key=None,
+        ability_method="standard_array",
+        base_ability_scores=scores,
+        ability_scores=scores,
+        racial_bonuses={},
+        proficiencies=(),
+        inventory=(),
+        gold_coins=50,
+        name="Hero",
+    )
+
+
+def test_reward_payouts_keep_saves_made_between_them(tmp_path) -> None:
+    repo = CharacterRepository(tmp_path / "characters.json")
+    cog = DungeonCog.__new__(DungeonCog)
+    cog._party_character_cache = OrderedDict()
+    cog.characters = repo
+
+    async def runner() -> None:
+        await repo.save(_make_character())
+        snapshot = await cog._load_party_characters_cached(1, (10,), 0)
+        await cog._apply_reward_shares(1, snapshot, [RewardShare(user_id=10, items=(), gold=10)])
+
+        # A shop purchase saves a newer copy while the party is still exploring.
+        stored = await repo.get(1, 10)
+        await repo.save(replace(stored, gold_coins=stored.gold_coins - 30, inventory=("Rope",)))
+
+        fresh = await cog._load_party_characters_cached(1, (10,), 0)
+        assert fresh[10].inventory == ("Rope",)
+        await cog._apply_reward_shares(1, snapshot, [RewardShare(user_id=10, items=(), gold=5)])
+        stored = await repo.get(1, 10)
+        assert (stored.gold_coins, stored.inventory) == (35, ("Rope",))
+
+        # A character deleted mid-run is not brought back by a later payout.
+        await repo.clear(1, 10)
+        lines = await cog._apply_reward_shares(
+            1, snapshot, [RewardShare(user_id=10, items=(), gold=5)]
+        )
+        assert lines[2] == (0, 0)
+        assert await repo.get(1, 10) is None
+        assert 10 not in snapshot
+
+    asyncio.run(runner())
@@ -3,10 +3,12 @@ from dnd.dungeon.rewards import (
     RewardShare,
     allocate_loot,
     eligible_order,
+    eligible_order_cached,
     format_item_label,
     loot_value,
     rotate_party,
     split_gold,
+    split_gold_cached,
     trap_reward_value,
 )
 
@@ -76,3 +78,13 @@ def test_trap_reward_value_scales_with_dc_and_damage() -> None:
     easy_trap = make_trap("Snare", 12)
     hard_trap = make_trap("Obliterator", 17, damage="6d6 fire")
     assert trap_reward_value(hard_trap, 17) > trap_reward_value(easy_trap, 12)
+
+
+def test_cached_reward_helpers_match_uncached_results() -> None:
+    order = eligible_order_cached((10, 20, 30, 40), 1, frozenset({10, 30}))
+    assert order == (30, 10)
+    assert eligible_order_cached((10, 20, 30, 40), 1, frozenset({30, 10})) is order
+
+    shares = split_gold_cached(7, order)
+    assert shares == tuple(split_gold(7, list(order)))
+    assert split_gold_cached(7, order) is shares
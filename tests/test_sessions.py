@@ -0,0 +1,50 @@
+import asyncio
+import sys
+from pathlib import Path
+
+ROOT = Path(__file__).resolve().parents[1]
+if str(ROOT) not in sys.path:
+    sys.path.insert(0, str(ROOT))
+
+from dnd.sessions import SessionManager
+
+
+def test_update_with_result_returns_mutator_result() -> None:
+    async def runner() -> None:
+        manager: SessionManager[list[int]] = SessionManager()
+        key = SessionManager.make_key(1, 2)
+
+        assert await manager.update_with_result(key, len) == (None, None)
+
+        stored = await manager.set(key, [1, 2])
+
+        def append_and_count(values: list[int]) -> int:
+            values.append(3)
+            return len(values)
+
+        session, result = await manager.update_with_result(key, append_and_count)
+        assert session is stored
+        assert result == 3
+        assert stored == [1, 2, 3]
+
+    asyncio.run(runner())
+
+
+def test_channels_for_guild_tracks_set_pop_and_clear() -> None:
+    async def runner() -> None:
+        manager: SessionManager[str] = SessionManager()
+        await manager.set(SessionManager.make_key(1, 10), "a")
+        await manager.set(SessionManager.make_key(1, 11), "b")
+        await manager.set(SessionManager.make_key(2, 20), "c")
+
+        assert await manager.channels_for_guild(1) == {10, 11}
+        assert await manager.channels_for_guild(3) == frozenset()
+
+        assert await manager.pop(SessionManager.make_key(1, 10)) == "a"
+        assert await manager.channels_for_guild(1) == {11}
+
+        assert await manager.clear_guild(1) == 1
+        assert await manager.channels_for_guild(1) == frozenset()
+        assert await manager.keys() == ((2, 20),)
+
+    asyncio.run(runner())
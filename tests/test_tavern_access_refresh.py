@@ -4,6 +4,7 @@ from __future__ import annotations
 
 import asyncio
 import sys
+from collections import OrderedDict
 from types import SimpleNamespace
 from pathlib import Path
 
@@ -102,6 +103,7 @@ def test_dungeon_death_refreshes_tavern_access() -> None:
     cog = dungeon.DungeonCog.__new__(dungeon.DungeonCog)
     cog.bot = DummyBot()
     cog.characters = characters
+    cog._party_character_cache = OrderedDict()
     cog._build_player_death_embed = lambda *args, **kwargs: object()
 
     async def fake_update(guild_id: int) -> None:
@@ -152,3 +154,19 @@ def test_dungeon_death_refreshes_tavern_access() -> None:
     assert characters.cleared == [(321, 999)]
     assert update_calls == [321]
     assert channel.sent  # ensures the announcement attempted delivery
+
+
+def test_dungeon_cog_unload_forgets_resolved_tavern_class() -> None:
+    removed: list[str] = []
+    cog = dungeon.DungeonCog.__new__(dungeon.DungeonCog)
+    cog.bot = SimpleNamespace(
+        tree=SimpleNamespace(remove_command=lambda name, **_: removed.append(name))
+    )
+
+    dungeon._tavern_cog_class()
+    assert dungeon._tavern_cog_class.cache_info().currsize == 1
+
+    cog.cog_unload()
+
+    assert removed == [cog.dungeon_group.name]
+    assert dungeon._tavern_cog_class.cache_info().currsize == 0